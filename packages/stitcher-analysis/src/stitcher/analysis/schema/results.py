@@ -44,6 +44,13 @@ class FileCheckResult:
     )
 
     # --- Computed Properties ---
+    def severity(self, violation: Violation) -> str:
+        if violation.kind in self._ERROR_KINDS:
+            return "error"
+        if violation.kind in self._WARNING_KINDS:
+            return "warning"
+        return "info"
+
     @property
     def error_violations(self) -> List[Violation]:
         return [v for v in self.violations if v.kind in self._ERROR_KINDS]
@@ -1,5 +1,7 @@
-from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+import sys
+from contextlib import ExitStack, contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, List, Optional, Set, Tuple, Dict, Any
 
 from stitcher.common.bus import bus
 from needle.pointer import L
@@ -10,7 +12,11 @@ from stitcher.spec import (
     ModuleDef,
 )
 from stitcher.stubgen import StubgenService
-from stitcher.workspace import load_config_from_path, StitcherConfig
+from stitcher.workspace import (
+    load_config_from_path,
+    load_index_config,
+    StitcherConfig,
+)
 from stitcher.services import (
     ScannerService,
 )
@@ -18,23 +24,30 @@ from stitcher.lang.sidecar import DocumentManager, DocstringMerger
 from stitcher.common.services import Differ
 from stitcher.spec.interaction import InteractionHandler
 from .runners.check.runner import CheckRunner
+from .runners.check.parallel import ParallelCheckAnalyzer
+from .runners.check.result_cache import CheckResultCache
+from .runners.check.result_writers import create_result_writer
+from .runners.check.analyzer import ANALYZE_BATCH_SIZE
 from .runners.pump.runner import PumpRunner
 from .runners.transform import TransformRunner
 from .runners.coverage import CoverageRunner
 from .runners.refactor import RefactorRunner
 from .runners.index import IndexRunner
-from .runners.check.resolver import CheckResolver
+from .runners.check.resolver import CheckResolver, DocsByPath
 from .runners.check.reporter import CheckReporter
 from .runners.pump.executor import PumpExecutor
+from .services.docstring_styles import DocstringStyleResolver
+from .services.lock_cache import LockCache
 from .services.lock_session import LockSession
 from stitcher.analysis.engines import create_pump_engine, create_architecture_engine
 from stitcher.common.transaction import TransactionManager
 from typing import Callable
-from stitcher.analysis.schema import FileCheckResult
+from stitcher.analysis.schema import FileCheckResult, Violation
 from .types import PumpResult, CoverageResult
 from stitcher.index.db import DatabaseManager
 from stitcher.index.store import IndexStore
 from stitcher.index.indexer import FileIndexer
+from stitcher.index.parse_cache import ParseCache
 from stitcher.lang.python import PythonAdapter
 from stitcher.workspace import Workspace
 from stitcher.lang.python.docstring import (
@@ -45,11 +58,16 @@ from stitcher.spec.interaction import InteractionContext
 from stitcher.spec.protocols import URIGeneratorProtocol
 from stitcher.lang.sidecar import (
     LockFileManager,
+    SidecarCache,
     SidecarIndexerAdapter,
     SidecarURIGenerator,
 )
 from stitcher.lang.python import PythonURIGenerator
 
+# Index meta key holding the digest of the last dependency graph that passed
+# the architecture check.
+_ARCH_GRAPH_META = "check.architecture_graph"
+
 
 class StitcherApp:
     def __init__(
@@ -67,17 +85,48 @@ class StitcherApp:
 
         # 1. Indexing Subsystem (Promoted to Priority 1 initialization)
         index_db_path = root_path / ".stitcher" / "index" / "index.db"
-        self.db_manager = DatabaseManager(index_db_path)
+        index_config = load_index_config(root_path)
+        self.db_manager = DatabaseManager(
+            index_db_path,
+            pragmas=index_config.pragmas,
+            persistent=index_config.persistent_connection,
+        )
         self.db_manager.initialize()
         self.index_store = IndexStore(self.db_manager)
-        self.file_indexer = FileIndexer(root_path, self.index_store)
+        # Local caches share one directory, which git ignores like the index.
+        cache_dir = root_path / ".stitcher" / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_gitignore = cache_dir / ".gitignore"
+        if not cache_gitignore.exists():
+            cache_gitignore.write_text("*\n", encoding="utf-8")
+        parse_cache = None
+        if index_config.parse_cache_mb > 0:
+            parse_cache = ParseCache(
+                cache_dir / "parse",
+                max_bytes=index_config.parse_cache_mb * 1024 * 1024,
+            )
+        self.file_indexer = FileIndexer(
+            root_path,
+            self.index_store,
+            adapter_files_only=True,
+            parse_cache=parse_cache,
+        )
 
         # 2. Core Services
         # DocumentManager now depends on IndexStore
         self.doc_manager = DocumentManager(
-            root_path, self.uri_generator, self.index_store
+            root_path,
+            self.uri_generator,
+            self.index_store,
+            sidecar_cache=(
+                SidecarCache(cache_dir / "sidecars")
+                if index_config.sidecar_cache
+                else None
+            ),
         )
-        self.lock_manager = LockFileManager()
+        # Each stitcher.lock is parsed at most once per command; per-file
+        # lookups are answered from the index's mirror of the locks.
+        self.lock_manager = LockCache(LockFileManager(root_path, self.index_store))
         # self.uri_generator instantiated above
         self.scanner = ScannerService(root_path, parser)
         self.differ = Differ()
@@ -106,7 +155,11 @@ class StitcherApp:
 
         # Sidecar Adapter (NEW)
         sidecar_uri_generator = SidecarURIGenerator()
-        sidecar_adapter = SidecarIndexerAdapter(root_path, sidecar_uri_generator)
+        sidecar_adapter = SidecarIndexerAdapter(
+            root_path,
+            sidecar_uri_generator,
+            style_resolver=DocstringStyleResolver(root_path),
+        )
         # Register for .yaml because FileIndexer uses path.suffix.
         # The adapter itself filters for .stitcher.yaml files.
         self.file_indexer.register_adapter(".yaml", sidecar_adapter)
@@ -135,6 +188,11 @@ class StitcherApp:
             resolver=check_resolver,
             reporter=check_reporter,
             root_path=self.root_path,
+            result_cache=(
+                CheckResultCache(cache_dir / "check.json")
+                if index_config.check_cache
+                else None
+            ),
         )
 
         pump_engine = create_pump_engine(differ=self.differ)
@@ -167,7 +225,16 @@ class StitcherApp:
         self.coverage_runner = CoverageRunner(
             root_path, self.doc_manager, self.index_store
         )
-        self.index_runner = IndexRunner(self.db_manager, self.file_indexer)
+        self.index_runner = IndexRunner(
+            self.db_manager,
+            self.file_indexer,
+            change_detection=index_config.change_detection,
+        )
+        # Stats of the last refresh while a watcher (the index daemon) keeps
+        # the index fresh, see watch_index; None otherwise.
+        self._watched_index_stats: Optional[Dict[str, Any]] = None
+        # Files that failed to index in the last watched refresh.
+        self._index_failures: Set[str] = set()
         self.architecture_engine = create_architecture_engine()
 
         # 6. Refactor Runner (depends on Indexing)
@@ -178,10 +245,61 @@ class StitcherApp:
     def _load_configs(self) -> Tuple[List[StitcherConfig], Optional[str]]:
         return load_config_from_path(self.root_path)
 
+    def _reset_run_caches(self) -> None:
+        # Lock and package-root caches only live for one command, so that a
+        # long-lived app never serves stale locks. A watched app keeps them
+        # and drops what its watcher reports as changed instead.
+        if self._watched_index_stats is not None:
+            return
+        self.lock_manager.clear()
+        self.workspace.clear_caches()
+
+    def _invalidate_run_caches(self, paths: Set[str]) -> None:
+        for rel_path in paths:
+            parent, _, name = rel_path.rpartition("/")
+            if name == LockFileManager.LOCK_FILE_NAME:
+                self.lock_manager.invalidate(self.root_path / parent)
+            elif name == "pyproject.toml":
+                # Package roots may have moved.
+                self.workspace.clear_caches()
+
+    def _failed_paths(self, stats: Dict[str, Any]) -> Set[str]:
+        return {
+            self.workspace.to_workspace_relative(Path(abs_path))
+            for abs_path, _ in stats["error_details"]
+        }
+
     def ensure_index_fresh(self) -> Dict[str, Any]:
+        stats = self._watched_index_stats
+        if stats is not None:
+            # Kept fresh by the watcher. Files that failed to index are still
+            # retried, so that their errors are reported to this command.
+            return self.refresh_index_paths(set()) if self._index_failures else stats
         with self.db_manager.session():
             return self.index_runner.run_build(self.workspace)
 
+    def watch_index(self) -> Dict[str, Any]:
+        # For a host that watches the workspace (the index daemon): builds the
+        # index once. From then on commands neither rebuild it nor reset their
+        # caches; the host reports changes through refresh_index_paths.
+        self._watched_index_stats = None
+        self._reset_run_caches()
+        stats = self.ensure_index_fresh()
+        self._index_failures = self._failed_paths(stats)
+        self._watched_index_stats = stats
+        return stats
+
+    def refresh_index_paths(self, paths: Set[str]) -> Dict[str, Any]:
+        # Re-indexes the added, changed or removed `paths` (and the files that
+        # failed last time) and drops the cached data derived from them.
+        paths = set(paths) | self._index_failures
+        with self.db_manager.session():
+            stats = self.index_runner.run_paths(self.workspace, paths)
+        self._index_failures = self._failed_paths(stats)
+        self._watched_index_stats = stats
+        self._invalidate_run_caches(paths)
+        return stats
+
     def _configure_and_scan(self, config: StitcherConfig) -> List[ModuleDef]:
         if config.name != "default":
             bus.info(L.generate.target.processing, name=config.name)
@@ -189,7 +307,7 @@ class StitcherApp:
         # Configure Docstring Strategy
         parser, renderer = get_docstring_codec(config.docstring_style)
         serializer = get_docstring_serializer(config.docstring_style)
-        self.doc_manager.set_strategy(parser, serializer)
+        self.doc_manager.set_strategy(parser, serializer, config.docstring_style)
 
         # Inject renderer into generate runner
         self.stubgen_service.set_renderer(renderer)
@@ -235,80 +353,310 @@ class StitcherApp:
     def run_init(self) -> None:
         self.run_pump(reconcile=True)
 
-    def run_check(self, force_relink: bool = False, reconcile: bool = False) -> bool:
+    def _iter_chunk(
+        self,
+        rel_paths: List[str],
+        plugin_modules: List[ModuleDef],
+        parallel: Optional[ParallelCheckAnalyzer],
+        docs: DocsByPath,
+    ) -> Iterator[Tuple[ModuleDef, FileCheckResult, List[InteractionContext]]]:
+        analyzed = self.check_runner.iter_analyze_paths(
+            rel_paths, parallel, docs_out=docs
+        )
+        for result, conflicts in analyzed:
+            # Lightweight ModuleDefs are enough for post-processing.
+            yield ModuleDef(file_path=result.path), result, conflicts
+
+        if plugin_modules:
+            p_res, p_conflicts = self.check_runner.analyze_batch(
+                plugin_modules, docs_out=docs
+            )
+            for module, result in zip(plugin_modules, p_res):
+                conflicts = [c for c in p_conflicts if c.file_path == result.path]
+                yield module, result, conflicts
+
+    def _check_chunk(
+        self,
+        rel_paths: List[str],
+        plugin_modules: List[ModuleDef],
+        parallel: Optional[ParallelCheckAnalyzer],
+        tm: TransactionManager,
+        force_relink: bool,
+        reconcile: bool,
+        max_errors: Optional[int],
+    ) -> Optional[bool]:
+        # Files are resolved and reported one at a time, so that output streams
+        # and `max_errors` stops the run right after the file reaching it.
+        # Returns None if the user aborted conflict resolution, True if the run
+        # stopped with files of this chunk left unchecked.
+        # Sidecar docs hydrated during analysis, reused for reconciliation.
+        docs: DocsByPath = {}
+        items = self._iter_chunk(rel_paths, plugin_modules, parallel, docs)
+        total = len(rel_paths) + len(plugin_modules)
+
+        interactive = self.check_runner.resolves_interactively
+        if interactive:
+            # The user answers one interactive session for the whole chunk.
+            entries = list(items)
+            results = [result for _, result, _ in entries]
+            self.check_runner.auto_reconcile_docs(
+                results, [module for module, _, _ in entries], docs
+            )
+            if not self.check_runner.resolve_conflicts(
+                results,
+                [c for _, _, conflicts in entries for c in conflicts],
+                tm,
+                force_relink,
+                reconcile,
+                docs_by_path=docs,
+            ):
+                return None
+            items = iter(entries)
+
+        for done, (module, result, conflicts) in enumerate(items, 1):
+            if not interactive:
+                self.check_runner.auto_reconcile_docs([result], [module], docs)
+                if not self.check_runner.resolve_conflicts(
+                    [result],
+                    conflicts,
+                    tm,
+                    force_relink,
+                    reconcile,
+                    docs_by_path=docs,
+                ):
+                    return None
+            self.check_runner.report_files([result])
+            if (
+                max_errors
+                and self.check_runner.reported_error_count >= max_errors
+                and done < total
+            ):
+                return True
+        return False
+
+    def _changed_paths(
+        self, changed_since: Optional[str], files: Optional[Iterable[Path]]
+    ) -> Optional[Set[str]]:
+        # Workspace-relative paths named by `changed_since` and `files`, or
+        # None if git could not report the changes.
+        changed: Set[str] = set()
+        if changed_since is not None:
+            diff = self.workspace.discover_changed_files(changed_since)
+            if diff is None:
+                return None
+            changed.update(diff)
+        for path in files or ():
+            try:
+                changed.add(self.workspace.to_workspace_relative(path))
+            except ValueError:
+                continue  # Outside the workspace.
+        return changed
+
+    @staticmethod
+    def _scope_filter(changed: Set[str]) -> Callable[[str], bool]:
+        # A source file is in scope if it or its sidecar changed. A changed
+        # lock file puts every file of its package in scope.
+        scope: Set[str] = set()
+        lock_prefixes: List[str] = []
+        for path in changed:
+            if path.endswith(".stitcher.yaml"):
+                scope.add(path[: -len(".stitcher.yaml")] + ".py")
+            elif path.endswith(".py"):
+                scope.add(path)
+            elif PurePosixPath(path).name == LockFileManager.LOCK_FILE_NAME:
+                parent = PurePosixPath(path).parent.as_posix()
+                lock_prefixes.append("" if parent == "." else parent + "/")
+
+        def in_scope(rel_path: str) -> bool:
+            return rel_path in scope or any(
+                rel_path.startswith(prefix) for prefix in lock_prefixes
+            )
+
+        return in_scope
+
+    def _check_architecture(self, scoped: bool) -> List[Violation]:
+        # Scoped runs skip the global pass while the dependency graph is the
+        # one that last passed it. The digest is memoized by the index, so it
+        # is only computed again after index writes touched the graph.
+        passed = self.index_store.get_meta(_ARCH_GRAPH_META)
+        if (
+            scoped
+            and passed is not None
+            and passed == self.index_store.get_dependency_graph_digest()
+        ):
+            return []
+        violations = self.architecture_engine.analyze(self.index_store)
+        self.index_store.set_meta(
+            _ARCH_GRAPH_META,
+            None if violations else self.index_store.get_dependency_graph_digest(),
+        )
+        return violations
+
+    @contextmanager
+    def _check_output(
+        self, output_format: Optional[str], output_path: Optional[Path]
+    ) -> Iterator[None]:
+        # Starts the report of a check run. The result writer, if any, is
+        # closed even when the run aborts or raises, so that the output is
+        # always a complete document.
+        if not output_format:
+            self.check_runner.begin_report(None)
+            yield
+            return
+        with ExitStack() as stack:
+            stream = sys.stdout
+            if output_path is not None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                stream = stack.enter_context(open(output_path, "w", encoding="utf-8"))
+            writer = create_result_writer(output_format, stream)
+            self.check_runner.begin_report(writer)
+            try:
+                yield
+            finally:
+                writer.close(self.check_runner.report_summary())
+
+    def run_check(
+        self,
+        force_relink: bool = False,
+        reconcile: bool = False,
+        jobs: int = 1,
+        max_errors: Optional[int] = None,
+        output_format: Optional[str] = None,
+        output_path: Optional[Path] = None,
+        changed_since: Optional[str] = None,
+        files: Optional[List[Path]] = None,
+    ) -> bool:
+        # `output_format` ("jsonl" or "sarif") additionally streams the results
+        # to `output_path`, or to stdout. `changed_since` (a git ref) and
+        # `files` restrict the check to the given changes.
+        in_scope: Optional[Callable[[str], bool]] = None
+        if changed_since is not None or files is not None:
+            changed = self._changed_paths(changed_since, files)
+            if changed is None:
+                bus.error(L.check.run.changed_since_failed, ref=changed_since)
+                return False
+            in_scope = self._scope_filter(changed)
+
+        with self._check_output(output_format, output_path):
+            return self._run_check(force_relink, reconcile, jobs, max_errors, in_scope)
+
+    def _run_check(
+        self,
+        force_relink: bool,
+        reconcile: bool,
+        jobs: int,
+        max_errors: Optional[int],
+        in_scope: Optional[Callable[[str], bool]] = None,
+    ) -> bool:
+        self._reset_run_caches()
         self.scanner.had_errors = False
         index_stats = self.ensure_index_fresh()
         if not index_stats["success"]:
             self.scanner.had_errors = True
 
         configs, _ = self._load_configs()
-        all_results: List[FileCheckResult] = []
         # Create a single transaction for the entire check run
         tm = TransactionManager(self.root_path)
 
+        parallel: Optional[ParallelCheckAnalyzer] = None
+        if jobs > 1:
+            parallel = ParallelCheckAnalyzer(
+                self.root_path,
+                self.db_manager.db_path,
+                jobs,
+                pragmas=self.db_manager.pragmas,
+            )
+
+        # Files are checked in chunks and reported one by one, so that output
+        # starts early and results are not accumulated over the whole run.
+        stopped_early = False
+
         # We wrap the entire multi-target check process in a single DB session
-        with self.db_manager.session():
+        with ExitStack() as stack, self.db_manager.session():
+            if parallel:
+                stack.enter_context(parallel)
             for config in configs:
+                if stopped_early:
+                    break
                 if config.name != "default":
                     bus.info(L.generate.target.processing, name=config.name)
 
                 # 1. Config Strategy
                 parser, renderer = get_docstring_codec(config.docstring_style)
                 serializer = get_docstring_serializer(config.docstring_style)
-                self.doc_manager.set_strategy(parser, serializer)
+                self.doc_manager.set_strategy(
+                    parser, serializer, config.docstring_style
+                )
+                if parallel:
+                    parallel.set_docstring_style(config.docstring_style)
 
                 # 2. Get Files (Physical) - Zero-IO Path
                 files = self.scanner.get_files_from_config(config)
                 rel_paths = [f.relative_to(self.root_path).as_posix() for f in files]
+                if in_scope:
+                    rel_paths = [p for p in rel_paths if in_scope(p)]
 
                 # 3. Get Plugins (Virtual) - AST Path
-                plugin_modules = self.scanner.process_plugins(config.plugins)
-
-                if not rel_paths and not plugin_modules:
-                    continue
-
-                # 4. Analyze
-                batch_results: List[FileCheckResult] = []
-                batch_conflicts: List[InteractionContext] = []
-
-                if rel_paths:
-                    f_res, f_conflicts = self.check_runner.analyze_paths(rel_paths)
-                    batch_results.extend(f_res)
-                    batch_conflicts.extend(f_conflicts)
-
+                # Plugins have no files, so a scoped check leaves them out.
+                plugin_modules = (
+                    [] if in_scope else self.scanner.process_plugins(config.plugins)
+                )
+
+                chunks: List[Tuple[List[str], List[ModuleDef]]] = [
+                    (rel_paths[start : start + ANALYZE_BATCH_SIZE], [])
+                    for start in range(0, len(rel_paths), ANALYZE_BATCH_SIZE)
+                ]
                 if plugin_modules:
-                    p_res, p_conflicts = self.check_runner.analyze_batch(plugin_modules)
-                    batch_results.extend(p_res)
-                    batch_conflicts.extend(p_conflicts)
-
-                all_results.extend(batch_results)
-
-                # 5. Prepare lightweight ModuleDefs for post-processing
-                file_module_stubs = [ModuleDef(file_path=p) for p in rel_paths]
-                batch_modules = file_module_stubs + plugin_modules
-
-                # 6. Auto-Reconcile Docs (e.g., when only docs are updated)
-                self.check_runner.auto_reconcile_docs(batch_results, batch_modules)
-
-                # 7. Resolve interactive/manual conflicts
-                if not self.check_runner.resolve_conflicts(
-                    batch_results, batch_conflicts, tm, force_relink, reconcile
-                ):
-                    return False
+                    chunks.append(([], plugin_modules))
+
+                # 4. Analyze, resolve and report each chunk
+                for chunk_paths, chunk_plugins in chunks:
+                    if (
+                        max_errors
+                        and self.check_runner.reported_error_count >= max_errors
+                    ):
+                        # Only stop if files are actually left unchecked.
+                        stopped_early = True
+                        break
+                    outcome = self._check_chunk(
+                        chunk_paths,
+                        chunk_plugins,
+                        parallel,
+                        tm,
+                        force_relink,
+                        reconcile,
+                        max_errors,
+                    )
+                    if outcome is None:
+                        return False
+                    if outcome:
+                        stopped_early = True
+                        break
 
             # --- Phase B: Architecture Check (Global) ---
-            arch_violations = self.architecture_engine.analyze(self.index_store)
+            arch_violations = (
+                []
+                if stopped_early
+                else self._check_architecture(scoped=in_scope is not None)
+            )
 
         try:
-            # 8. Commit Lock and Doc changes
+            # 5. Commit Lock and Doc changes
             self.lock_session.commit_to_transaction(tm)
             tm.commit()
+            # Only a complete, unscoped run knows which entries are stale.
+            self.check_runner.save_result_cache(
+                prune=not stopped_early and in_scope is None
+            )
 
-            # 9. Final Report
-            report_success = self.check_runner.report(all_results, arch_violations)
+            # 6. Final Summary
+            report_success = self.check_runner.finish_report(
+                arch_violations, stopped_early
+            )
             return report_success and not self.scanner.had_errors
         finally:
             self.lock_session.clear()
+            self._reset_run_caches()
 
     def run_pump(
         self,
@@ -317,6 +665,7 @@ class StitcherApp:
         reconcile: bool = False,
         dry_run: bool = False,
     ) -> PumpResult:
+        self._reset_run_caches()
         self.ensure_index_fresh()
         bus.info(L.pump.run.start)
         configs, _ = self._load_configs()
@@ -350,6 +699,7 @@ class StitcherApp:
             return PumpResult(success=global_success, redundant_files=all_redundant)
         finally:
             self.lock_session.clear()
+            self._reset_run_caches()
 
     def run_strip(
         self, files: Optional[List[Path]] = None, dry_run: bool = False
@@ -436,6 +786,6 @@ class StitcherApp:
                 migration_script, config_to_use, dry_run, confirm_callback
             )
 
-    def run_index_build(self) -> bool:
-        stats = self.index_runner.run_build(self.workspace)
+    def run_index_build(self, max_workers: Optional[int] = None) -> bool:
+        stats = self.index_runner.run_build(self.workspace, max_workers=max_workers)
         return stats.get("success", False)
@@ -0,0 +1,379 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import selectors
+import socket
+import stat
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from needle.pointer import L
+from stitcher.common.bus import bus
+
+from .core import StitcherApp
+
+log = logging.getLogger(__name__)
+
+# Unix socket paths are limited to ~104-108 bytes depending on the platform.
+_MAX_SOCKET_PATH = 100
+
+# Seconds a client may take to send its request line.
+REQUEST_TIMEOUT = 5.0
+
+# Commands a client may send; each maps to a StitcherApp call returning a bool.
+COMMANDS = ("ping", "check", "cov", "shutdown")
+
+# (mtime_ns, size) of a watched file.
+_Signature = Tuple[int, int]
+
+MessageCallback = Callable[[str, str], None]
+OutputCallback = Callable[[str], None]
+
+
+def _private_runtime_dir() -> Optional[Path]:
+    # A directory only the current user can enter. None if it cannot be
+    # created, or if someone else owns or can access an existing one.
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    path = Path(base) / f"stitcher-{os.getuid()}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        return None
+    return path
+
+
+def daemon_socket_path(root_path: Path) -> Optional[Path]:
+    # None if the workspace path is too long for a socket and no private
+    # runtime directory is available to hold it instead.
+    path = root_path / ".stitcher" / "daemon.sock"
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    runtime_dir = _private_runtime_dir()
+    if runtime_dir is None:
+        return None
+    digest = hashlib.sha1(str(root_path).encode("utf-8")).hexdigest()[:16]
+    return runtime_dir / f"{digest}.sock"
+
+
+def _send(conn: socket.socket, event: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(event).encode("utf-8") + b"\n")
+
+
+class _ClientStream:
+    # Streams events of one request to its client. If the client goes away the
+    # request still runs to completion; the remaining events are dropped.
+    def __init__(self, conn: socket.socket):
+        self.conn = conn
+        self.connected = True
+
+    def send(self, event: Dict[str, Any]) -> None:
+        if not self.connected:
+            return
+        try:
+            _send(self.conn, event)
+        except OSError:
+            self.connected = False
+
+
+class _SocketRenderer:
+    # Forwards bus messages to the client, already rendered in the daemon.
+    def __init__(self, stream: _ClientStream):
+        self.stream = stream
+
+    def render(self, message: str, level: str, **kwargs: Any) -> None:
+        self.stream.send({"event": "message", "level": level, "message": message})
+
+
+class _SocketWriter(io.TextIOBase):
+    # Forwards plain stdout output (e.g. the coverage table) to the client.
+    def __init__(self, stream: _ClientStream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        # Rejecting bytes marks this as a text stream for click/typer.
+        if not isinstance(text, str):
+            raise TypeError("write() argument must be str")
+        if text:
+            self.stream.send({"event": "output", "text": text})
+        return len(text)
+
+
+class _NullRenderer:
+    def render(self, message: str, level: str, **kwargs: Any) -> None:
+        log.debug(message)
+
+
+class PollingWatcher:
+    # Detects changes to the files the indexer cares about (and to the
+    # pyproject.toml files deciding package roots) by comparing (mtime_ns, size)
+    # signatures between polls. A poll only stats the known files and their
+    # directories. The workspace is listed again when a directory changed (an
+    # entry was added, removed or renamed) or every `rediscover_interval`
+    # seconds, which also picks up e.g. .gitignore edits. Needs nothing beyond
+    # the stdlib.
+    def __init__(self, app: StitcherApp, rediscover_interval: float = 30.0):
+        self.app = app
+        self.rediscover_interval = rediscover_interval
+        self._files: Optional[Dict[str, _Signature]] = None
+        self._dirs: Dict[str, Optional[int]] = {}
+        self._next_discovery = 0.0
+
+    def _is_watched(self, rel_path: str) -> bool:
+        return (
+            self.app.file_indexer.is_indexed_path(rel_path)
+            or rel_path.rpartition("/")[2] == "pyproject.toml"
+        )
+
+    def _stat(self, rel_path: str) -> Optional[_Signature]:
+        try:
+            st = os.stat(self.app.root_path / rel_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _dir_mtime(self, rel_dir: str) -> Optional[int]:
+        try:
+            return os.stat(self.app.root_path / rel_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _discover(self) -> Dict[str, _Signature]:
+        paths = [p for p in self.app.workspace.discover_files() if self._is_watched(p)]
+        # Every directory on the way to a watched file, so that new files and
+        # directories anywhere below the root are noticed.
+        dirs: Set[str] = {""}
+        for rel_path in paths:
+            parent = rel_path.rpartition("/")[0]
+            while parent not in dirs:
+                dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+        self._dirs = {d: self._dir_mtime(d) for d in dirs}
+        return self._stat_all(paths)
+
+    def _stat_all(self, paths: Iterable[str]) -> Dict[str, _Signature]:
+        signatures: Dict[str, _Signature] = {}
+        for rel_path in paths:
+            signature = self._stat(rel_path)
+            if signature is not None:
+                signatures[rel_path] = signature
+        return signatures
+
+    def poll(self) -> Set[str]:
+        # Paths added, changed or removed since the previous poll. The first
+        # poll only records the current state.
+        now = time.monotonic()
+        if (
+            self._files is None
+            or now >= self._next_discovery
+            or any(self._dir_mtime(d) != m for d, m in self._dirs.items())
+        ):
+            current = self._discover()
+            self._next_discovery = now + self.rediscover_interval
+        else:
+            current = self._stat_all(self._files)
+
+        previous, self._files = self._files, current
+        if previous is None:
+            return set()
+        return {
+            p
+            for p in previous.keys() | current.keys()
+            if previous.get(p) != current.get(p)
+        }
+
+
+class IndexDaemon:
+    def __init__(
+        self,
+        app: StitcherApp,
+        poll_interval: float = 1.0,
+        request_timeout: float = REQUEST_TIMEOUT,
+    ):
+        self.app = app
+        self.poll_interval = poll_interval
+        self.request_timeout = request_timeout
+        self.socket_path = daemon_socket_path(app.root_path)
+        self.watcher = PollingWatcher(app)
+        self._running = False
+
+    def serve_forever(self) -> bool:
+        if self.socket_path is None:
+            bus.error(L.index.daemon.no_socket_dir)
+            return False
+        if is_daemon_running(self.app.root_path):
+            bus.error(L.index.daemon.already_running, path=self.socket_path)
+            return False
+
+        # The first poll only records the state; changes made while the
+        # index is built are picked up by the next one.
+        self.watcher.poll()
+        with bus.use_renderer(_NullRenderer()):
+            self.app.watch_index()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the current user may connect to the socket.
+        umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(umask)
+        server.listen()
+        bus.success(L.index.daemon.started, path=self.socket_path)
+
+        selector = selectors.DefaultSelector()
+        selector.register(server, selectors.EVENT_READ)
+        self._running = True
+        next_poll = time.monotonic() + self.poll_interval
+        try:
+            # Single-threaded on purpose: requests and index refreshes never
+            # overlap, and the SQLite connection stays on one thread.
+            while self._running:
+                timeout = max(0.0, next_poll - time.monotonic())
+                if selector.select(timeout):
+                    conn, _ = server.accept()
+                    with conn:
+                        self._handle(conn)
+                if time.monotonic() >= next_poll:
+                    with bus.use_renderer(_NullRenderer()):
+                        self._sync_index()
+                    next_poll = time.monotonic() + self.poll_interval
+        except KeyboardInterrupt:
+            pass
+        finally:
+            selector.close()
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+            self.app.db_manager.close()
+            bus.info(L.index.daemon.stopped)
+        return True
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _sync_index(self) -> None:
+        # Only the paths the watcher saw change are re-indexed; the app keeps
+        # its caches for everything else.
+        changed = self.watcher.poll()
+        if changed:
+            self.app.refresh_index_paths(changed)
+
+    def _read_request(self, conn: socket.socket) -> Optional[Dict[str, Any]]:
+        # A client that does not send its request in time is dropped, so it
+        # cannot block the loop. The timeout also bounds every later send.
+        conn.settimeout(self.request_timeout)
+        try:
+            with conn.makefile("rb") as reader:
+                line = reader.readline()
+        except socket.timeout:
+            return None
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return None
+        return request if isinstance(request, dict) else None
+
+    def _handle(self, conn: socket.socket) -> None:
+        stream = _ClientStream(conn)
+        request = self._read_request(conn)
+        command = request.get("command") if request else None
+        if not request or command not in COMMANDS:
+            stream.send({"event": "result", "success": False, "error": "bad request"})
+            return
+
+        options = request.get("options")
+        if not isinstance(options, dict):
+            options = {}
+        result: Dict[str, Any] = {"event": "result", "success": False}
+        try:
+            with bus.use_renderer(_SocketRenderer(stream)):
+                with redirect_stdout(_SocketWriter(stream)):
+                    result["success"] = self._dispatch(command, options)
+        except Exception as e:
+            log.exception("Daemon request failed")
+            result["error"] = str(e)
+        stream.send(result)
+
+    def _dispatch(self, command: str, options: Dict[str, Any]) -> bool:
+        if command in ("check", "cov"):
+            # Edits made since the last poll must be seen by this request.
+            self._sync_index()
+        if command == "check":
+            max_errors = options.get("max_errors")
+            output = options.get("output")
+            files = options.get("files")
+            return self.app.run_check(
+                force_relink=bool(options.get("force_relink", False)),
+                reconcile=bool(options.get("reconcile", False)),
+                jobs=max(1, int(options.get("jobs", 1))),
+                max_errors=int(max_errors) if max_errors else None,
+                output_format=options.get("format") or None,
+                output_path=Path(output) if output else None,
+                changed_since=options.get("changed_since") or None,
+                files=[Path(f) for f in files] if isinstance(files, list) else None,
+            )
+        if command == "cov":
+            return self.app.run_cov()
+        if command == "shutdown":
+            self.stop()
+        return True
+
+
+def request_daemon(
+    root_path: Path,
+    command: str,
+    options: Optional[Dict[str, Any]] = None,
+    on_message: Optional[MessageCallback] = None,
+    on_output: Optional[OutputCallback] = None,
+    connect_timeout: float = 0.5,
+) -> Optional[bool]:
+    # Returns the command's result, or None if no daemon could be reached
+    # (callers then run the command in-process).
+    path = daemon_socket_path(root_path)
+    if path is None or not path.exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    received = False
+    try:
+        client.settimeout(connect_timeout)
+        client.connect(str(path))
+        client.settimeout(None)
+        request = {"command": command, "options": options or {}}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with client.makefile("rb") as reader:
+            for line in reader:
+                event = json.loads(line)
+                received = True
+                kind = event.get("event")
+                if kind == "message" and on_message:
+                    on_message(event["level"], event["message"])
+                elif kind == "output" and on_output:
+                    on_output(event["text"])
+                elif kind == "result":
+                    return bool(event.get("success"))
+    except (OSError, ValueError):
+        pass
+    finally:
+        client.close()
+    # The daemon went away. Once output was shown the request counts as failed;
+    # before that, the caller may still run the command itself.
+    return False if received else None
+
+
+def is_daemon_running(root_path: Path) -> bool:
+    return request_daemon(root_path, "ping") is not None
@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from stitcher.spec import (
+    DocstringIR,
+    IndexStoreProtocol,
+    LockManagerProtocol,
+    URIGeneratorProtocol,
+)
+from stitcher.spec.managers import DocumentManagerProtocol
+from stitcher.analysis.engines.consistency.engine import ConsistencyEngine
+from stitcher.analysis.schema import FileCheckResult
+from stitcher.workspace import Workspace
+
+from .subject import IndexCheckSubjectAdapter
+
+# Files whose symbols and sidecar docs are prefetched together. Bounds memory
+# while keeping the query count independent of the file count.
+ANALYZE_BATCH_SIZE = 1000
+
+
+class IndexPathAnalyzer:
+    def __init__(
+        self,
+        index_store: IndexStoreProtocol,
+        doc_manager: DocumentManagerProtocol,
+        lock_manager: LockManagerProtocol,
+        uri_generator: URIGeneratorProtocol,
+        workspace: Workspace,
+        root_path: Path,
+    ):
+        self.index_store = index_store
+        self.doc_manager = doc_manager
+        self.lock_manager = lock_manager
+        self.uri_generator = uri_generator
+        self.workspace = workspace
+        self.root_path = root_path
+
+    def analyze(
+        self,
+        file_paths: List[str],
+        engine: ConsistencyEngine,
+        docs_out: Optional[Dict[str, Dict[str, DocstringIR]]] = None,
+    ) -> List[FileCheckResult]:
+        return list(self.iter_analyze(file_paths, engine, docs_out))
+
+    def iter_analyze(
+        self,
+        file_paths: List[str],
+        engine: ConsistencyEngine,
+        docs_out: Optional[Dict[str, Dict[str, DocstringIR]]] = None,
+    ) -> Iterator[FileCheckResult]:
+        # Yields each result as soon as its file is analyzed; a caller that
+        # stops early leaves the remaining files unanalyzed.
+        # `docs_out` receives the sidecar docs of files with violations, which
+        # reconciliation needs again later in the run.
+        for start in range(0, len(file_paths), ANALYZE_BATCH_SIZE):
+            batch = file_paths[start : start + ANALYZE_BATCH_SIZE]
+            symbols_by_path = self.index_store.get_symbols_by_file_paths(batch)
+            docs_by_path, hashes_by_path = (
+                self.doc_manager.load_docs_with_hashes_for_paths(batch)
+            )
+
+            for file_path in batch:
+                subject = IndexCheckSubjectAdapter(
+                    file_path,
+                    self.index_store,
+                    self.doc_manager,
+                    self.lock_manager,
+                    self.uri_generator,
+                    self.workspace,
+                    self.root_path,
+                    symbols=symbols_by_path.get(file_path, []),
+                    yaml_docs=docs_by_path.get(file_path),
+                    yaml_hashes=hashes_by_path.get(file_path),
+                )
+                result = engine.analyze(subject)
+                if docs_out is not None and result.violations:
+                    docs_out[file_path] = docs_by_path.get(file_path, {})
+                yield result
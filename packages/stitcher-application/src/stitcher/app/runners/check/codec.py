@@ -0,0 +1,19 @@
+from typing import Any, Dict, List, Tuple
+
+from needle.pointer import SemanticPointer
+from stitcher.analysis.schema import Violation
+
+# Semantic pointers do not pickle, so violations leave the process (or go to
+# disk) as plain tuples: (kind, fqn, context).
+EncodedViolation = Tuple[str, str, Dict[str, Any]]
+
+
+def encode_violations(violations: List[Violation]) -> List[EncodedViolation]:
+    return [(str(v.kind), v.fqn, v.context) for v in violations]
+
+
+def decode_violations(rows: List[EncodedViolation]) -> List[Violation]:
+    return [
+        Violation(kind=SemanticPointer(kind), fqn=fqn, context=context)
+        for kind, fqn, context in rows
+    ]
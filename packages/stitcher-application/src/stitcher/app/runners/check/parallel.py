@@ -0,0 +1,140 @@
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from stitcher.analysis.engines.consistency.engine import (
+    ConsistencyEngine,
+    create_consistency_engine,
+)
+from stitcher.analysis.schema import FileCheckResult
+from stitcher.index.db import DatabaseManager
+from stitcher.index.store import IndexStore
+from stitcher.lang.python import PythonURIGenerator
+from stitcher.lang.python.docstring import (
+    get_docstring_codec,
+    get_docstring_serializer,
+)
+from stitcher.lang.sidecar import DocumentManager, LockFileManager
+from stitcher.workspace import Workspace
+
+from stitcher.app.services.lock_cache import LockCache
+from .analyzer import ANALYZE_BATCH_SIZE, IndexPathAnalyzer
+from .codec import EncodedViolation, decode_violations, encode_violations
+
+# Shards per worker. More, smaller shards even out files of uneven cost.
+_SHARDS_PER_JOB = 4
+
+_EncodedResult = Tuple[str, List[EncodedViolation], List[EncodedViolation]]
+
+
+class _CheckWorker:
+    def __init__(self, root_path: Path, db_path: Path, pragmas: Dict[str, Any]):
+        db_manager = DatabaseManager(
+            db_path, pragmas=pragmas, persistent=True, read_only=True
+        )
+        index_store = IndexStore(db_manager)
+        uri_generator = PythonURIGenerator()
+        self.doc_manager = DocumentManager(root_path, uri_generator, index_store)
+        self.analyzer = IndexPathAnalyzer(
+            index_store,
+            self.doc_manager,
+            LockCache(LockFileManager(root_path, index_store)),
+            uri_generator,
+            Workspace(root_path),
+            root_path,
+        )
+        self.engine: ConsistencyEngine = create_consistency_engine()
+
+    def analyze(
+        self, docstring_style: str, file_paths: List[str]
+    ) -> List[_EncodedResult]:
+        parser, _ = get_docstring_codec(docstring_style)
+        serializer = get_docstring_serializer(docstring_style)
+        self.doc_manager.set_strategy(parser, serializer, docstring_style)
+
+        return [
+            (
+                result.path,
+                encode_violations(result.violations),
+                encode_violations(result.reconciled),
+            )
+            for result in self.analyzer.analyze(file_paths, self.engine)
+        ]
+
+
+# Installed into each worker process by `_init_check_worker`.
+_worker: Optional[_CheckWorker] = None
+
+
+def _init_check_worker(root_path: Path, db_path: Path, pragmas: Dict[str, Any]):
+    global _worker
+    _worker = _CheckWorker(root_path, db_path, pragmas)
+
+
+def _analyze_in_worker(task: Tuple[str, List[str]]) -> List[_EncodedResult]:
+    assert _worker is not None
+    docstring_style, file_paths = task
+    return _worker.analyze(docstring_style, file_paths)
+
+
+class ParallelCheckAnalyzer:
+    def __init__(
+        self,
+        root_path: Path,
+        db_path: Path,
+        jobs: int,
+        pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        self.root_path = root_path
+        self.db_path = db_path
+        self.jobs = jobs
+        self.pragmas = pragmas or {}
+        self.docstring_style = "raw"
+        self._pool: Optional[Executor] = None
+
+    def __enter__(self) -> "ParallelCheckAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool:
+            # Shards not started yet are dropped, e.g. after a run stopped early.
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def set_docstring_style(self, docstring_style: str) -> None:
+        self.docstring_style = docstring_style
+
+    def analyze(self, file_paths: List[str]) -> List[FileCheckResult]:
+        return list(self.iter_analyze(file_paths))
+
+    def iter_analyze(self, file_paths: List[str]) -> Iterator[FileCheckResult]:
+        if not file_paths:
+            return
+        if self._pool is None:
+            # Spawned lazily so that runs with nothing to check never pay for it.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_check_worker,
+                initargs=(self.root_path, self.db_path, self.pragmas),
+            )
+
+        shard_size = math.ceil(len(file_paths) / (self.jobs * _SHARDS_PER_JOB))
+        shard_size = max(1, min(ANALYZE_BATCH_SIZE, shard_size))
+        tasks = [
+            (self.docstring_style, file_paths[start : start + shard_size])
+            for start in range(0, len(file_paths), shard_size)
+        ]
+
+        # Executor.map keeps submission order, so results match a serial run.
+        # Each shard is yielded as soon as it (and all before it) finished.
+        for shard in self._pool.map(_analyze_in_worker, tasks):
+            for path, violations, reconciled in shard:
+                yield FileCheckResult(
+                    path=path,
+                    violations=decode_violations(violations),
+                    reconciled=decode_violations(reconciled),
+                )
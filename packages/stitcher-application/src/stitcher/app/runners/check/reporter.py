@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from collections import defaultdict
 
 from stitcher.common.bus import bus
@@ -8,44 +8,89 @@ from stitcher.analysis.schema import FileCheckResult
 
 from stitcher.analysis.schema import Violation
 
+from .result_writers import CheckResultWriter
+
 
 class CheckReporter:
-    def report(
-        self,
-        file_results: List[FileCheckResult],
-        arch_violations: List[Violation],
+    def __init__(self):
+        # Optional machine-readable output (`check --format`), fed alongside
+        # the human messages.
+        self.writer: Optional[CheckResultWriter] = None
+        self.reset()
+
+    def reset(self) -> None:
+        # Only summary counters are kept, so files can be reported as they are
+        # checked without holding on to their results.
+        self.failed_files = 0
+        self.warning_files = 0
+        self.error_count = 0
+        self.stopped_early = False
+        # None until `finish` completes the report.
+        self.success: Optional[bool] = None
+
+    def report_file(self, res: FileCheckResult) -> None:
+        self._report_reconciled_and_info(res)
+
+        if res.error_count > 0:
+            self.failed_files += 1
+            self.error_count += res.error_count
+            bus.error(L.check.file.fail, path=res.path, count=res.error_count)
+        elif res.warning_count > 0:
+            self.warning_files += 1
+            bus.warning(L.check.file.warn, path=res.path, count=res.warning_count)
+
+        self._report_file_issues(res)
+        if self.writer:
+            self.writer.write_result(res)
+
+    def finish(
+        self, arch_violations: List[Violation], stopped_early: bool = False
     ) -> bool:
-        # --- Phase 1: Per-File Reporting ---
-        global_failed_files = 0
-        global_warnings_files = 0
-
-        for res in file_results:
-            self._report_reconciled_and_info(res)
-
-            if res.error_count > 0:
-                global_failed_files += 1
-                bus.error(L.check.file.fail, path=res.path, count=res.error_count)
-            elif res.warning_count > 0:
-                global_warnings_files += 1
-                bus.warning(L.check.file.warn, path=res.path, count=res.warning_count)
-
-            self._report_file_issues(res)
-
-        # --- Phase 2: Global Architecture Reporting ---
+        # --- Global Architecture Reporting ---
         has_arch_errors = self._report_architecture_issues(arch_violations)
         if has_arch_errors:
             # Treat architecture issues as a single "failed file" for summary purposes
-            global_failed_files += 1
-
-        # --- Phase 3: Global Summary ---
-        if global_failed_files > 0:
-            bus.error(L.check.run.fail, count=global_failed_files)
-            return False
-        if global_warnings_files > 0:
-            bus.success(L.check.run.success_with_warnings, count=global_warnings_files)
+            self.failed_files += 1
+
+        if self.writer:
+            self.writer.write_architecture(arch_violations)
+
+        # --- Global Summary ---
+        success = self.failed_files == 0
+        if stopped_early:
+            bus.error(L.check.run.stopped_early, count=self.error_count)
+        if not success:
+            bus.error(L.check.run.fail, count=self.failed_files)
+        elif self.warning_files > 0:
+            bus.success(L.check.run.success_with_warnings, count=self.warning_files)
         else:
             bus.success(L.check.run.success)
-        return True
+
+        self.stopped_early = stopped_early
+        self.success = success
+        return success
+
+    def summary(self) -> Dict[str, Any]:
+        # The closing record of the machine-readable output. A report that was
+        # never finished (the run aborted or raised) is not successful.
+        return {
+            "success": bool(self.success),
+            "completed": self.success is not None,
+            "failed_files": self.failed_files,
+            "warning_files": self.warning_files,
+            "errors": self.error_count,
+            "stopped_early": self.stopped_early,
+        }
+
+    def report(
+        self,
+        file_results: List[FileCheckResult],
+        arch_violations: List[Violation],
+    ) -> bool:
+        self.reset()
+        for res in file_results:
+            self.report_file(res)
+        return self.finish(arch_violations)
 
     def _report_reconciled_and_info(self, res: FileCheckResult):
         for info_violation in res.info_violations:
@@ -1,6 +1,6 @@
 from pathlib import Path
 from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from stitcher.common.bus import bus
 from needle.pointer import L, SemanticPointer
@@ -22,6 +22,9 @@ from stitcher.analysis.schema import FileCheckResult
 from stitcher.workspace import Workspace
 from stitcher.common.transaction import TransactionManager
 
+# File path -> sidecar docs, as hydrated during analysis.
+DocsByPath = Dict[str, Dict[str, DocstringIR]]
+
 
 class CheckResolver:
     def __init__(
@@ -56,23 +59,41 @@ class CheckResolver:
                 fingerprints[fqn] = self.fingerprint_strategy.compute(method)
         return fingerprints
 
+    def _docs_for_paths(
+        self, file_paths: List[str], docs_by_path: Optional[DocsByPath]
+    ) -> DocsByPath:
+        # Reuses docs hydrated during analysis; the rest (e.g. replayed or
+        # worker-analyzed files) are loaded with one batched query.
+        docs = dict(docs_by_path or {})
+        missing = [p for p in file_paths if p not in docs]
+        if missing:
+            docs.update(self.doc_manager.load_docs_for_paths(missing))
+        return docs
+
     def auto_reconcile_docs(
-        self, results: List[FileCheckResult], modules: List[ModuleDef]
+        self,
+        results: List[FileCheckResult],
+        modules: List[ModuleDef],
+        docs_by_path: Optional[DocsByPath] = None,
     ):
+        modules_by_path = {m.file_path: m for m in modules}
+        updates = []
         for res in results:
             doc_update_violations = [
                 v for v in res.info_violations if v.kind == L.check.state.doc_updated
             ]
-            if not doc_update_violations:
-                continue
-
-            module_def = next((m for m in modules if m.file_path == res.path), None)
-            if not module_def:
-                continue
-
-            # Load current IRs from sidecar to get the new baseline for the lock
-            current_docs = self.doc_manager.load_docs_for_module(module_def)
-
+            module_def = modules_by_path.get(res.path)
+            if doc_update_violations and module_def:
+                updates.append((module_def, doc_update_violations))
+        if not updates:
+            return
+
+        # Current IRs from the sidecars are the new baseline for the lock
+        docs = self._docs_for_paths(
+            [module_def.file_path for module_def, _ in updates], docs_by_path
+        )
+        for module_def, doc_update_violations in updates:
+            current_docs = docs.get(module_def.file_path, {})
             for violation in doc_update_violations:
                 fqn = violation.fqn
                 if fqn in current_docs:
@@ -88,20 +109,27 @@ class CheckResolver:
         tm: TransactionManager,
         force_relink: bool = False,
         reconcile: bool = False,
+        docs_by_path: Optional[DocsByPath] = None,
     ) -> bool:
         if not conflicts:
             return True
 
+        docs = self._docs_for_paths(
+            list(dict.fromkeys(c.file_path for c in conflicts)), docs_by_path
+        )
         if self.interaction_handler:
-            return self._resolve_interactive(results, conflicts, tm)
+            return self._resolve_interactive(results, conflicts, tm, docs)
         else:
-            return self._resolve_noop(results, conflicts, tm, force_relink, reconcile)
+            return self._resolve_noop(
+                results, conflicts, tm, force_relink, reconcile, docs
+            )
 
     def _resolve_interactive(
         self,
         results: List[FileCheckResult],
         conflicts: List[InteractionContext],
         tm: TransactionManager,
+        docs: DocsByPath,
     ) -> bool:
         assert self.interaction_handler is not None
 
@@ -125,7 +153,7 @@ class CheckResolver:
                 bus.warning(L.strip.run.aborted)
                 return False
 
-        self._apply_resolutions(dict(resolutions_by_file), tm)
+        self._apply_resolutions(dict(resolutions_by_file), tm, docs)
         self._update_results(results, dict(resolutions_by_file))
 
         return True
@@ -137,6 +165,7 @@ class CheckResolver:
         tm: TransactionManager,
         force_relink: bool,
         reconcile: bool,
+        docs: DocsByPath,
     ) -> bool:
         handler = NoOpInteractionHandler(force_relink, reconcile)
         chosen_actions = handler.process_interactive_session(conflicts)
@@ -147,7 +176,7 @@ class CheckResolver:
             if action != ResolutionAction.SKIP:
                 resolutions_by_file[context.file_path].append((context, action))
 
-        self._apply_resolutions(dict(resolutions_by_file), tm)
+        self._apply_resolutions(dict(resolutions_by_file), tm, docs)
         self._update_results(results, dict(resolutions_by_file))
         return True
 
@@ -177,6 +206,7 @@ class CheckResolver:
         self,
         resolutions: dict[str, list[tuple[InteractionContext, ResolutionAction]]],
         tm: TransactionManager,
+        docs_by_path: DocsByPath,
     ):
         for file_path, context_actions in resolutions.items():
             abs_path = self.root_path / file_path
@@ -194,14 +224,13 @@ class CheckResolver:
 
             full_module_def: ModuleDef | None = None
             computed_fingerprints: dict[str, Fingerprint] = {}
-            current_doc_irs: dict[str, "DocstringIR"] = {}
+            current_doc_irs = docs_by_path.get(file_path, {})
 
             if needs_parsing:
                 full_module_def = self.parser.parse(
                     abs_path.read_text("utf-8"), file_path
                 )
                 computed_fingerprints = self._compute_fingerprints(full_module_def)
-                current_doc_irs = self.doc_manager.load_docs_for_module(full_module_def)
 
             fqns_to_purge_from_doc: list[str] = []
             for context, action in context_actions:
@@ -230,8 +259,7 @@ class CheckResolver:
                     self.lock_session.record_purge(module_stub, fqn)
 
             if fqns_to_purge_from_doc:
-                module_def_stub = ModuleDef(file_path=file_path)
-                docs = self.doc_manager.load_docs_for_module(module_def_stub)
+                docs = dict(current_doc_irs)
                 original_len = len(docs)
 
                 for fqn in fqns_to_purge_from_doc:
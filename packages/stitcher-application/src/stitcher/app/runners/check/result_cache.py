@@ -0,0 +1,104 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from stitcher.analysis.schema import FileCheckResult
+
+from .codec import EncodedViolation, decode_violations, encode_violations
+
+log = logging.getLogger(__name__)
+
+# Bump whenever rules or check subjects change what they report, so that
+# results of an older rule set are never replayed.
+CHECK_CACHE_VERSION = 1
+
+_Entry = Tuple[str, List[EncodedViolation]]
+
+
+class CheckResultCache:
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        # File path -> (key, violations). Loaded on first use.
+        self._entries: Optional[Dict[str, _Entry]] = None
+        self._touched: Set[str] = set()
+        self._dirty = False
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        raw = json.dumps(
+            [CHECK_CACHE_VERSION, *parts], sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, _Entry]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            data = json.loads(self.cache_path.read_bytes())
+            if data.get("version") == CHECK_CACHE_VERSION:
+                self._entries = {
+                    path: (key, violations)
+                    for path, (key, violations) in data["entries"].items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            log.debug(f"Discarding unreadable check cache {self.cache_path}: {e}")
+        return self._entries
+
+    def get(self, file_path: str, key: str) -> Optional[FileCheckResult]:
+        entry = self._load().get(file_path)
+        self._touched.add(file_path)
+        if entry is None or entry[0] != key:
+            return None
+        try:
+            violations = decode_violations(entry[1])
+        except (TypeError, ValueError):
+            return None
+        return FileCheckResult(path=file_path, violations=violations)
+
+    def put(self, file_path: str, key: str, result: FileCheckResult) -> None:
+        # Called with fresh engine results, before the resolver mutates them.
+        entries = self._load()
+        self._touched.add(file_path)
+        self._dirty = True
+        violations = encode_violations(result.violations)
+        try:
+            json.dumps(violations)
+        except (TypeError, ValueError):
+            # A violation context that does not serialize: never cached.
+            entries.pop(file_path, None)
+            return
+        entries[file_path] = (key, violations)
+
+    def save(self, prune: bool = True) -> None:
+        entries = self._load()
+        # Entries of files that were not checked in this run are stale, unless
+        # the run stopped before reaching them.
+        stale = set(entries) - self._touched if prune else set()
+        self._touched = set()
+        if not self._dirty and not stale:
+            return
+        for file_path in stale:
+            del entries[file_path]
+
+        payload = json.dumps(
+            {"version": CHECK_CACHE_VERSION, "entries": entries},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, self.cache_path)
+        except OSError as e:
+            log.debug(f"Could not write check cache {self.cache_path}: {e}")
+            return
+        self._dirty = False
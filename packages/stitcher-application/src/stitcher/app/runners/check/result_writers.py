@@ -0,0 +1,125 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, TextIO
+
+from stitcher.analysis.schema import FileCheckResult, Violation
+from stitcher.common.bus import bus
+
+RESULT_FORMATS = ("jsonl", "sarif")
+
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    # Contexts are plain data in practice; anything else is stringified.
+    return json.dumps(record, ensure_ascii=False, default=str)
+
+
+class CheckResultWriter(ABC):
+    # Writes check results as they are reported, one file at a time; nothing
+    # is buffered beyond the current file.
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write_result(self, res: FileCheckResult) -> None:
+        for violation in res.violations:
+            self._write(res.path, violation, res.severity(violation), False)
+        for violation in res.reconciled:
+            self._write(res.path, violation, "info", True)
+        self.stream.flush()
+
+    def write_architecture(self, violations: List[Violation]) -> None:
+        for violation in violations:
+            self._write(None, violation, "error", False)
+        self.stream.flush()
+
+    def close(self, summary: Dict[str, Any]) -> None:
+        self.stream.flush()
+
+    @abstractmethod
+    def _write(
+        self,
+        file_path: Optional[str],
+        violation: Violation,
+        level: str,
+        reconciled: bool,
+    ) -> None: ...
+
+
+class JsonLinesResultWriter(CheckResultWriter):
+    def _write(
+        self,
+        file_path: Optional[str],
+        violation: Violation,
+        level: str,
+        reconciled: bool,
+    ) -> None:
+        record = {
+            "type": "reconciled" if reconciled else "violation",
+            "file": file_path,
+            "fqn": violation.fqn,
+            "kind": str(violation.kind),
+            "level": level,
+            "context": violation.context,
+        }
+        self.stream.write(_dumps(record) + "\n")
+
+    def close(self, summary: Dict[str, Any]) -> None:
+        self.stream.write(_dumps({"type": "summary", **summary}) + "\n")
+        super().close(summary)
+
+
+class SarifResultWriter(CheckResultWriter):
+    # The SARIF log is one JSON document; its `results` array is written
+    # element by element and the document is completed in `close`.
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._results_written = 0
+        header = {"$schema": _SARIF_SCHEMA, "version": "2.1.0"}
+        tool = {"driver": {"name": "stitcher"}}
+        # The header object is left open; `close` completes it.
+        self.stream.write(_dumps(header)[:-1])
+        self.stream.write(f',"runs":[{{"tool":{_dumps(tool)},"results":[')
+
+    def _write(
+        self,
+        file_path: Optional[str],
+        violation: Violation,
+        level: str,
+        reconciled: bool,
+    ) -> None:
+        if reconciled:
+            # Resolved during this run; not a finding.
+            return
+        params = {**violation.context, "key": violation.fqn, "path": file_path}
+        text = " ".join(bus.render_to_string(violation.kind, **params).split())
+        result: Dict[str, Any] = {
+            "ruleId": str(violation.kind),
+            "level": _SARIF_LEVELS[level],
+            "message": {"text": text.lstrip("- ")},
+            "properties": {"fqn": violation.fqn, **violation.context},
+        }
+        if file_path:
+            result["locations"] = [
+                {"physicalLocation": {"artifactLocation": {"uri": file_path}}}
+            ]
+        separator = "," if self._results_written else ""
+        self.stream.write(separator + _dumps(result))
+        self._results_written += 1
+
+    def close(self, summary: Dict[str, Any]) -> None:
+        invocation = {
+            "executionSuccessful": summary["completed"],
+            "properties": summary,
+        }
+        self.stream.write(f'],"invocations":[{_dumps(invocation)}]}}]}}\n')
+        super().close(summary)
+
+
+def create_result_writer(output_format: str, stream: TextIO) -> CheckResultWriter:
+    if output_format == "jsonl":
+        return JsonLinesResultWriter(stream)
+    if output_format == "sarif":
+        return SarifResultWriter(stream)
+    raise ValueError(f"Unknown check output format: {output_format}")
@@ -1,8 +1,9 @@
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from needle.pointer import L
 from stitcher.spec import (
+    Fingerprint,
     ModuleDef,
     FingerprintStrategyProtocol,
     IndexStoreProtocol,
@@ -17,9 +18,14 @@ from stitcher.analysis.schema import Violation
 
 from stitcher.common.transaction import TransactionManager
 
-from .resolver import CheckResolver
+from .resolver import CheckResolver, DocsByPath
 from .reporter import CheckReporter
-from .subject import IndexCheckSubjectAdapter, ASTCheckSubjectAdapter
+from .analyzer import IndexPathAnalyzer
+from .parallel import ParallelCheckAnalyzer
+from .result_cache import CheckResultCache
+from .result_writers import CheckResultWriter
+from .subject import ASTCheckSubjectAdapter
+from stitcher.app.services.fingerprint_cache import FingerprintCache
 from stitcher.analysis.engines.consistency.engine import create_consistency_engine
 from stitcher.workspace import Workspace
 
@@ -37,6 +43,7 @@ class CheckRunner:
         resolver: CheckResolver,
         reporter: CheckReporter,
         root_path: Path,
+        result_cache: Optional[CheckResultCache] = None,
     ):
         self.doc_manager = doc_manager
         self.lock_manager = lock_manager
@@ -46,9 +53,13 @@ class CheckRunner:
         self.workspace = workspace
         self.root_path = root_path
 
+        self.path_analyzer = IndexPathAnalyzer(
+            index_store, doc_manager, lock_manager, uri_generator, workspace, root_path
+        )
         self.engine = create_consistency_engine(differ=differ)
         self.resolver = resolver
         self.reporter = reporter
+        self.result_cache = result_cache
 
     def _extract_conflicts(
         self, analysis_result: AnalysisFileCheckResult
@@ -75,46 +86,159 @@ class CheckRunner:
                 )
         return conflicts
 
+    def _hash_lock_slices(
+        self, package_root: Path, file_uris: List[str]
+    ) -> Dict[str, str]:
+        # File URI -> digest of the lock fingerprints of that file's symbols.
+        # Only the slices of `file_uris` are loaded, from the index's mirror of
+        # the lock whenever it is current.
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for suri, fingerprint in self.lock_manager.load(
+            package_root, file_uris=file_uris
+        ).items():
+            file_uri = suri.partition("#")[0]
+            grouped.setdefault(file_uri, {})[suri] = fingerprint.to_dict()
+        return {
+            file_uri: CheckResultCache.make_key(entries)
+            for file_uri, entries in grouped.items()
+        }
+
+    def _result_cache_keys(self, file_paths: List[str]) -> Dict[str, str]:
+        # A key covers everything the index-based analysis of a file reads:
+        # its source and sidecar content, its lock slice and the docstring style.
+        assert self.result_cache is not None
+        sidecars = {
+            p: Path(p).with_suffix(".stitcher.yaml").as_posix() for p in file_paths
+        }
+        content_hashes = self.index_store.get_content_hashes(
+            [*file_paths, *sidecars.values()]
+        )
+        # file path -> (source hash, sidecar hash, package root, file URI)
+        inputs: Dict[str, Tuple[str, Optional[str], Path, str]] = {}
+        uris_by_package: Dict[Path, List[str]] = {}
+        for file_path in file_paths:
+            source_hash = content_hashes.get(file_path)
+            if source_hash is None:
+                continue
+            sidecar_hash = content_hashes.get(sidecars[file_path])
+            if sidecar_hash is None and (self.root_path / sidecars[file_path]).exists():
+                # A sidecar the index does not know about; its content is unknown.
+                continue
+
+            abs_path = self.root_path / file_path
+            package_root = self.workspace.find_owning_package(abs_path)
+            file_uri = self.uri_generator.generate_file_uri(
+                self.workspace.to_workspace_relative(abs_path)
+            )
+            inputs[file_path] = (source_hash, sidecar_hash, package_root, file_uri)
+            uris_by_package.setdefault(package_root, []).append(file_uri)
+
+        lock_slices = {
+            package_root: self._hash_lock_slices(package_root, file_uris)
+            for package_root, file_uris in uris_by_package.items()
+        }
+        keys: Dict[str, str] = {}
+        for file_path, file_inputs in inputs.items():
+            source_hash, sidecar_hash, package_root, file_uri = file_inputs
+            keys[file_path] = self.result_cache.make_key(
+                self.doc_manager.style,
+                source_hash,
+                sidecar_hash,
+                lock_slices[package_root].get(file_uri),
+            )
+        return keys
+
+    def iter_analyze_paths(
+        self,
+        file_paths: List[str],
+        parallel: Optional[ParallelCheckAnalyzer] = None,
+        docs_out: Optional[DocsByPath] = None,
+    ) -> Iterator[Tuple[AnalysisFileCheckResult, List[InteractionContext]]]:
+        # Yields each file's result and conflicts in order, as soon as it is
+        # available. Files whose inputs are unchanged since the last run replay
+        # their cached result; only the rest are analyzed.
+        cached: Dict[str, AnalysisFileCheckResult] = {}
+        keys: Dict[str, str] = {}
+        if self.result_cache:
+            keys = self._result_cache_keys(file_paths)
+            for file_path, key in keys.items():
+                hit = self.result_cache.get(file_path, key)
+                if hit:
+                    cached[file_path] = hit
+        to_analyze = [p for p in file_paths if p not in cached]
+
+        # With `parallel`, files are analyzed by worker processes; conflicts are
+        # still collected here so that they can be resolved interactively.
+        if parallel:
+            fresh_results = parallel.iter_analyze(to_analyze)
+        else:
+            fresh_results = self.path_analyzer.iter_analyze(
+                to_analyze, self.engine, docs_out
+            )
+
+        for file_path in file_paths:
+            analysis_result = cached.get(file_path)
+            if analysis_result is None:
+                # Fresh results arrive in the order of `to_analyze`.
+                analysis_result = next(fresh_results)
+                key = keys.get(analysis_result.path)
+                if self.result_cache and key:
+                    self.result_cache.put(analysis_result.path, key, analysis_result)
+            yield analysis_result, self._extract_conflicts(analysis_result)
+
     def analyze_paths(
         self, file_paths: List[str]
     ) -> Tuple[List[AnalysisFileCheckResult], List[InteractionContext]]:
         all_results: List[AnalysisFileCheckResult] = []
         all_conflicts: List[InteractionContext] = []
-
-        for file_path in file_paths:
-            subject = IndexCheckSubjectAdapter(
-                file_path,
-                self.index_store,
-                self.doc_manager,
-                self.lock_manager,
-                self.uri_generator,
-                self.workspace,
-                self.root_path,
-            )
-            analysis_result = self.engine.analyze(subject)
-            conflicts = self._extract_conflicts(analysis_result)
+        for analysis_result, conflicts in self.iter_analyze_paths(file_paths):
             all_results.append(analysis_result)
             all_conflicts.extend(conflicts)
-
         return all_results, all_conflicts
 
+    def save_result_cache(self, prune: bool = True) -> None:
+        if self.result_cache:
+            self.result_cache.save(prune=prune)
+
     def analyze_batch(
-        self, modules: List[ModuleDef]
+        self, modules: List[ModuleDef], docs_out: Optional[DocsByPath] = None
     ) -> Tuple[List[AnalysisFileCheckResult], List[InteractionContext]]:
         all_results: List[AnalysisFileCheckResult] = []
         all_conflicts: List[InteractionContext] = []
 
+        # Sidecar docs and hashes, locks and fingerprints are loaded once for
+        # the whole batch and shared by its subjects.
+        docs_by_path, hashes_by_path = self.doc_manager.load_docs_with_hashes_for_paths(
+            [m.file_path for m in modules]
+        )
+        fingerprint_strategy = FingerprintCache(self.fingerprint_strategy)
+        locks: Dict[Path, Dict[str, Fingerprint]] = {}
+
         for module in modules:
+            lock_data: Dict[str, Fingerprint] = {}
+            if module.file_path:
+                package_root = self.workspace.find_owning_package(
+                    self.root_path / module.file_path
+                )
+                if package_root not in locks:
+                    locks[package_root] = self.lock_manager.load(package_root)
+                lock_data = locks[package_root]
+
             subject = ASTCheckSubjectAdapter(
                 module,
                 self.doc_manager,
                 self.lock_manager,
                 self.uri_generator,
                 self.workspace,
-                self.fingerprint_strategy,
+                fingerprint_strategy,
                 self.root_path,
+                yaml_docs=docs_by_path.get(module.file_path, {}),
+                yaml_hashes=hashes_by_path.get(module.file_path, {}),
+                lock_data=lock_data,
             )
             analysis_result = self.engine.analyze(subject)
+            if docs_out is not None and analysis_result.violations:
+                docs_out[module.file_path] = docs_by_path.get(module.file_path, {})
             conflicts = self._extract_conflicts(analysis_result)
             all_results.append(analysis_result)
             all_conflicts.extend(conflicts)
@@ -122,9 +246,15 @@ class CheckRunner:
         return all_results, all_conflicts
 
     def auto_reconcile_docs(
-        self, results: List[AnalysisFileCheckResult], modules: List[ModuleDef]
+        self,
+        results: List[AnalysisFileCheckResult],
+        modules: List[ModuleDef],
+        docs_by_path: Optional[DocsByPath] = None,
     ):
-        self.resolver.auto_reconcile_docs(results, modules)
+        if docs_by_path is None:
+            self.resolver.auto_reconcile_docs(results, modules)
+        else:
+            self.resolver.auto_reconcile_docs(results, modules, docs_by_path)
 
     def resolve_conflicts(
         self,
@@ -133,9 +263,14 @@ class CheckRunner:
         tm: "TransactionManager",
         force_relink: bool = False,
         reconcile: bool = False,
+        docs_by_path: Optional[DocsByPath] = None,
     ) -> bool:
+        if docs_by_path is None:
+            return self.resolver.resolve_conflicts(
+                results, conflicts, tm, force_relink, reconcile
+            )
         return self.resolver.resolve_conflicts(
-            results, conflicts, tm, force_relink, reconcile
+            results, conflicts, tm, force_relink, reconcile, docs_by_path
         )
 
     def reformat_all(self, modules: List[ModuleDef]):
@@ -147,3 +282,28 @@ class CheckRunner:
         arch_violations: List[Violation],
     ) -> bool:
         return self.reporter.report(file_results, arch_violations)
+
+    # --- Streaming reporting: files are reported as soon as they are resolved ---
+    def begin_report(self, writer: Optional[CheckResultWriter] = None) -> None:
+        self.reporter.reset()
+        self.reporter.writer = writer
+
+    @property
+    def resolves_interactively(self) -> bool:
+        return self.resolver.interaction_handler is not None
+
+    def report_files(self, file_results: List[AnalysisFileCheckResult]) -> None:
+        for res in file_results:
+            self.reporter.report_file(res)
+
+    @property
+    def reported_error_count(self) -> int:
+        return self.reporter.error_count
+
+    def finish_report(
+        self, arch_violations: List[Violation], stopped_early: bool = False
+    ) -> bool:
+        return self.reporter.finish(arch_violations, stopped_early)
+
+    def report_summary(self) -> Dict[str, Any]:
+        return self.reporter.summary()
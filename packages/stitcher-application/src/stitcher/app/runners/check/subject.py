@@ -1,6 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from stitcher.spec import (
+    DocstringIR,
     ModuleDef,
     Fingerprint,
     FingerprintStrategyProtocol,
@@ -25,6 +26,9 @@ class IndexCheckSubjectAdapter(CheckSubject):
         uri_generator: URIGeneratorProtocol,
         workspace: Workspace,
         root_path: Path,
+        symbols: Optional[List[SymbolRecord]] = None,
+        yaml_docs: Optional[Dict[str, DocstringIR]] = None,
+        yaml_hashes: Optional[Dict[str, str]] = None,
     ):
         self._file_path = file_path
         self._index_store = index_store
@@ -33,12 +37,28 @@ class IndexCheckSubjectAdapter(CheckSubject):
         self._uri_generator = uri_generator
         self._workspace = workspace
         self._root_path = root_path
+        # Either prefetched in bulk by the caller or loaded on first use.
+        self._symbols = symbols
+        self._yaml_docs = yaml_docs
+        # Hashes stored in the index when the sidecar was indexed; any doc
+        # missing here is hashed on the spot.
+        self._yaml_hashes = yaml_hashes or {}
         self._cached_states: Optional[Dict[str, SymbolState]] = None
 
     @property
     def file_path(self) -> str:
         return self._file_path
 
+    def _get_symbols(self) -> List[SymbolRecord]:
+        if self._symbols is None:
+            self._symbols = self._index_store.get_symbols_by_file_path(self.file_path)
+        return self._symbols
+
+    def _get_yaml_docs(self) -> Dict[str, DocstringIR]:
+        if self._yaml_docs is None:
+            self._yaml_docs = self._doc_manager.load_docs_for_path(self.file_path)
+        return self._yaml_docs
+
     @property
     def is_tracked(self) -> bool:
         return (
@@ -51,7 +71,7 @@ class IndexCheckSubjectAdapter(CheckSubject):
         return not any(p.startswith("_") and p != "__doc__" for p in parts)
 
     def is_documentable(self) -> bool:
-        symbols = self._index_store.get_symbols_by_file_path(self.file_path)
+        symbols = self._get_symbols()
         if not symbols:
             return False
 
@@ -67,19 +87,20 @@ class IndexCheckSubjectAdapter(CheckSubject):
             return self._cached_states
 
         # 1. Load data from all sources
-        symbols_from_db = self._index_store.get_symbols_by_file_path(self.file_path)
-        yaml_docs = self._doc_manager.load_docs_for_path(self.file_path)
+        symbols_from_db = self._get_symbols()
+        yaml_docs = self._get_yaml_docs()
 
-        # Load Lock Data
+        # Load Lock Data (only this file's entries)
         abs_path = self._root_path / self.file_path
         pkg_root = self._workspace.find_owning_package(abs_path)
-        lock_data = self._lock_manager.load(pkg_root)
-
-        # Prepare coordinates
         ws_rel_path = self._workspace.to_workspace_relative(abs_path)
+        lock_data = self._lock_manager.load(
+            pkg_root, [self._uri_generator.generate_file_uri(ws_rel_path)]
+        )
 
         yaml_content_hashes = {
-            fqn: self._doc_manager.compute_ir_hash(ir) for fqn, ir in yaml_docs.items()
+            fqn: self._yaml_hashes.get(fqn) or self._doc_manager.compute_ir_hash(ir)
+            for fqn, ir in yaml_docs.items()
         }
 
         # 2. Map symbols for easy lookup
@@ -147,6 +168,9 @@ class ASTCheckSubjectAdapter(CheckSubject):
         workspace: Workspace,
         fingerprint_strategy: FingerprintStrategyProtocol,
         root_path: Path,
+        yaml_docs: Optional[Dict[str, DocstringIR]] = None,
+        yaml_hashes: Optional[Dict[str, str]] = None,
+        lock_data: Optional[Dict[str, Fingerprint]] = None,
     ):
         self._module = module_def
         self._doc_manager = doc_manager
@@ -155,6 +179,10 @@ class ASTCheckSubjectAdapter(CheckSubject):
         self._workspace = workspace
         self._fingerprint_strategy = fingerprint_strategy
         self._root_path = root_path
+        # Either prefetched for a whole batch by the caller or loaded on use.
+        self._yaml_docs = yaml_docs
+        self._yaml_hashes = yaml_hashes
+        self._lock_data = lock_data
         self._cached_states: Optional[Dict[str, SymbolState]] = None
 
     @property
@@ -188,7 +216,9 @@ class ASTCheckSubjectAdapter(CheckSubject):
 
         # 1. Load all necessary data from various sources
         source_docs = self._doc_manager.flatten_module_docs(self._module)
-        yaml_docs = self._doc_manager.load_docs_for_module(self._module)
+        yaml_docs = self._yaml_docs
+        if yaml_docs is None:
+            yaml_docs = self._doc_manager.load_docs_for_module(self._module)
         public_fqns = self._module.get_public_documentable_fqns()
         code_fqns = set(self._module.get_all_fqns())
         # The module docstring key is always valid/present in code context,
@@ -196,16 +226,19 @@ class ASTCheckSubjectAdapter(CheckSubject):
         code_fqns.add("__doc__")
 
         fingerprints = self._compute_fingerprints()
-        yaml_hashes = self._doc_manager.compute_yaml_content_hashes(self._module)
+        yaml_hashes = self._yaml_hashes
+        if yaml_hashes is None:
+            yaml_hashes = self._doc_manager.compute_yaml_content_hashes(self._module)
 
         # Load Lock Data
-        lock_data = {}
+        lock_data = self._lock_data or {}
         ws_rel_path = ""
 
         if self._module.file_path:
             abs_path = self._root_path / self.file_path
-            pkg_root = self._workspace.find_owning_package(abs_path)
-            lock_data = self._lock_manager.load(pkg_root)
+            if self._lock_data is None:
+                pkg_root = self._workspace.find_owning_package(abs_path)
+                lock_data = self._lock_manager.load(pkg_root)
             ws_rel_path = self._workspace.to_workspace_relative(abs_path)
 
         # Note: We rely on code and yaml to drive the loop. Stored hashes are looked up.
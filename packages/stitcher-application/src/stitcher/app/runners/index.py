@@ -1,26 +1,81 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple
+
 from stitcher.common.bus import bus
 from needle.pointer import L
 from stitcher.index.db import DatabaseManager
 from stitcher.index.indexer import FileIndexer
 from stitcher.workspace import Workspace
-from typing import Dict, Any
+
+log = logging.getLogger(__name__)
+
+# index_meta key holding the git state of the last successful build.
+GIT_SNAPSHOT_KEY = "git_snapshot"
+
+# HEAD commit and the files differing from it (incl. untracked).
+_GitState = Tuple[str, Set[str]]
 
 
 class IndexRunner:
-    def __init__(self, db_manager: DatabaseManager, indexer: FileIndexer):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        indexer: FileIndexer,
+        change_detection: str = "scan",
+    ):
         self.db_manager = db_manager
         self.indexer = indexer
+        if change_detection not in ("scan", "git"):
+            log.warning(
+                f"Unknown index change_detection '{change_detection}', using 'scan'."
+            )
+            change_detection = "scan"
+        self.change_detection = change_detection
 
-    def run_build(self, workspace: Workspace) -> Dict[str, Any]:
+    def run_build(
+        self, workspace: Workspace, max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         # Ensure DB is initialized (schema created)
         self.db_manager.initialize()
 
-        # Discover files using the workspace
-        files_to_index = workspace.discover_files()
+        bus.info(L.index.run.start)
+        # Captured before indexing so that edits made while it runs are
+        # re-checked by the next build.
+        git_state = (
+            self._capture_git_state(workspace)
+            if self.change_detection == "git"
+            else None
+        )
+
+        stats = None
+        if git_state:
+            stats = self._index_git_delta(workspace, git_state, max_workers)
+
+        if stats is None:
+            # Discover files using the workspace
+            files_to_index = workspace.discover_files()
+            stats = self.indexer.index_files(files_to_index, max_workers=max_workers)
+
+        self._save_git_snapshot(workspace, git_state, stats)
+        return self._report(stats)
+
+    def run_paths(self, workspace: Workspace, paths: Set[str]) -> Dict[str, Any]:
+        # Incremental build for a caller that knows which paths were added,
+        # changed or removed since the index was last built (e.g. a watcher).
+        self.db_manager.initialize()
 
         bus.info(L.index.run.start)
-        stats = self.indexer.index_files(files_to_index)
+        present = workspace.filter_discoverable(paths)
+        if present is None:
+            present = {p for p in paths if (workspace.root_path / p).is_file()}
+        stats = self.indexer.index_files(present, scope=paths)
+        # The git snapshot has not seen these changes.
+        self._save_git_snapshot(workspace, None, stats)
+        return self._report(stats)
 
+    def _report(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         bus.success(
             L.index.run.complete,
             added=stats["added"],
@@ -45,3 +100,78 @@ class IndexRunner:
 
         stats["success"] = True
         return stats
+
+    def _capture_git_state(self, workspace: Workspace) -> Optional[_GitState]:
+        head = workspace.get_git_head()
+        if head is None:
+            return None
+        dirty = workspace.discover_changed_files(head)
+        return (head, dirty) if dirty is not None else None
+
+    def _index_git_delta(
+        self,
+        workspace: Workspace,
+        git_state: _GitState,
+        max_workers: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        # Returns None whenever the delta cannot be trusted; the caller then
+        # falls back to a full scan.
+        snapshot = self._load_git_snapshot()
+        if snapshot is None:
+            return None
+        if snapshot.get("extensions") != sorted(self.indexer.adapters):
+            return None
+
+        head, dirty = git_state
+        if snapshot["head"] == head:
+            changed = set(dirty)
+        else:
+            since_snapshot = workspace.discover_changed_files(snapshot["head"])
+            if since_snapshot is None:
+                return None
+            changed = since_snapshot
+        # Files that were dirty or failed to parse at the last build may have
+        # changed again (or been reverted) without git noticing.
+        changed.update(snapshot.get("pending", []))
+
+        # Ignore rules changed: files may have appeared or vanished anywhere.
+        if any(p == ".gitignore" or p.endswith("/.gitignore") for p in changed):
+            return None
+
+        present = workspace.filter_discoverable(changed)
+        if present is None:
+            return None
+        return self.indexer.index_files(present, max_workers=max_workers, scope=changed)
+
+    def _load_git_snapshot(self) -> Optional[Dict[str, Any]]:
+        raw = self.indexer.store.get_meta(GIT_SNAPSHOT_KEY)
+        if raw is None:
+            return None
+        try:
+            snapshot = json.loads(raw)
+        except ValueError:
+            return None
+        return snapshot if isinstance(snapshot, dict) and "head" in snapshot else None
+
+    def _save_git_snapshot(
+        self,
+        workspace: Workspace,
+        git_state: Optional[_GitState],
+        stats: Dict[str, Any],
+    ) -> None:
+        if git_state is None:
+            # A stale snapshot must never be used after builds it did not see.
+            self.indexer.store.set_meta(GIT_SNAPSHOT_KEY, None)
+            return
+
+        head, dirty = git_state
+        pending = set(dirty)
+        for abs_path, _ in stats["error_details"]:
+            pending.add(workspace.to_workspace_relative(Path(abs_path)))
+
+        snapshot = {
+            "head": head,
+            "pending": sorted(pending),
+            "extensions": sorted(self.indexer.adapters),
+        }
+        self.indexer.store.set_meta(GIT_SNAPSHOT_KEY, json.dumps(snapshot))
@@ -75,7 +75,7 @@ class RefactorRunner:
                 L.debug.log.refactor_workspace_paths, paths=workspace.get_search_paths()
             )
             sidecar_manager = SidecarManager(self.root_path)
-            lock_manager = LockFileManager()
+            lock_manager = LockFileManager(self.root_path, self.index_store)
             graph = SemanticGraph(workspace, self.index_store)
 
             graph.load_from_workspace()
@@ -0,0 +1,27 @@
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from stitcher.workspace import load_config_from_path
+
+
+class DocstringStyleResolver:
+    def __init__(self, root_path: Path):
+        self.root_path = root_path
+        self._entries: Optional[List[Tuple[Path, str]]] = None
+
+    def __call__(self, rel_path: Path) -> Optional[str]:
+        if self._entries is None:
+            configs, _ = load_config_from_path(self.root_path)
+            entries = [
+                (Path(scan_path), config.docstring_style)
+                for config in configs
+                for scan_path in config.scan_paths
+            ]
+            # Most specific scan path first.
+            entries.sort(key=lambda entry: len(entry[0].parts), reverse=True)
+            self._entries = entries
+
+        for scan_path, style in self._entries:
+            if rel_path == scan_path or scan_path in rel_path.parents:
+                return style
+        return None
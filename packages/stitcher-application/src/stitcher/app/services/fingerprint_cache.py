@@ -0,0 +1,57 @@
+from typing import Dict, Hashable, Tuple, Union
+
+from stitcher.spec import (
+    ClassDef,
+    Fingerprint,
+    FingerprintStrategyProtocol,
+    FunctionDef,
+)
+
+_StructureKey = Tuple[Hashable, ...]
+
+
+def _function_key(func: FunctionDef) -> _StructureKey:
+    return (
+        "function",
+        func.name,
+        tuple((arg.name, arg.kind, arg.annotation, arg.default) for arg in func.args),
+        func.return_annotation,
+        tuple(func.decorators),
+        func.docstring,
+        func.is_async,
+        func.is_static,
+        func.is_class,
+    )
+
+
+def _structure_key(entity: Union[FunctionDef, ClassDef]) -> _StructureKey:
+    # Every field a strategy may read, except the source location (and the
+    # docstring IR, which is derived from the docstring).
+    if isinstance(entity, FunctionDef):
+        return _function_key(entity)
+    return (
+        "class",
+        entity.name,
+        tuple(entity.bases),
+        tuple(entity.decorators),
+        entity.docstring,
+        tuple(
+            (attr.name, attr.annotation, attr.value, attr.docstring, attr.alias_target)
+            for attr in entity.attributes
+        ),
+        tuple(_function_key(method) for method in entity.methods),
+    )
+
+
+class FingerprintCache(FingerprintStrategyProtocol):
+    def __init__(self, strategy: FingerprintStrategyProtocol):
+        self.strategy = strategy
+        self._fingerprints: Dict[_StructureKey, Fingerprint] = {}
+
+    def compute(self, entity: Union[FunctionDef, ClassDef]) -> Fingerprint:
+        key = _structure_key(entity)
+        fingerprint = self._fingerprints.get(key)
+        if fingerprint is None:
+            fingerprint = self.strategy.compute(entity)
+            self._fingerprints[key] = fingerprint
+        return fingerprint
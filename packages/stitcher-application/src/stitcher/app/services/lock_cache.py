@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+
+from stitcher.spec import Fingerprint, LockManagerProtocol
+
+
+class LockCache(LockManagerProtocol):
+    def __init__(self, lock_manager: LockManagerProtocol):
+        self.lock_manager = lock_manager
+        # Package root -> parsed stitcher.lock. Shared by every reader of a run.
+        self._locks: Dict[Path, Dict[str, Fingerprint]] = {}
+        # The same, grouped by file URI once partial loads hit a cached lock.
+        self._by_file: Dict[Path, Dict[str, Dict[str, Fingerprint]]] = {}
+
+    def load(
+        self, package_root: Path, file_uris: Optional[Iterable[str]] = None
+    ) -> Dict[str, Fingerprint]:
+        if file_uris is not None:
+            by_file = self._by_file.get(package_root)
+            if by_file is None:
+                if package_root not in self._locks:
+                    # Answered by the wrapped manager (e.g. from the index).
+                    return self.lock_manager.load(package_root, file_uris)
+                by_file = self._group_by_file(package_root)
+            result: Dict[str, Fingerprint] = {}
+            for file_uri in file_uris:
+                result.update(by_file.get(file_uri, {}))
+            return result
+
+        data = self._locks.get(package_root)
+        if data is None:
+            data = self.lock_manager.load(package_root)
+            self._locks[package_root] = data
+        return data
+
+    def _group_by_file(self, package_root: Path) -> Dict[str, Dict[str, Fingerprint]]:
+        by_file: Dict[str, Dict[str, Fingerprint]] = {}
+        for suri, fp in self._locks[package_root].items():
+            by_file.setdefault(suri.partition("#")[0], {})[suri] = fp
+        self._by_file[package_root] = by_file
+        return by_file
+
+    def save(self, package_root: Path, data: Dict[str, Fingerprint]) -> None:
+        self.lock_manager.save(package_root, data)
+        self.invalidate(package_root)
+
+    def serialize(self, data: Dict[str, Fingerprint]) -> str:
+        return self.lock_manager.serialize(data)
+
+    def serialize_changes(
+        self, package_root: Path, changes: Mapping[str, Optional[Fingerprint]]
+    ) -> str:
+        return self.lock_manager.serialize_changes(package_root, changes)
+
+    def invalidate(self, package_root: Path) -> None:
+        self._locks.pop(package_root, None)
+        self._by_file.pop(package_root, None)
+
+    def clear(self) -> None:
+        self._locks.clear()
+        self._by_file.clear()
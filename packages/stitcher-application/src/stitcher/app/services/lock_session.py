@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from stitcher.spec import (
     LockManagerProtocol,
@@ -28,15 +28,29 @@ class LockSession:
         self.root_path = root_path
         self.uri_generator = uri_generator
 
-        # Buffer: Package Root -> {SURI -> Fingerprint}
-        # We load locks lazily (on first access to a package).
-        self._locks: Dict[Path, Dict[str, Fingerprint]] = {}
+        # Buffer: Package Root -> {SURI -> Fingerprint, or None when purged}
+        # Only changed entries are buffered.
+        self._changes: Dict[Path, Dict[str, Optional[Fingerprint]]] = {}
+        # File URI -> its committed lock entries, loaded per file on first use.
+        self._baselines: Dict[str, Dict[str, Fingerprint]] = {}
 
-    def _get_lock_data(self, abs_file_path: Path) -> Dict[str, Fingerprint]:
+    def _get_changes(
+        self, abs_file_path: Path
+    ) -> Tuple[Path, Dict[str, Optional[Fingerprint]]]:
         pkg_root = self.workspace.find_owning_package(abs_file_path)
-        if pkg_root not in self._locks:
-            self._locks[pkg_root] = self.lock_manager.load(pkg_root)
-        return self._locks[pkg_root]
+        return pkg_root, self._changes.setdefault(pkg_root, {})
+
+    def _get_fingerprint(
+        self, pkg_root: Path, changes: Dict[str, Optional[Fingerprint]], suri: str
+    ) -> Optional[Fingerprint]:
+        if suri in changes:
+            return changes[suri]
+        file_uri = suri.partition("#")[0]
+        baseline = self._baselines.get(file_uri)
+        if baseline is None:
+            baseline = self.lock_manager.load(pkg_root, [file_uri])
+            self._baselines[file_uri] = baseline
+        return baseline.get(suri)
 
     def _get_suri(self, module: ModuleDef, fqn: str) -> str:
         abs_path = self.root_path / module.file_path
@@ -54,11 +68,12 @@ class LockSession:
             return
 
         abs_path = self.root_path / module.file_path
-        lock_data = self._get_lock_data(abs_path)
+        pkg_root, changes = self._get_changes(abs_path)
         suri = self._get_suri(module, fqn)
 
-        # Get existing fingerprint or create new
-        fp = lock_data.get(suri) or Fingerprint()
+        # Copy the existing fingerprint (if any) instead of mutating it in place
+        existing = self._get_fingerprint(pkg_root, changes, suri)
+        fp = Fingerprint.from_dict(existing.to_dict()) if existing else Fingerprint()
 
         # 1. Update Code Baseline
         if code_fingerprint:
@@ -76,7 +91,7 @@ class LockSession:
             yaml_hash = self.doc_manager.compute_ir_hash(doc_ir)
             fp["baseline_yaml_content_hash"] = yaml_hash
 
-        lock_data[suri] = fp
+        changes[suri] = fp
 
     def record_relink(self, module: ModuleDef, fqn: str, code_fingerprint: Fingerprint):
         self.record_fresh_state(
@@ -88,15 +103,19 @@ class LockSession:
             return
 
         abs_path = self.root_path / module.file_path
-        lock_data = self._get_lock_data(abs_path)
+        pkg_root, changes = self._get_changes(abs_path)
         suri = self._get_suri(module, fqn)
 
-        if suri in lock_data:
-            del lock_data[suri]
+        if self._get_fingerprint(pkg_root, changes, suri) is not None:
+            changes[suri] = None
 
     def commit_to_transaction(self, tm: TransactionManager):
-        for pkg_root, lock_data in self._locks.items():
-            content = self.lock_manager.serialize(lock_data)
+        for pkg_root, changes in self._changes.items():
+            if not changes:
+                continue
+            # Only the changed entries are rewritten; the rest of the lock is
+            # carried over line by line.
+            content = self.lock_manager.serialize_changes(pkg_root, changes)
             lock_path = pkg_root / "stitcher.lock"
             try:
                 # Ensure we write relative to root_path for TransactionManager
@@ -107,4 +126,5 @@ class LockSession:
                 pass
 
     def clear(self):
-        self._locks.clear()
+        self._changes.clear()
+        self._baselines.clear()
@@ -43,3 +43,190 @@ def test_check_hits_index_cache_on_second_run(tmp_path, monkeypatch):
 
     # 7. Assert (Cache Miss): The re-parse method was called this time
     mock_parse.assert_called_once()
+
+
+def test_check_parses_each_lock_file_once_per_run(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path)
+    project_root = (
+        factory.with_config({"scan_paths": ["src"]})
+        .with_source("src/a.py", 'def a():\n    """Doc a."""\n')
+        .with_source("src/b.py", 'def b():\n    """Doc b."""\n')
+        .with_source("src/c.py", 'def c():\n    """Doc c."""\n')
+        .build()
+    )
+    app = create_test_app(project_root)
+    app.run_init()
+
+    from stitcher.lang.sidecar.lock_manager import LockFileManager
+
+    spy_read = mocker.spy(LockFileManager, "_read_text")
+    assert app.run_check()
+    # Every lock slice is answered by the index's mirror of the lock.
+    assert spy_read.call_count == 0
+
+    # A new run sees lock changes made in between.
+    (project_root / "src/a.py").write_text('def a(x):\n    """Doc a."""\n')
+    assert app.run_check(force_relink=True)
+    # Read once, to apply the relinked entries.
+    assert spy_read.call_count == 1
+    assert app.run_check()
+    assert spy_read.call_count == 1
+
+
+def test_check_loads_symbols_and_docs_in_bulk(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    for name in "abcde":
+        factory.with_source(f"src/{name}.py", f'def {name}():\n    """Doc."""\n')
+    project_root = factory.build()
+    app = create_test_app(project_root)
+    app.run_init()
+
+    spy_single = mocker.spy(app.index_store, "get_symbols_by_file_path")
+    spy_bulk = mocker.spy(app.index_store, "get_symbols_by_file_paths")
+    assert app.run_check()
+
+    spy_single.assert_not_called()
+    # One query for the source files, one for their sidecars.
+    assert spy_bulk.call_count == 2
+
+
+def test_check_reuses_doc_hashes_stored_in_index(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path)
+    project_root = (
+        factory.with_config({"scan_paths": ["src"], "docstring_style": "google"})
+        .with_source("src/a.py", 'def a(x):\n    """Doc a."""\n')
+        .build()
+    )
+    app = create_test_app(project_root)
+    app.run_init()
+    app.ensure_index_fresh()
+
+    fragments = [
+        s
+        for s in app.index_store.get_symbols_by_file_path("src/a.stitcher.yaml")
+        if s.kind == "doc_fragment"
+    ]
+    assert fragments
+    assert all(s.docstring_hash.startswith("google:") for s in fragments)
+
+    from stitcher.lang.sidecar.manager import DocumentManager
+
+    spy_hash = mocker.spy(DocumentManager, "compute_ir_hash")
+    assert app.run_check()
+    spy_hash.assert_not_called()
+
+
+def test_check_rehashes_docs_stored_for_another_style(tmp_path):
+    factory = WorkspaceFactory(tmp_path)
+    project_root = (
+        factory.with_config({"scan_paths": ["src"]})
+        .with_source("src/a.py", 'def a():\n    """Doc a."""\n')
+        .build()
+    )
+    app = create_test_app(project_root)
+    app.run_init()
+    app.ensure_index_fresh()
+
+    # The index holds raw-style hashes; under another style they are ignored.
+    from stitcher.lang.python.docstring import (
+        get_docstring_codec,
+        get_docstring_serializer,
+    )
+
+    parser, _ = get_docstring_codec("google")
+    app.doc_manager.set_strategy(parser, get_docstring_serializer("google"), "google")
+    docs, hashes = app.doc_manager.load_docs_with_hashes_for_paths(["src/a.py"])
+    assert hashes["src/a.py"] == {
+        fqn: app.doc_manager.compute_ir_hash(ir) for fqn, ir in docs["src/a.py"].items()
+    }
+
+
+def test_check_replays_results_of_unchanged_files(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    factory.with_source("src/a.py", 'def a():\n    """Doc a."""\n')
+    factory.with_source("src/b.py", 'def b():\n    """Doc b."""\n')
+    factory.with_source("src/untracked.py", "def c(): pass\n")
+    project_root = factory.build()
+    app = create_test_app(project_root)
+    app.run_init()
+    (project_root / "src/untracked.py").write_text('def c():\n    """Doc c."""\n')
+
+    from stitcher.analysis.engines.consistency.engine import ConsistencyEngine
+
+    spy_analyze = mocker.spy(ConsistencyEngine, "analyze")
+    first = app.run_check()
+    assert spy_analyze.call_count == 3
+    assert (project_root / ".stitcher/cache/check.json").exists()
+
+    # Nothing changed: every result is replayed, with the same outcome.
+    spy_analyze.reset_mock()
+    assert app.run_check() == first
+    spy_analyze.assert_not_called()
+
+    # Only the edited file is analyzed again.
+    (project_root / "src/a.stitcher.yaml").write_text('"a": |-\n  New doc a.\n')
+    app.run_check()
+    assert [c.args[1].file_path for c in spy_analyze.call_args_list] == ["src/a.py"]
+
+
+def test_check_reconciles_with_docs_loaded_during_analysis(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    for name in "abc":
+        factory.with_source(f"src/{name}.py", f'def {name}():\n    """Doc."""\n')
+    project_root = factory.build()
+    app = create_test_app(project_root)
+    app.run_init()
+    for name in "abc":
+        (project_root / f"src/{name}.py").write_text(f"def {name}():\n    pass\n")
+        (project_root / f"src/{name}.stitcher.yaml").write_text(
+            f'"{name}": |-\n  New doc.\n'
+        )
+
+    from stitcher.lang.sidecar.manager import DocumentManager
+
+    spy_single = mocker.spy(DocumentManager, "load_docs_for_path")
+    spy_record = mocker.spy(app.lock_session, "record_fresh_state")
+    assert app.run_check()
+
+    # Every doc update was reconciled without reading a sidecar again.
+    assert spy_record.call_count == 3
+    spy_single.assert_not_called()
+
+
+def test_check_cache_keys_load_only_the_lock_slices_in_play(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    factory.with_source("src/a.py", 'def a():\n    """Doc a."""\n')
+    factory.with_source("src/b.py", 'def b():\n    """Doc b."""\n')
+    project_root = factory.build()
+    app = create_test_app(project_root)
+    app.run_init()
+    app.run_check()
+
+    from stitcher.lang.sidecar.lock_manager import LockFileManager
+
+    spy_load = mocker.spy(LockFileManager, "load")
+    spy_read = mocker.spy(LockFileManager, "_read_text")
+    assert app.run_check()
+
+    # Every result is replayed; the keys only need the files' lock slices,
+    # which the index answers without reading stitcher.lock.
+    assert [c.args[2] for c in spy_load.call_args_list] == [
+        ["py://src/a.py", "py://src/b.py"]
+    ]
+    spy_read.assert_not_called()
+
+
+def test_cache_directory_is_ignored_by_git(tmp_path):
+    factory = WorkspaceFactory(tmp_path)
+    project_root = (
+        factory.with_config({"scan_paths": ["src"]})
+        .with_source("src/main.py", 'def func():\n    """Doc."""\n')
+        .build()
+    )
+    app = create_test_app(project_root)
+    app.run_init()
+    app.run_check()
+
+    cache_dir = project_root / ".stitcher" / "cache"
+    assert (cache_dir / "check.json").exists()
+    assert (cache_dir / ".gitignore").read_text(encoding="utf-8") == "*\n"
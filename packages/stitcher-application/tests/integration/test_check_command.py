@@ -1,3 +1,5 @@
+import pytest
+
 from stitcher.test_utils import create_test_app
 from needle.pointer import L
 from stitcher.test_utils import SpyBus, WorkspaceFactory
@@ -163,3 +165,158 @@ def test_check_command_detects_circular_dependency(
     assert "packages/pkg-a/src/pkg_a/mod_a.py" in cycle_str
     assert "packages/pkg-a/src/pkg_a/mod_b.py" in cycle_str
     assert "packages/pkg-a/src/pkg_a/mod_c.py" in cycle_str
+
+
+def test_check_stops_after_max_errors(tmp_path, monkeypatch, mocker, spy_bus: SpyBus):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    for name in "abc":
+        factory.with_source(f"src/{name}.py", f'def {name}():\n    """Doc."""\n')
+    project_root = factory.build()
+    app = create_test_app(root_path=project_root)
+    app.run_init()
+    for name in "abc":
+        # Signature drift in every file.
+        (project_root / f"src/{name}.py").write_text(
+            f'def {name}(x):\n    """Doc."""\n'
+        )
+
+    # All three files share one chunk; the run stops right after the first.
+    spy_report = mocker.spy(app.check_runner, "report_files")
+    with spy_bus.patch(monkeypatch, "stitcher.common.bus"):
+        success = app.run_check(max_errors=1)
+
+    assert success is False
+    assert spy_report.call_count == 1
+    spy_bus.assert_id_called(L.check.run.stopped_early, level="error")
+    failed = [m for m in spy_bus.get_messages() if m["id"] == str(L.check.file.fail)]
+    assert len(failed) == 1
+
+
+def test_check_writes_jsonl_and_sarif_results(tmp_path):
+    import json
+
+    factory = WorkspaceFactory(tmp_path / "proj").with_config({"scan_paths": ["src"]})
+    project_root = (
+        factory.with_source("src/main.py", "def func(): pass\n")
+        .with_docs("src/main.stitcher.yaml", {"func": "Doc", "gone": "Old"})
+        .build()
+    )
+    app = create_test_app(root_path=project_root)
+
+    jsonl_path = tmp_path / "out" / "check.jsonl"
+    assert app.run_check(output_format="jsonl", output_path=jsonl_path) is False
+    records = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["success"] is False
+    violations = [r for r in records if r["type"] == "violation"]
+    assert any(
+        r["file"] == "src/main.py"
+        and r["fqn"] == "gone"
+        and r["kind"] == str(L.check.issue.extra)
+        and r["level"] == "error"
+        for r in violations
+    )
+
+    sarif_path = tmp_path / "out" / "check.sarif"
+    assert app.run_check(output_format="sarif", output_path=sarif_path) is False
+    sarif = json.loads(sarif_path.read_text())
+    assert sarif["version"] == "2.1.0"
+    results = sarif["runs"][0]["results"]
+    assert len(results) == len(violations)
+    assert {r["ruleId"] for r in results} == {r["kind"] for r in violations}
+    assert all(
+        r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]
+        == "src/main.py"
+        for r in results
+    )
+
+
+def test_check_output_is_complete_when_run_raises(tmp_path, mocker):
+    import json
+
+    factory = WorkspaceFactory(tmp_path / "proj").with_config({"scan_paths": ["src"]})
+    project_root = (
+        factory.with_source("src/main.py", "def func(): pass\n")
+        .with_docs("src/main.stitcher.yaml", {"func": "Doc", "gone": "Old"})
+        .build()
+    )
+    app = create_test_app(root_path=project_root)
+    mocker.patch.object(
+        app.architecture_engine, "analyze", side_effect=RuntimeError("boom")
+    )
+
+    sarif_path = tmp_path / "out" / "check.sarif"
+    with pytest.raises(RuntimeError):
+        app.run_check(output_format="sarif", output_path=sarif_path)
+
+    sarif = json.loads(sarif_path.read_text())
+    invocation = sarif["runs"][0]["invocations"][0]
+    assert invocation["executionSuccessful"] is False
+    assert invocation["properties"]["success"] is False
+    # Files reported before the failure are kept.
+    assert sarif["runs"][0]["results"]
+
+
+def test_check_changed_since_scopes_files_and_architecture(tmp_path, mocker):
+    import subprocess
+
+    def commit():
+        subprocess.run(["git", "add", "-A"], cwd=project_root, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "c"], cwd=project_root, check=True)
+
+    factory = WorkspaceFactory(tmp_path).init_git().with_config({"scan_paths": ["src"]})
+    for name in "abc":
+        factory.with_source(f"src/{name}.py", f'def {name}():\n    """Doc."""\n')
+    project_root = factory.with_raw_file(".gitignore", ".stitcher/\n").build()
+    app = create_test_app(root_path=project_root)
+    app.run_init()
+    assert app.run_check() is True
+    commit()
+
+    # b.py drifts but is committed; a.py drifts and c's sidecar gains a key.
+    (project_root / "src/b.py").write_text('def b(x):\n    """Doc."""\n')
+    commit()
+    (project_root / "src/a.py").write_text('def a(x):\n    """Doc."""\n')
+    with (project_root / "src/c.stitcher.yaml").open("a") as f:
+        f.write('"gone": |-\n  Old\n')
+
+    spy_analyze = mocker.spy(app.check_runner, "iter_analyze_paths")
+    spy_arch = mocker.spy(app.architecture_engine, "analyze")
+    assert app.run_check(changed_since="HEAD") is False
+    checked = {p for call in spy_analyze.call_args_list for p in call.args[0]}
+    assert checked == {"src/a.py", "src/c.py"}
+    # The dependency graph is the one the full run already checked.
+    spy_arch.assert_not_called()
+
+    # `files` scopes the same way; a new file changes the graph.
+    (project_root / "src/d.py").write_text("def d(): pass\n")
+    spy_analyze.reset_mock()
+    app.run_check(files=[project_root / "src/d.py"])
+    checked = {p for call in spy_analyze.call_args_list for p in call.args[0]}
+    assert checked == {"src/d.py"}
+    spy_arch.assert_called_once()
+
+
+def test_check_computes_the_graph_digest_only_after_index_changes(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    for name in "ab":
+        factory.with_source(f"src/{name}.py", f'def {name}():\n    """Doc."""\n')
+    project_root = factory.build()
+    app = create_test_app(root_path=project_root)
+    app.run_init()
+
+    spy_digest = mocker.spy(app.index_store, "_compute_dependency_graph_digest")
+    spy_arch = mocker.spy(app.architecture_engine, "analyze")
+    assert app.run_check() is True
+    assert app.run_check() is True
+    assert app.run_check(files=[project_root / "src/a.py"]) is True
+    assert spy_digest.call_count == 1
+    assert spy_arch.call_count == 2
+
+    # A new import changes the graph; the scoped run needs a fresh digest.
+    (project_root / "src/a.py").write_text(
+        'from b import b\n\n\ndef a():\n    """Doc."""\n'
+    )
+    app.run_check(files=[project_root / "src/a.py"])
+    assert spy_digest.call_count == 2
+    assert spy_arch.call_count == 3
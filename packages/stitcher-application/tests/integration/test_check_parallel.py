@@ -0,0 +1,38 @@
+from stitcher.test_utils import WorkspaceFactory, create_test_app
+
+
+def _reported(spy):
+    return [r for call in spy.call_args_list for r in call.args[0]]
+
+
+def _summary(results):
+    return sorted((r.path, str(v.kind), v.fqn) for r in results for v in r.violations)
+
+
+def test_parallel_check_matches_serial_check(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).with_config({"scan_paths": ["src"]})
+    for i in range(6):
+        factory.with_source(f"src/mod{i}.py", f'def f{i}():\n    """Doc {i}."""\n')
+    project_root = factory.build()
+    app = create_test_app(project_root)
+    app.run_init()
+
+    # Introduce drift in some files, and an untracked one.
+    (project_root / "src/mod1.py").write_text('def f1(x):\n    """Doc 1."""\n')
+    (project_root / "src/mod4.py").write_text('def f4():\n    """Changed."""\n')
+    (project_root / "src/new.py").write_text('def g():\n    """New."""\n')
+
+    # Both runs must really analyze every file.
+    app.check_runner.result_cache = None
+    spy_report = mocker.spy(app.check_runner, "report_files")
+    serial_success = app.run_check()
+    serial_results = _reported(spy_report)
+
+    spy_report.reset_mock()
+    parallel_success = app.run_check(jobs=2)
+    parallel_results = _reported(spy_report)
+
+    assert serial_success is parallel_success is False
+    assert _summary(parallel_results) == _summary(serial_results)
+    assert [r.path for r in parallel_results] == [r.path for r in serial_results]
+    assert _summary(serial_results)
@@ -0,0 +1,185 @@
+import os
+import socket
+import stat
+import threading
+import time
+
+from stitcher.app.daemon import (
+    IndexDaemon,
+    PollingWatcher,
+    daemon_socket_path,
+    is_daemon_running,
+    request_daemon,
+)
+from stitcher.test_utils import WorkspaceFactory, create_test_app
+
+
+def _start_daemon(root_path, **kwargs):
+    started = threading.Event()
+    holder = {}
+
+    def serve():
+        # The app (and its SQLite connection) must live on the daemon thread.
+        kwargs.setdefault("poll_interval", 0.1)
+        holder["daemon"] = IndexDaemon(create_test_app(root_path), **kwargs)
+        started.set()
+        holder["daemon"].serve_forever()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    started.wait(10)
+    for _ in range(100):
+        if is_daemon_running(root_path):
+            break
+        time.sleep(0.05)
+    return thread
+
+
+def test_daemon_serves_check_requests(tmp_path):
+    factory = WorkspaceFactory(tmp_path)
+    root = (
+        factory.with_config({"scan_paths": ["src"]})
+        .with_source("src/main.py", 'def func():\n    """Doc."""\n')
+        .build()
+    )
+    assert request_daemon(root, "check") is None
+
+    thread = _start_daemon(root)
+    try:
+        messages = []
+        success = request_daemon(
+            root, "check", on_message=lambda level, msg: messages.append(level)
+        )
+        # func's docstring is not tracked in a sidecar yet.
+        assert success is False
+        assert "error" in messages or "warning" in messages
+
+        output = []
+        assert request_daemon(root, "cov", on_output=output.append) is True
+        assert "src/main.py" in "".join(output)
+
+        assert request_daemon(root, "ping") is True
+        # Only the owner may connect.
+        mode = daemon_socket_path(root).stat().st_mode
+        assert stat.S_IMODE(mode) == 0o600
+    finally:
+        assert request_daemon(root, "shutdown") is True
+        thread.join(10)
+
+    assert not thread.is_alive()
+    assert not daemon_socket_path(root).exists()
+    assert request_daemon(root, "ping") is None
+
+
+def test_daemon_rejects_unknown_commands(tmp_path):
+    root = WorkspaceFactory(tmp_path).with_source("main.py", "x = 1").build()
+    thread = _start_daemon(root)
+    try:
+        assert request_daemon(root, "rm -rf") is False
+    finally:
+        request_daemon(root, "shutdown")
+        thread.join(10)
+
+
+def test_daemon_drops_silent_clients(tmp_path):
+    root = WorkspaceFactory(tmp_path).with_source("main.py", "x = 1").build()
+    thread = _start_daemon(root, request_timeout=0.2)
+    try:
+        silent = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        silent.connect(str(daemon_socket_path(root)))
+        try:
+            # The silent client gets an error instead of blocking the loop.
+            assert request_daemon(root, "ping", connect_timeout=5) is True
+            silent.settimeout(5)
+            assert b"bad request" in silent.recv(4096)
+        finally:
+            silent.close()
+    finally:
+        request_daemon(root, "shutdown")
+        thread.join(10)
+
+
+def test_daemon_socket_falls_back_to_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    (tmp_path / "run").mkdir()
+    root = tmp_path / ("x" * 120)
+
+    path = daemon_socket_path(root)
+    assert path is not None
+    assert path.parent == tmp_path / "run" / f"stitcher-{os.getuid()}"
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+
+    # A directory others can access is not trusted.
+    path.parent.chmod(0o777)
+    assert daemon_socket_path(root) is None
+    assert request_daemon(root, "ping") is None
+
+
+def test_daemon_sees_edits_made_between_requests(tmp_path):
+    root = (
+        WorkspaceFactory(tmp_path)
+        .with_config({"scan_paths": ["src"]})
+        .with_source("src/main.py", 'def func():\n    """Doc."""\n')
+        .build()
+    )
+    create_test_app(root).run_init()
+    # No periodic polls: the request itself must pick up the edit.
+    thread = _start_daemon(root, poll_interval=60)
+    try:
+        assert request_daemon(root, "check") is True
+        (root / "src/main.py").write_text('def func(a, b):\n    """Doc."""\n')
+        assert request_daemon(root, "check") is False
+    finally:
+        request_daemon(root, "shutdown")
+        thread.join(10)
+
+
+def test_polling_watcher_reports_changed_paths(tmp_path, mocker):
+    root = (
+        WorkspaceFactory(tmp_path)
+        .with_source("src/a.py", "x = 1")
+        .with_source("src/b.py", "y = 1")
+        .with_source("README.md", "Read me.")
+        .build()
+    )
+    app = create_test_app(root)
+    watcher = PollingWatcher(app)
+    assert watcher.poll() == set()
+
+    spy_discover = mocker.spy(app.workspace, "discover_files")
+    (root / "src/a.py").write_text("x = 100")
+    (root / "README.md").write_text("Not indexed.")
+    assert watcher.poll() == {"src/a.py"}
+    # Edits in place only need a stat of the known files.
+    spy_discover.assert_not_called()
+
+    (root / "src/pkg").mkdir()
+    (root / "src/pkg/c.py").write_text("z = 1")
+    (root / "src/b.py").unlink()
+    assert watcher.poll() == {"src/b.py", "src/pkg/c.py"}
+    assert spy_discover.call_count == 1
+    assert watcher.poll() == set()
+
+
+def test_watched_app_keeps_caches_and_skips_index_builds(tmp_path, mocker):
+    root = (
+        WorkspaceFactory(tmp_path)
+        .with_config({"scan_paths": ["src"]})
+        .with_source("src/main.py", 'def func():\n    """Doc."""\n')
+        .build()
+    )
+    app = create_test_app(root)
+    app.run_init()
+    app.watch_index()
+
+    spy_build = mocker.spy(app.index_runner, "run_build")
+    spy_clear = mocker.spy(app.lock_manager, "clear")
+    assert app.run_check()
+    assert app.run_cov()
+    spy_build.assert_not_called()
+    spy_clear.assert_not_called()
+
+    (root / "src/main.py").write_text('def func(a, b):\n    """Doc."""\n')
+    app.refresh_index_paths({"src/main.py"})
+    assert not app.run_check()
+    spy_build.assert_not_called()
@@ -0,0 +1,89 @@
+import subprocess
+
+from stitcher.app.runners.index import IndexRunner
+from stitcher.index.db import DatabaseManager
+from stitcher.index.indexer import FileIndexer
+from stitcher.index.store import IndexStore
+from stitcher.test_utils import WorkspaceFactory
+from stitcher.workspace import Workspace
+
+
+def _commit(root, message="commit"):
+    subprocess.run(["git", "add", "-A"], cwd=root, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", message], cwd=root, check=True)
+
+
+def _make_runner(root):
+    db_manager = DatabaseManager(root / ".stitcher" / "index" / "index.db")
+    store = IndexStore(db_manager)
+    indexer = FileIndexer(root, store)
+    return IndexRunner(db_manager, indexer, change_detection="git"), store
+
+
+def test_git_change_detection_indexes_only_the_delta(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).init_git()
+    factory.with_source("pkg/a.py", "a = 1")
+    factory.with_source("pkg/b.py", "b = 1")
+    factory.with_source("pkg/untouched.py", "u = 1")
+    factory.with_raw_file(".gitignore", ".stitcher/\n")
+    root = factory.build()
+    _commit(root)
+
+    workspace = Workspace(root)
+    runner, store = _make_runner(root)
+    spy_index = mocker.spy(runner.indexer, "index_files")
+
+    # 1. No snapshot yet: full scan.
+    runner.run_build(workspace)
+    assert spy_index.call_args.kwargs.get("scope") is None
+
+    # 2. Only the delta is looked at.
+    (root / "pkg/a.py").write_text("a = 2")
+    (root / "pkg/b.py").unlink()
+    (root / "pkg/c.py").write_text("c = 1")
+    stats = runner.run_build(workspace)
+
+    assert spy_index.call_args.kwargs["scope"] == {"pkg/a.py", "pkg/b.py", "pkg/c.py"}
+    assert stats["updated"] == 1
+    assert stats["added"] == 1
+    assert stats["deleted"] == 1
+    assert store.get_file_by_path("pkg/b.py") is None
+    assert store.get_file_by_path("pkg/c.py") is not None
+    assert store.get_file_by_path("pkg/untouched.py") is not None
+
+    # 3. Files dirty at the last build are re-checked even when reverted to HEAD.
+    subprocess.run(["git", "checkout", "--", "pkg/a.py"], cwd=root, check=True)
+    runner.run_build(workspace)
+    assert "pkg/a.py" in spy_index.call_args.kwargs["scope"]
+
+    # 4. Commits made between builds are picked up through the stored HEAD.
+    _commit(root)
+    runner.run_build(workspace)
+    (root / "pkg/d.py").write_text("d = 1")
+    _commit(root)
+    runner.run_build(workspace)
+    assert spy_index.call_args.kwargs["scope"] == {"pkg/d.py"}
+    assert store.get_file_by_path("pkg/d.py") is not None
+
+
+def test_git_change_detection_falls_back_on_ignore_changes(tmp_path, mocker):
+    factory = WorkspaceFactory(tmp_path).init_git()
+    factory.with_source("pkg/a.py", "a = 1")
+    factory.with_raw_file(".gitignore", ".stitcher/\n")
+    root = factory.build()
+    _commit(root)
+
+    (root / "scratch.py").write_text("untracked")
+
+    workspace = Workspace(root)
+    runner, store = _make_runner(root)
+    runner.run_build(workspace)
+    assert store.get_file_by_path("scratch.py") is not None
+
+    (root / ".gitignore").write_text(".stitcher/\nscratch.py\n")
+    spy_index = mocker.spy(runner.indexer, "index_files")
+    runner.run_build(workspace)
+
+    assert spy_index.call_args.kwargs.get("scope") is None
+    assert store.get_file_by_path("scratch.py") is None
+    assert store.get_file_by_path("pkg/a.py") is not None
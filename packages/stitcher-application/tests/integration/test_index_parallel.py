@@ -0,0 +1,38 @@
+import multiprocessing
+
+from stitcher.test_utils import WorkspaceFactory, create_test_app
+
+
+def _doc_hashes(app):
+    record = app.index_store.get_file_by_path("src/main.stitcher.yaml")
+    return {
+        s.id: s.docstring_hash for s in app.index_store.get_symbols_by_file(record.id)
+    }
+
+
+def test_parallel_index_build_works_with_spawned_workers(tmp_path):
+    factory = WorkspaceFactory(tmp_path).with_config(
+        {"scan_paths": ["src"], "docstring_style": "google"}
+    )
+    for i in range(4):
+        factory.with_source(f"src/mod_{i}.py", f"def f{i}(): pass\n")
+    root = (
+        factory.with_source("src/main.py", "def func(): pass\n")
+        .with_docs("src/main.stitcher.yaml", {"func": {"Summary": "Doc."}})
+        .build()
+    )
+    serial_app = create_test_app(root_path=root)
+    serial_app.ensure_index_fresh()
+    expected = _doc_hashes(serial_app)
+    serial_app.db_manager.close()
+
+    # Workers only get what pickles cleanly: adapters, not the application.
+    (root / ".stitcher" / "index" / "index.db").unlink()
+    app = create_test_app(root_path=root)
+    app.file_indexer.mp_context = multiprocessing.get_context("spawn")
+    stats = app.file_indexer.index_files(app.workspace.discover_files(), max_workers=2)
+
+    assert stats["errors"] == 0, stats["error_details"]
+    assert stats["added"] > 5
+    assert _doc_hashes(app) == expected
+    assert all(expected.values())
@@ -6,7 +6,9 @@ from stitcher.app.runners.check.resolver import CheckResolver
 from stitcher.app.runners.check.reporter import CheckReporter
 from stitcher.spec.managers import DocumentManagerProtocol
 from stitcher.spec import (
+    Fingerprint,
     FingerprintStrategyProtocol,
+    FunctionDef,
     IndexStoreProtocol,
     ModuleDef,
     DifferProtocol,
@@ -54,6 +56,7 @@ def test_check_runner_orchestrates_analysis_and_resolution(mocker):
     )
     mock_engine.analyze.return_value = mock_analysis_result
 
+    mock_doc_manager.load_docs_with_hashes_for_paths.return_value = ({}, {})
     mock_resolver.resolve_conflicts.return_value = True
     mock_reporter.report.return_value = True
 
@@ -145,3 +148,91 @@ def test_check_runner_passes_relink_and_reconcile_flags_to_resolver(mocker):
     mock_resolver.resolve_conflicts.assert_called_once_with(
         mock_results, mock_conflicts, mock_tm, force_relink=True, reconcile=True
     )
+
+
+def test_analyze_batch_shares_loads_and_fingerprints(mocker):
+    mock_doc_manager = mocker.create_autospec(DocumentManagerProtocol, instance=True)
+    mock_doc_manager.load_docs_with_hashes_for_paths.return_value = ({}, {})
+    mock_doc_manager.flatten_module_docs.return_value = {}
+    mock_lock_manager = mocker.create_autospec(LockManagerProtocol, instance=True)
+    mock_lock_manager.load.return_value = {}
+    mock_workspace = mocker.create_autospec(Workspace, instance=True)
+    mock_workspace.find_owning_package.return_value = Path("/tmp")
+    mock_workspace.to_workspace_relative.side_effect = lambda p: str(p)
+    mock_strategy = mocker.create_autospec(FingerprintStrategyProtocol, instance=True)
+    mock_strategy.compute.return_value = Fingerprint()
+    runner = CheckRunner(
+        doc_manager=mock_doc_manager,
+        lock_manager=mock_lock_manager,
+        uri_generator=mocker.create_autospec(URIGeneratorProtocol, instance=True),
+        fingerprint_strategy=mock_strategy,
+        index_store=mocker.create_autospec(IndexStoreProtocol, instance=True),
+        workspace=mock_workspace,
+        differ=mocker.create_autospec(DifferProtocol, instance=True),
+        resolver=mocker.create_autospec(CheckResolver, instance=True),
+        reporter=mocker.create_autospec(CheckReporter, instance=True),
+        root_path=Path("/tmp"),
+    )
+    # Plugin entry points commonly share one signature.
+    modules = [
+        ModuleDef(file_path=f"plugins/p{i}.py", functions=[FunctionDef(name="run")])
+        for i in range(3)
+    ]
+
+    results, _ = runner.analyze_batch(modules)
+
+    assert [r.path for r in results] == [m.file_path for m in modules]
+    mock_doc_manager.load_docs_with_hashes_for_paths.assert_called_once()
+    mock_doc_manager.load_docs_for_module.assert_not_called()
+    mock_doc_manager.compute_yaml_content_hashes.assert_not_called()
+    mock_lock_manager.load.assert_called_once()
+    mock_strategy.compute.assert_called_once()
+
+
+def _make_runner(mocker) -> CheckRunner:
+    return CheckRunner(
+        doc_manager=mocker.create_autospec(DocumentManagerProtocol, instance=True),
+        lock_manager=mocker.create_autospec(LockManagerProtocol, instance=True),
+        uri_generator=mocker.create_autospec(URIGeneratorProtocol, instance=True),
+        fingerprint_strategy=mocker.create_autospec(
+            FingerprintStrategyProtocol, instance=True
+        ),
+        index_store=mocker.create_autospec(IndexStoreProtocol, instance=True),
+        workspace=mocker.create_autospec(Workspace, instance=True),
+        differ=mocker.create_autospec(DifferProtocol, instance=True),
+        resolver=mocker.create_autospec(CheckResolver, instance=True),
+        reporter=mocker.create_autospec(CheckReporter, instance=True),
+        root_path=Path("/tmp"),
+    )
+
+
+def test_iter_analyze_paths_yields_each_file_before_analyzing_the_next(mocker):
+    runner = _make_runner(mocker)
+    analyzed = []
+
+    def iter_analyze(paths, engine, docs_out):
+        for path in paths:
+            analyzed.append(path)
+            yield AnalysisResult(
+                path=path,
+                violations=[
+                    Violation(kind=L.check.state.signature_drift, fqn="f", context={})
+                ],
+            )
+
+    runner.path_analyzer = MagicMock()
+    runner.path_analyzer.iter_analyze.side_effect = iter_analyze
+
+    stream = runner.iter_analyze_paths(["a.py", "b.py"])
+    result, conflicts = next(stream)
+
+    assert result.path == "a.py"
+    assert [c.file_path for c in conflicts] == ["a.py"]
+    assert analyzed == ["a.py"]
+    assert [r.path for r, _ in stream] == ["b.py"]
+
+    # analyze_paths collects the same stream into lists.
+    results, conflicts = runner.analyze_paths(["a.py", "b.py"])
+
+    assert [r.path for r in results] == ["a.py", "b.py"]
+    assert [c.file_path for c in conflicts] == ["a.py", "b.py"]
@@ -1,10 +1,25 @@
+import sys
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional
+
 import typer
 from stitcher.common.bus import bus, stitcher_operator as nexus
 from needle.pointer import L
-from stitcher.cli.factories import make_app, make_interaction_handler
+from stitcher.cli.factories import (
+    make_app,
+    make_interaction_handler,
+    run_via_daemon,
+)
+from stitcher.cli.rendering import CliRenderer
 from stitcher.workspace import WorkspaceNotFoundError
 
 
+class CheckOutputFormat(str, Enum):
+    JSONL = "jsonl"
+    SARIF = "sarif"
+
+
 def check_command(
     force_relink: bool = typer.Option(
         False,
@@ -21,6 +36,52 @@ def check_command(
         "--non-interactive",
         help=nexus(L.cli.option.non_interactive.help),
     ),
+    jobs: int = typer.Option(
+        1,
+        "-j",
+        "--jobs",
+        min=1,
+        help=nexus(L.cli.option.check_jobs.help),
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help=nexus(L.cli.option.fail_fast.help),
+    ),
+    max_errors: Optional[int] = typer.Option(
+        None,
+        "--max-errors",
+        min=1,
+        help=nexus(L.cli.option.max_errors.help),
+    ),
+    output_format: Optional[CheckOutputFormat] = typer.Option(
+        None,
+        "--format",
+        help=nexus(L.cli.option.check_format.help),
+        case_sensitive=False,
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help=nexus(L.cli.option.check_output.help),
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        metavar="REF",
+        help=nexus(L.cli.option.changed_since.help),
+    ),
+    files_from_stdin: bool = typer.Option(
+        False,
+        "--files",
+        help=nexus(L.cli.option.check_files.help),
+    ),
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help=nexus(L.cli.option.no_daemon.help),
+    ),
 ):
     if force_relink and reconcile:
         bus.error(
@@ -28,18 +89,62 @@ def check_command(
         )
         raise typer.Exit(code=1)
 
+    if fail_fast:
+        max_errors = 1
+    format_name = output_format.value if output_format else None
+    if output:
+        output = output.resolve()
+    elif format_name:
+        if isinstance(bus.renderer, CliRenderer):
+            # Keep stdout for the machine-readable stream.
+            bus.renderer.to_stderr = True
+
+    files: Optional[List[Path]] = None
+    if files_from_stdin:
+        # One path per line, relative to the current directory.
+        files = [Path(line.strip()).resolve() for line in sys.stdin if line.strip()]
+
     # Use factory to decide if we need an interaction handler
     handler = make_interaction_handler(
         non_interactive=non_interactive,
         auto_resolve_mode=(force_relink or reconcile),
     )
 
+    # The daemon cannot prompt, so it only serves non-interactive runs.
+    if handler is None and not no_daemon:
+        success = run_via_daemon(
+            "check",
+            {
+                "force_relink": force_relink,
+                "reconcile": reconcile,
+                "jobs": jobs,
+                "max_errors": max_errors,
+                "format": format_name,
+                "output": str(output) if output else None,
+                "changed_since": changed_since,
+                "files": [str(f) for f in files] if files is not None else None,
+            },
+        )
+        if success is not None:
+            if not success:
+                raise typer.Exit(code=1)
+            return
+
     try:
         app_instance = make_app(handler)
     except WorkspaceNotFoundError as e:
         bus.error(L.error.workspace.not_found, path=e.start_path)
         raise typer.Exit(code=1)
 
-    success = app_instance.run_check(force_relink=force_relink, reconcile=reconcile)
+    success = app_instance.run_check(
+        force_relink=force_relink,
+        reconcile=reconcile,
+        jobs=jobs,
+        max_errors=max_errors,
+        output_format=format_name,
+        output_path=output,
+        changed_since=changed_since,
+        files=files,
+    )
     if not success:
         raise typer.Exit(code=1)
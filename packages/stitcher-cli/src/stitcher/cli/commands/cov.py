@@ -1,11 +1,20 @@
 import typer
 from needle.pointer import L
-from stitcher.common.bus import bus
-from stitcher.cli.factories import make_app
+from stitcher.common.bus import bus, stitcher_operator as nexus
+from stitcher.cli.factories import make_app, run_via_daemon
 from stitcher.workspace import WorkspaceNotFoundError
 
 
-def cov_command():
+def cov_command(
+    no_daemon: bool = typer.Option(
+        False,
+        "--no-daemon",
+        help=nexus(L.cli.option.no_daemon.help),
+    ),
+):
+    if not no_daemon and run_via_daemon("cov") is not None:
+        return
+
     try:
         app_instance = make_app()
     except WorkspaceNotFoundError as e:
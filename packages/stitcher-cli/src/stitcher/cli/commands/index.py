@@ -1,14 +1,40 @@
 import typer
 from needle.pointer import L
-from stitcher.common.bus import bus
+from stitcher.common.bus import bus, stitcher_operator as nexus
+from stitcher.app.daemon import IndexDaemon
 from stitcher.cli.factories import make_app
 from stitcher.workspace import WorkspaceNotFoundError
 
 
-def index_build_command():
+def index_build_command(
+    jobs: int = typer.Option(
+        1,
+        "-j",
+        "--jobs",
+        min=1,
+        help=nexus(L.cli.option.jobs.help),
+    ),
+):
     try:
         app_instance = make_app()
     except WorkspaceNotFoundError as e:
         bus.error(L.error.workspace.not_found, path=e.start_path)
         raise typer.Exit(code=1)
-    app_instance.run_index_build()
+    app_instance.run_index_build(max_workers=jobs)
+
+
+def index_watch_command(
+    interval: float = typer.Option(
+        1.0,
+        "--interval",
+        min=0.1,
+        help=nexus(L.cli.option.interval.help),
+    ),
+):
+    try:
+        app_instance = make_app()
+    except WorkspaceNotFoundError as e:
+        bus.error(L.error.workspace.not_found, path=e.start_path)
+        raise typer.Exit(code=1)
+    if not IndexDaemon(app_instance, poll_interval=interval).serve_forever():
+        raise typer.Exit(code=1)
@@ -1,15 +1,19 @@
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
+import typer
+from needle.pointer import L
 from stitcher.app.core import StitcherApp
+from stitcher.app.daemon import request_daemon
 from stitcher.spec.interaction import InteractionHandler
-from stitcher.common.bus import stitcher_operator as nexus
+from stitcher.common.bus import bus, stitcher_operator as nexus
 from stitcher.lang.python import (
     GriffePythonParser,
     PythonTransformer,
     PythonFingerprintStrategy,
 )
+from stitcher.workspace import WorkspaceNotFoundError
 from stitcher.workspace.utils import find_workspace_root
 
 from .handlers import TyperInteractionHandler
@@ -48,3 +52,24 @@ def make_app(
         fingerprint_strategy=strategy,
         interaction_handler=handler,
     )
+
+
+def run_via_daemon(
+    command: str, options: Optional[Dict[str, Any]] = None
+) -> Optional[bool]:
+    # Forwards a command to a running `stitcher index watch` daemon. Returns
+    # None when there is none, so the caller runs the command in-process.
+    try:
+        project_root = find_workspace_root(Path.cwd())
+    except WorkspaceNotFoundError:
+        return None
+
+    return request_daemon(
+        project_root,
+        command,
+        options,
+        on_message=lambda level, message: bus.present(
+            L.index.daemon.relay, level=level, text=message
+        ),
+        on_output=lambda text: typer.echo(text, nl=False),
+    )
@@ -15,7 +15,7 @@ from .commands.basics import (
     strip_command,
     inject_command,
 )
-from .commands.index import index_build_command
+from .commands.index import index_build_command, index_watch_command
 
 app = typer.Typer(
     name="stitcher",
@@ -64,6 +64,9 @@ index_app = typer.Typer(
 index_app.command(name="build", help=nexus(L.cli.command.index_build.help))(
     index_build_command
 )
+index_app.command(name="watch", help=nexus(L.cli.command.index_watch.help))(
+    index_watch_command
+)
 app.add_typer(index_app)
 
 
@@ -24,6 +24,8 @@ LEVEL_MAP = {
 class CliRenderer(Renderer):
     def __init__(self, loglevel: LogLevel = LogLevel.INFO):
         self.loglevel_value = LEVEL_MAP[loglevel.value]
+        # Set when stdout carries machine-readable output (`check --format`).
+        self.to_stderr = False
 
     def render(self, message: str, level: str, **kwargs: Any):
         if LEVEL_MAP.get(level, 0) < self.loglevel_value:
@@ -39,4 +41,4 @@ class CliRenderer(Renderer):
         elif level == "debug":
             color = typer.colors.BRIGHT_BLACK  # Dim/Gray for debug
 
-        typer.secho(message, fg=color)
+        typer.secho(message, fg=color, err=self.to_stderr)
@@ -1,11 +1,12 @@
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union, Any
+from typing import Iterator, Optional, Union, Any
 
-from needle.bus import bus
+from needle.bus import FeedbackBus
 from needle.operators import I18NFactoryOperator, OverlayOperator
 from needle.runtime import nexus as global_nexus
-from needle.spec import SemanticPointerProtocol
+from needle.spec import RendererProtocol, SemanticPointerProtocol
 
 
 def _detect_lang() -> str:
@@ -25,6 +26,21 @@ def _detect_lang() -> str:
     return "en"
 
 
+class StitcherBus(FeedbackBus):
+    @property
+    def renderer(self) -> Optional[RendererProtocol]:
+        return self._renderer
+
+    @contextmanager
+    def use_renderer(self, renderer: RendererProtocol) -> Iterator[None]:
+        previous = self._renderer
+        self._renderer = renderer
+        try:
+            yield
+        finally:
+            self._renderer = previous
+
+
 # 1. 定位资产根目录与语言
 _assets_root = Path(__file__).parent / "assets"
 _lang = _detect_lang()
@@ -38,9 +54,9 @@ _stitcher_i18n = _factory(_lang)
 # 优先级：Stitcher 本地资产 > 全局默认 Nexus
 _nexus = OverlayOperator([_stitcher_i18n, global_nexus])
 
-# 4. 注入到全局反馈总线
+# 4. 构造 Stitcher 的反馈总线
 # 这样 bus.present(), bus.info() 等方法就能使用组装好的解析逻辑
-bus.set_operator(_nexus)
+bus = StitcherBus(operator=_nexus)
 
 
 # 5. 定义 stitcher_operator (Nexus) 接口
@@ -54,4 +70,4 @@ def stitcher_operator(key: Union[str, SemanticPointerProtocol], **kwargs: Any) -
 
 
 # 6. 导出全局单例和操作符
-__all__ = ["bus", "stitcher_operator"]
+__all__ = ["bus", "StitcherBus", "stitcher_operator"]
@@ -1,7 +1,9 @@
 import sqlite3
 import logging
+import re
+import weakref
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator, Optional
 from contextlib import contextmanager
 
 try:
@@ -12,25 +14,158 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# Version of schema.sql, stored in the database as `PRAGMA user_version`.
+SCHEMA_VERSION = 4
+
+# MIGRATIONS[n] upgrades a database from version n - 1 to version n.
+# Entries are frozen once released; schema changes go into a new entry.
+# Databases created before versioning existed report user_version 0 and are
+# treated as version 1 (the original schema.sql).
+MIGRATIONS = {
+    2: """
+    DROP INDEX IF EXISTS idx_files_path;
+
+    DROP INDEX IF EXISTS idx_symbols_file_id;
+    DROP INDEX IF EXISTS idx_symbols_canonical_fqn;
+    DROP INDEX IF EXISTS idx_symbols_alias_target_fqn;
+    CREATE INDEX IF NOT EXISTS idx_symbols_file_fqn ON symbols(file_id, canonical_fqn);
+    CREATE INDEX IF NOT EXISTS idx_symbols_fqn_id ON symbols(canonical_fqn, id);
+    CREATE INDEX IF NOT EXISTS idx_symbols_alias_fqn
+        ON symbols(alias_target_fqn) WHERE kind = 'alias';
+    CREATE INDEX IF NOT EXISTS idx_symbols_alias_target_id
+        ON symbols(alias_target_id) WHERE alias_target_id IS NOT NULL;
+
+    DROP INDEX IF EXISTS idx_references_source_file_id;
+    CREATE INDEX IF NOT EXISTS idx_references_source_target
+        ON 'references'(source_file_id, target_id);
+    CREATE INDEX IF NOT EXISTS idx_references_target_fqn ON 'references'(target_fqn);
+    CREATE INDEX IF NOT EXISTS idx_references_dependency_edges
+        ON 'references'(source_file_id, target_fqn, kind, lineno)
+        WHERE target_fqn IS NOT NULL;
+    """,
+    3: """
+    CREATE TABLE IF NOT EXISTS index_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """,
+    4: """
+    CREATE TABLE IF NOT EXISTS lock_entries (
+        lock_file_id INTEGER NOT NULL,
+        suri TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        PRIMARY KEY (lock_file_id, suri),
+        FOREIGN KEY (lock_file_id) REFERENCES files(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+    -- Lock files indexed before were only tracked; ingest them on the next run.
+    UPDATE files SET indexing_status = 0
+        WHERE path = 'stitcher.lock' OR path LIKE '%/stitcher.lock';
+    """,
+}
+
+
+# Tunable PRAGMAs applied to every connection. Overridable per project via
+# `[tool.stitcher.index]` in pyproject.toml.
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    # Serve reads from a memory map instead of read() syscalls (256 MiB).
+    "mmap_size": 256 * 1024 * 1024,
+    # Negative values are in KiB: a 64 MiB page cache.
+    "cache_size": -64 * 1024,
+    # Keep temp tables and sort b-trees (linker, UNION) off disk.
+    "temp_store": "MEMORY",
+    # Wait for a concurrent writer instead of failing with "database is locked".
+    "busy_timeout": 5000,
+}
+
+_PRAGMA_VALUE = re.compile(r"^[A-Za-z_]+$")
+
+
+def _resolve_pragmas(overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    pragmas = dict(DEFAULT_PRAGMAS)
+    for name, value in (overrides or {}).items():
+        if name not in DEFAULT_PRAGMAS:
+            log.warning(f"Ignoring unsupported index PRAGMA '{name}'")
+            continue
+        # Values are interpolated into SQL, so only plain integers and
+        # keywords (e.g. MEMORY) are accepted.
+        if isinstance(value, bool) or not (
+            isinstance(value, int)
+            or (isinstance(value, str) and _PRAGMA_VALUE.match(value))
+        ):
+            log.warning(f"Ignoring invalid value {value!r} for index PRAGMA '{name}'")
+            continue
+        pragmas[name] = value
+    return pragmas
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    try:
+        # Lets SQLite refresh planner statistics for the queries it has seen.
+        conn.execute("PRAGMA optimize")
+        conn.commit()
+    except sqlite3.Error as e:
+        log.debug(f"PRAGMA optimize failed: {e}")
+    finally:
+        conn.close()
+
 
 class DatabaseManager:
-    def __init__(self, db_path: Path):
+    def __init__(
+        self,
+        db_path: Path,
+        pragmas: Optional[Dict[str, Any]] = None,
+        persistent: bool = False,
+        read_only: bool = False,
+    ):
         self.db_path = db_path
+        self.pragmas = _resolve_pragmas(pragmas)
+        self.persistent = persistent
+        self.read_only = read_only
         self._active_connection: sqlite3.Connection | None = None
+        self._persistent_connection: sqlite3.Connection | None = None
+        self._finalizer: weakref.finalize | None = None
 
     def _get_raw_connection(self) -> sqlite3.Connection:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self.db_path))
+        if self._persistent_connection:
+            return self._persistent_connection
+
+        if self.read_only:
+            # Readers (e.g. check workers) run alongside the writer thanks to WAL.
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True
+            )
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode = WAL;")
 
         # Performance & Integrity optimizations
-        conn.execute("PRAGMA journal_mode = WAL;")
         conn.execute("PRAGMA synchronous = NORMAL;")
         conn.execute("PRAGMA foreign_keys = ON;")
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value};")
 
         # Return rows as sqlite3.Row for dict-like access
         conn.row_factory = sqlite3.Row
+
+        if self.persistent:
+            self._persistent_connection = conn
+            # Closes the connection (running PRAGMA optimize) when the manager
+            # is garbage collected or, at the latest, when the process exits.
+            self._finalizer = weakref.finalize(self, _close_connection, conn)
         return conn
 
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if conn is not self._persistent_connection:
+            conn.close()
+
+    def close(self) -> None:
+        if self._finalizer:
+            self._finalizer()
+            self._finalizer = None
+        self._persistent_connection = None
+        self._active_connection = None
+
     def initialize(self) -> None:
         # 1. Ensure directory structure and gitignore
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -38,13 +173,66 @@ class DatabaseManager:
         if not gitignore_path.exists():
             gitignore_path.write_text("*\n", encoding="utf-8")
 
-        # 2. Initialize Schema
+        # 2. Create or migrate the schema
+        with self.get_connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == SCHEMA_VERSION:
+                return
+
+            has_tables = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'files'"
+                ).fetchone()
+                is not None
+            )
+            if not has_tables:
+                self._create_schema(conn)
+                log.debug(f"Initialized database at {self.db_path}")
+            elif version > SCHEMA_VERSION:
+                # Written by a newer Stitcher. The index is a cache, so rebuild
+                # it rather than guess at a schema we do not know.
+                log.warning(
+                    f"Index schema version {version} is newer than supported "
+                    f"version {SCHEMA_VERSION}; rebuilding {self.db_path}"
+                )
+                self._reset_schema(conn)
+            else:
+                self._migrate(conn, max(version, 1))
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
         schema_path = files("stitcher.index").joinpath("schema.sql")
         schema_sql = schema_path.read_text(encoding="utf-8")
+        self._run_script(conn, schema_sql, SCHEMA_VERSION)
 
-        with self.get_connection() as conn:
-            conn.executescript(schema_sql)
-            log.debug(f"Initialized database at {self.db_path}")
+    def _reset_schema(self, conn: sqlite3.Connection) -> None:
+        tables = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            for table in tables:
+                conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+            conn.commit()
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+        self._create_schema(conn)
+
+    def _migrate(self, conn: sqlite3.Connection, version: int) -> None:
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            log.debug(f"Migrating index schema to version {target}")
+            self._run_script(conn, MIGRATIONS[target], target)
+
+    def _run_script(self, conn: sqlite3.Connection, script: str, version: int) -> None:
+        # executescript() commits any pending transaction and runs in autocommit
+        # mode, so the script and the version bump are wrapped explicitly to be
+        # applied atomically.
+        conn.executescript(
+            f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;"
+        )
 
     @contextmanager
     def session(self) -> Generator[None, None, None]:
@@ -60,7 +248,7 @@ class DatabaseManager:
             self._active_connection.rollback()
             raise
         finally:
-            self._active_connection.close()
+            self._release(self._active_connection)
             self._active_connection = None
 
     @contextmanager
@@ -80,4 +268,4 @@ class DatabaseManager:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self._release(conn)
@@ -1,25 +1,135 @@
 import hashlib
+import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Dict, Set, Any
+from typing import Dict, Set, Any, List, Optional, Tuple, Iterator
 
-from stitcher.spec import IndexStoreProtocol
-from stitcher.spec.index import FileRecord
+from stitcher.spec import Fingerprint, IndexStoreProtocol
+from stitcher.spec.index import FileState, SymbolRecord, ReferenceRecord
 from stitcher.spec.registry import LanguageAdapter
 
+from .parse_cache import ParseCache
+
 log = logging.getLogger(__name__)
 
+# Number of files taken through the scan -> sync -> parse -> write pipeline
+# at once. Bounds the amount of file content held in memory.
+CHUNK_SIZE = 512
+
+# (mtime, size) as reported by stat().
+_StatResult = Tuple[float, int]
+
+# Lock files are mirrored into the index (see IndexStore.update_lock_entries).
+LOCK_FILE_NAME = "stitcher.lock"
+
+
+def _is_lock_file(rel_path: str) -> bool:
+    return rel_path.rpartition("/")[2] == LOCK_FILE_NAME
+
+
+def _parse_lock(text: str) -> Dict[str, Fingerprint]:
+    # Every lock layout is a JSON document with a "fingerprints" object.
+    fingerprints = json.loads(text)["fingerprints"]
+    return {suri: Fingerprint.from_dict(fp) for suri, fp in fingerprints.items()}
+
+
+@dataclass
+class _FileSnapshot:
+    rel_path: str
+    abs_path: Path
+    mtime: float
+    size: int
+    # Content is only read when the stat fast-path could not prove the file clean.
+    content: Optional[bytes] = None
+    content_hash: Optional[str] = None
+
+
+@dataclass
+class _ParseOutcome:
+    symbols: List[SymbolRecord]
+    references: List[ReferenceRecord]
+    error: Optional[str] = None
+
+
+# Adapters installed into each worker process by `_init_parse_worker`. They are
+# pickled into the workers, so adapters must hold plain data only.
+_worker_adapters: Dict[str, LanguageAdapter] = {}
+
+
+def _init_parse_worker(adapters: Dict[str, LanguageAdapter]) -> None:
+    global _worker_adapters
+    _worker_adapters = adapters
+
+
+def _parse_file(
+    adapters: Dict[str, LanguageAdapter], abs_path: Path, text: str
+) -> _ParseOutcome:
+    try:
+        symbols, references = adapters[abs_path.suffix].parse(abs_path, text)
+    except Exception as e:
+        return _ParseOutcome([], [], str(e))
+    return _ParseOutcome(symbols, references)
+
+
+def _parse_in_worker(task: Tuple[Path, str]) -> _ParseOutcome:
+    abs_path, text = task
+    return _parse_file(_worker_adapters, abs_path, text)
+
+
+def _default_mp_context() -> BaseContext:
+    # Workers are started while the index connection and the I/O threads are
+    # live; fork() would copy them (and any held lock) into the children.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
 
 class FileIndexer:
-    def __init__(self, root_path: Path, store: IndexStoreProtocol):
+    def __init__(
+        self,
+        root_path: Path,
+        store: IndexStoreProtocol,
+        max_workers: int = 1,
+        adapter_files_only: bool = False,
+        parse_cache: Optional[ParseCache] = None,
+        mp_context: Optional[BaseContext] = None,
+    ):
         self.root_path = root_path
         self.store = store
         self.adapters: Dict[str, LanguageAdapter] = {}
+        self.max_workers = max_workers
+        # When set, files without a registered adapter are neither stat()ed nor
+        # tracked, instead of being recorded as opaque entries.
+        self.adapter_files_only = adapter_files_only
+        # Replays parse results of previously seen content. Only used for
+        # adapters exposing a `cache_fingerprint`.
+        self.parse_cache = parse_cache
+        # Start method of the parse workers; forkserver (or spawn) if None.
+        self.mp_context = mp_context or _default_mp_context()
 
     def register_adapter(self, extension: str, adapter: LanguageAdapter):
         self.adapters[extension] = adapter
 
-    def index_files(self, discovered_paths: Set[str]) -> Dict[str, Any]:
+    def is_indexed_path(self, rel_path: str) -> bool:
+        # Whether changes to `rel_path` can affect the index.
+        return rel_path.endswith(tuple(self.adapters)) or _is_lock_file(rel_path)
+
+    def index_files(
+        self,
+        discovered_paths: Set[str],
+        max_workers: Optional[int] = None,
+        scope: Optional[Set[str]] = None,
+    ) -> Dict[str, Any]:
+        # `discovered_paths` is normally every file of the workspace and any
+        # indexed file outside it is deleted. With `scope`, only the paths in
+        # `scope` are considered, e.g. the delta reported by git.
+        workers = max(1, max_workers or self.max_workers)
         stats: Dict[str, Any] = {
             "added": 0,
             "updated": 0,
@@ -31,90 +141,277 @@ class FileIndexer:
             "modified_paths": set(),
         }
 
-        # Load DB state
-        known_files: Dict[str, FileRecord] = {
-            r.path: r for r in self.store.get_all_files()
-        }
+        if self.adapter_files_only:
+            discovered_paths = {p for p in discovered_paths if self.is_indexed_path(p)}
 
-        # --- Handle Deletions ---
-        for known_path, record in known_files.items():
-            if known_path not in discovered_paths:
-                self.store.delete_file(record.id)
-                stats["deleted"] += 1
+        # Load DB state (only for the paths in scope, if one is given)
+        known_files: Dict[str, FileState] = self.store.get_file_states(scope)
 
-        # --- Check and Update ---
-        for rel_path_str in discovered_paths:
+        # Paths are processed in sorted order so that results (and the order of
+        # error_details) are deterministic regardless of the worker count.
+        ordered_paths = sorted(discovered_paths)
+        for rel_path_str in ordered_paths:
             if rel_path_str.endswith(".stitcher.yaml") or rel_path_str.endswith(
                 ".stitcher.json"
             ):
                 stats["sidecars"] += 1
-            abs_path = self.root_path / rel_path_str
-            try:
-                file_stat = abs_path.stat()
-            except FileNotFoundError:
-                continue
 
-            current_mtime = file_stat.st_mtime
-            current_size = file_stat.st_size
-            record = known_files.get(rel_path_str)
+        with ExitStack() as stack:
+            # All writes of this run go through one connection and transaction.
+            stack.enter_context(self.store.bulk_ingest())
 
-            if (
-                record
-                and record.indexing_status == 1
-                and record.last_mtime == current_mtime
-                and record.last_size == current_size
-            ):
-                stats["skipped"] += 1
-                continue
+            # --- Handle Deletions ---
+            for known_path, state in known_files.items():
+                if known_path not in discovered_paths:
+                    self.store.delete_file(state.id)
+                    stats["deleted"] += 1
 
-            try:
-                content_bytes = abs_path.read_bytes()
-            except (OSError, PermissionError) as e:
-                log.warning(f"Could not read file {rel_path_str}: {e}")
-                continue
+            io_pool: Optional[Executor] = None
+            parse_pool: Optional[Executor] = None
+            if workers > 1:
+                io_pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
 
-            current_hash = hashlib.sha256(content_bytes).hexdigest()
+            # --- Stat fast path ---
+            # Only files whose stat() differs from the index are read and hashed.
+            file_stats = self._stat_paths(ordered_paths, io_pool)
+            dirty_paths: List[str] = []
+            for rel_path_str in ordered_paths:
+                file_stat = file_stats.get(rel_path_str)
+                if file_stat is None:
+                    continue
+                state = known_files.get(rel_path_str)
+                if (
+                    state
+                    and state.indexing_status == 1
+                    and state.last_mtime == file_stat[0]
+                    and state.last_size == file_stat[1]
+                ):
+                    stats["skipped"] += 1
+                else:
+                    dirty_paths.append(rel_path_str)
 
-            if record and record.content_hash == current_hash:
-                self.store.sync_file(
-                    rel_path_str, current_hash, current_mtime, current_size
+            # --- Check and Update ---
+            for start in range(0, len(dirty_paths), CHUNK_SIZE):
+                chunk = dirty_paths[start : start + CHUNK_SIZE]
+                pending = self._sync_chunk(
+                    chunk, file_stats, known_files, stats, io_pool
                 )
-                if record.indexing_status == 1:
-                    stats["skipped"] += 1
-                    continue
+                to_parse = self._prepare_chunk(pending, stats)
 
+                if workers > 1 and parse_pool is None and to_parse:
+                    # Spawned lazily so that warm no-op runs never pay for it.
+                    parse_pool = stack.enter_context(
+                        ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=self.mp_context,
+                            initializer=_init_parse_worker,
+                            initargs=(self.adapters,),
+                        )
+                    )
+                self._analyze_chunk(to_parse, stats, parse_pool)
+
+            # --- Linking ---
+            self.store.resolve_missing_links()
+
+        # Buffered writes are flushed when the bulk ingest ends; files whose
+        # rows could not be stored are reported like parse errors.
+        for rel_path_str, error in self.store.take_write_errors():
+            self._record_error(stats, self.root_path / rel_path_str, error)
+
+        if self.parse_cache:
+            self.parse_cache.evict()
+        return stats
+
+    def _record_error(self, stats: Dict[str, Any], abs_path: Path, error: str) -> None:
+        stats["errors"] += 1
+        stats["error_details"].append((str(abs_path), error))
+
+    @contextmanager
+    def _file_errors(self, stats: Dict[str, Any], abs_path: Path) -> Iterator[None]:
+        # A failing store write only costs its own file, not the whole run.
+        try:
+            yield
+        except Exception as e:
+            self._record_error(stats, abs_path, str(e))
+
+    def _stat_paths(
+        self, rel_paths: List[str], io_pool: Optional[Executor]
+    ) -> Dict[str, _StatResult]:
+        # Group by directory so each one is listed once with os.scandir, which
+        # reuses the directory entry (and on Windows its stat data) per file.
+        by_dir: Dict[str, Set[str]] = {}
+        for rel_path_str in rel_paths:
+            parent, _, name = rel_path_str.rpartition("/")
+            by_dir.setdefault(parent, set()).add(name)
+
+        items = list(by_dir.items())
+        if io_pool:
+            results = io_pool.map(self._stat_dir, items)
+        else:
+            results = map(self._stat_dir, items)
+
+        file_stats: Dict[str, _StatResult] = {}
+        for dir_stats in results:
+            file_stats.update(dir_stats)
+        return file_stats
+
+    def _stat_dir(self, item: Tuple[str, Set[str]]) -> Dict[str, _StatResult]:
+        parent, names = item
+        prefix = f"{parent}/" if parent else ""
+        dir_stats: Dict[str, _StatResult] = {}
+        try:
+            with os.scandir(self.root_path / parent) as entries:
+                for entry in entries:
+                    if entry.name not in names:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue
+                    dir_stats[prefix + entry.name] = (
+                        file_stat.st_mtime,
+                        file_stat.st_size,
+                    )
+        except OSError:
+            # Directory vanished or is unreadable; its files count as missing.
+            pass
+        return dir_stats
+
+    def _take_snapshot(
+        self, rel_path_str: str, file_stat: _StatResult
+    ) -> Optional[_FileSnapshot]:
+        abs_path = self.root_path / rel_path_str
+        snapshot = _FileSnapshot(rel_path_str, abs_path, file_stat[0], file_stat[1])
+        try:
+            snapshot.content = abs_path.read_bytes()
+        except (OSError, PermissionError) as e:
+            log.warning(f"Could not read file {rel_path_str}: {e}")
+            return None
+
+        snapshot.content_hash = hashlib.sha256(snapshot.content).hexdigest()
+        return snapshot
+
+    def _sync_chunk(
+        self,
+        chunk: List[str],
+        file_stats: Dict[str, _StatResult],
+        known_files: Dict[str, FileState],
+        stats: Dict[str, Any],
+        io_pool: Optional[Executor],
+    ) -> List[Tuple[int, _FileSnapshot]]:
+        chunk_stats = [file_stats[p] for p in chunk]
+        if io_pool:
+            snapshots = list(io_pool.map(self._take_snapshot, chunk, chunk_stats))
+        else:
+            snapshots = [
+                self._take_snapshot(p, st) for p, st in zip(chunk, chunk_stats)
+            ]
+
+        pending: List[Tuple[int, _FileSnapshot]] = []
+        for snapshot in snapshots:
+            if snapshot is None or snapshot.content_hash is None:
+                continue
+
+            rel_path_str = snapshot.rel_path
+            state = known_files.get(rel_path_str)
+            # sync_file compares the hash with the stored one, so files that
+            # were only touched are recognised without keeping hashes in memory.
             file_id, is_new_content = self.store.sync_file(
-                rel_path_str, current_hash, current_mtime, current_size
+                rel_path_str, snapshot.content_hash, snapshot.mtime, snapshot.size
             )
             if is_new_content:
-                stats["updated" if record else "added"] += 1
+                stats["updated" if state else "added"] += 1
                 stats["modified_paths"].add(rel_path_str)
+            elif state and state.indexing_status == 1:
+                stats["skipped"] += 1
+                continue
+
+            pending.append((file_id, snapshot))
+        return pending
+
+    def _cache_key(self, snapshot: _FileSnapshot) -> Optional[str]:
+        if self.parse_cache is None or snapshot.content_hash is None:
+            return None
+        adapter = self.adapters.get(snapshot.abs_path.suffix)
+        fingerprint = getattr(adapter, "cache_fingerprint", None)
+        if not fingerprint:
+            return None
+        return ParseCache.make_key(
+            snapshot.content_hash, snapshot.rel_path, fingerprint
+        )
 
+    def _prepare_chunk(
+        self, pending: List[Tuple[int, _FileSnapshot]], stats: Dict[str, Any]
+    ) -> List[Tuple[int, Path, str, Optional[str]]]:
+        # Settles every file that needs no parser run and returns the rest.
+        to_parse: List[Tuple[int, Path, str, Optional[str]]] = []
+        for file_id, snapshot in pending:
+            assert snapshot.content is not None
             try:
-                self._process_file_content(file_id, abs_path, content_bytes)
-            except Exception as e:
-                stats["errors"] += 1
-                stats["error_details"].append((str(abs_path), str(e)))
+                text_content = snapshot.content.decode("utf-8")
+            except UnicodeDecodeError:
+                # Not a parser error, just binary file
+                with self._file_errors(stats, snapshot.abs_path):
+                    self.store.update_analysis(file_id, [], [])
+                continue
 
-        # --- Linking ---
-        self.store.resolve_missing_links()
-        return stats
+            if snapshot.abs_path.name == LOCK_FILE_NAME:
+                try:
+                    fingerprints = _parse_lock(text_content)
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
+                    # Left unindexed; readers fall back to the file itself.
+                    log.warning(f"Could not index lock file {snapshot.rel_path}: {e}")
+                    continue
+                with self._file_errors(stats, snapshot.abs_path):
+                    self.store.update_lock_entries(file_id, fingerprints)
+                continue
 
-    def _process_file_content(
-        self, file_id: int, abs_path: Path, content_bytes: bytes
+            if snapshot.abs_path.suffix not in self.adapters:
+                with self._file_errors(stats, snapshot.abs_path):
+                    self.store.update_analysis(file_id, [], [])
+                continue
+
+            cache_key = self._cache_key(snapshot)
+            if cache_key and self.parse_cache:
+                cached = self.parse_cache.get(cache_key)
+                if cached is not None:
+                    with self._file_errors(stats, snapshot.abs_path):
+                        self.store.update_analysis(file_id, *cached)
+                    continue
+
+            to_parse.append((file_id, snapshot.abs_path, text_content, cache_key))
+        return to_parse
+
+    def _analyze_chunk(
+        self,
+        to_parse: List[Tuple[int, Path, str, Optional[str]]],
+        stats: Dict[str, Any],
+        parse_pool: Optional[Executor],
     ) -> None:
-        try:
-            text_content = content_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            self.store.update_analysis(file_id, [], [])
-            return  # Not a parser error, just binary file
-
-        ext = abs_path.suffix
-        adapter = self.adapters.get(ext)
-        if not adapter:
-            self.store.update_analysis(file_id, [], [])
+        for (file_id, abs_path, _, cache_key), outcome in zip(
+            to_parse, self._parse_all(to_parse, parse_pool)
+        ):
+            if outcome.error is not None:
+                self._record_error(stats, abs_path, outcome.error)
+                continue
+            if cache_key and self.parse_cache:
+                self.parse_cache.put(cache_key, outcome.symbols, outcome.references)
+            with self._file_errors(stats, abs_path):
+                self.store.update_analysis(file_id, outcome.symbols, outcome.references)
+
+    def _parse_all(
+        self,
+        to_parse: List[Tuple[int, Path, str, Optional[str]]],
+        parse_pool: Optional[Executor],
+    ) -> Iterator[_ParseOutcome]:
+        if parse_pool is None:
+            for _, abs_path, text, _ in to_parse:
+                yield _parse_file(self.adapters, abs_path, text)
             return
 
-        # Let exceptions bubble up to be caught by the caller
-        symbols, references = adapter.parse(abs_path, text_content)
-        self.store.update_analysis(file_id, symbols, references)
+        # Executor.map yields in submission order, so the single writer (this
+        # thread) consumes results deterministically while workers keep parsing.
+        tasks = [(abs_path, text) for _, abs_path, text, _ in to_parse]
+        yield from parse_pool.map(_parse_in_worker, tasks, chunksize=8)
@@ -1,4 +1,7 @@
 import logging
+import sqlite3
+from typing import Iterable, Set
+
 from .db import DatabaseManager
 
 log = logging.getLogger(__name__)
@@ -49,3 +52,89 @@ class Linker:
             )
             if cursor.rowcount > 0:
                 log.debug(f"Linked {cursor.rowcount} aliases.")
+
+    def link_affected(self, changed_fqns: Set[str], changed_file_ids: Set[int]) -> None:
+        # Incremental variant of `link`. Only two kinds of rows can need work:
+        # - rows pointing at a canonical FQN that was added or removed in this run
+        #   (they are re-resolved, which also un-links targets that disappeared);
+        # - rows freshly inserted for the re-analysed files (still unresolved).
+        if not changed_fqns and not changed_file_ids:
+            return
+
+        with self.db.get_connection() as conn:
+            self._load_temp_set(conn, "link_fqns", "fqn TEXT", changed_fqns)
+            self._load_temp_set(conn, "link_files", "file_id INTEGER", changed_file_ids)
+
+            log.debug("Linking affected references...")
+            relinked = conn.execute(
+                """
+                UPDATE "references"
+                SET target_id = (
+                    SELECT id
+                    FROM symbols
+                    WHERE symbols.canonical_fqn = "references".target_fqn
+                    LIMIT 1
+                )
+                WHERE target_fqn IN (SELECT fqn FROM temp.link_fqns)
+                """
+            ).rowcount
+            linked = conn.execute(
+                """
+                UPDATE "references"
+                SET target_id = (
+                    SELECT id
+                    FROM symbols
+                    WHERE symbols.canonical_fqn = "references".target_fqn
+                    LIMIT 1
+                )
+                WHERE source_file_id IN (SELECT file_id FROM temp.link_files)
+                  AND target_id IS NULL
+                  AND target_fqn IS NOT NULL
+                """
+            ).rowcount
+            if relinked + linked > 0:
+                log.debug(f"Linked {relinked + linked} references.")
+
+            log.debug("Linking affected aliases...")
+            relinked = conn.execute(
+                """
+                UPDATE symbols
+                SET alias_target_id = (
+                    SELECT id
+                    FROM symbols AS s2
+                    WHERE s2.canonical_fqn = symbols.alias_target_fqn
+                    LIMIT 1
+                )
+                WHERE alias_target_fqn IN (SELECT fqn FROM temp.link_fqns)
+                  AND kind = 'alias'
+                """
+            ).rowcount
+            linked = conn.execute(
+                """
+                UPDATE symbols
+                SET alias_target_id = (
+                    SELECT id
+                    FROM symbols AS s2
+                    WHERE s2.canonical_fqn = symbols.alias_target_fqn
+                    LIMIT 1
+                )
+                WHERE file_id IN (SELECT file_id FROM temp.link_files)
+                  AND kind = 'alias'
+                  AND alias_target_id IS NULL
+                  AND alias_target_fqn IS NOT NULL
+                """
+            ).rowcount
+            if relinked + linked > 0:
+                log.debug(f"Linked {relinked + linked} aliases.")
+
+            conn.execute("DELETE FROM temp.link_fqns")
+            conn.execute("DELETE FROM temp.link_files")
+
+    def _load_temp_set(
+        self, conn: sqlite3.Connection, table: str, column: str, values: Iterable
+    ) -> None:
+        conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} ({column} PRIMARY KEY)")
+        conn.execute(f"DELETE FROM temp.{table}")
+        conn.executemany(
+            f"INSERT OR IGNORE INTO temp.{table} VALUES (?)", ((v,) for v in values)
+        )
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from stitcher.spec.index import ReferenceRecord, SymbolRecord
+
+log = logging.getLogger(__name__)
+
+# Bump when the on-disk entry layout changes.
+CACHE_FORMAT = 1
+
+# After eviction the cache is trimmed to this fraction of its limit, so that
+# eviction does not run again after every few writes.
+_EVICT_TARGET = 0.8
+
+ParseResult = Tuple[List[SymbolRecord], List[ReferenceRecord]]
+
+# Rows are shallow field tuples; `dataclasses.astuple` would deep-copy every
+# record only for it to be serialized right away.
+_symbol_row = attrgetter(*(f.name for f in fields(SymbolRecord)))
+_reference_row = attrgetter(*(f.name for f in fields(ReferenceRecord)))
+
+
+class ParseCache:
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._written_bytes = 0
+
+    @staticmethod
+    def make_key(content_hash: str, rel_path: str, fingerprint: str) -> str:
+        # The path is part of the key because symbol ids embed it.
+        raw = f"{CACHE_FORMAT}\0{fingerprint}\0{rel_path}\0{content_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ParseResult]:
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_bytes())
+            symbols = [SymbolRecord(*row) for row in data["symbols"]]
+            references = [ReferenceRecord(*row) for row in data["references"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.debug(f"Discarding unreadable parse cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return symbols, references
+
+    def put(
+        self,
+        key: str,
+        symbols: List[SymbolRecord],
+        references: List[ReferenceRecord],
+    ) -> None:
+        payload = json.dumps(
+            {
+                "symbols": [_symbol_row(s) for s in symbols],
+                "references": [_reference_row(r) for r in references],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see partial entries.
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            log.debug(f"Could not write parse cache entry {path}: {e}")
+            return
+        self._written_bytes += len(payload)
+
+    def evict(self) -> int:
+        if self._written_bytes == 0:
+            return 0
+        self._written_bytes = 0
+
+        entries: List[Tuple[float, int, str]] = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                full_path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(full_path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full_path))
+                total += st.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        target = self.max_bytes * _EVICT_TARGET
+        entries.sort()
+        for _, size, full_path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(full_path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -1,3 +1,6 @@
+-- Schema for freshly created databases, at version `SCHEMA_VERSION` (see db.py).
+-- Any change here must bump SCHEMA_VERSION and add the matching migration.
+
 -- File System Tracking
 CREATE TABLE IF NOT EXISTS files (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -9,7 +12,7 @@ CREATE TABLE IF NOT EXISTS files (
     indexing_status INTEGER NOT NULL DEFAULT 0
 );
 
-CREATE INDEX IF NOT EXISTS idx_files_path ON files(path);
+-- Note: lookups by path use the implicit UNIQUE index on files(path).
 
 -- Symbol Definitions
 CREATE TABLE IF NOT EXISTS symbols (
@@ -57,8 +60,18 @@ CREATE TABLE IF NOT EXISTS symbols (
     FOREIGN KEY (alias_target_id) REFERENCES symbols(id) ON DELETE SET NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_symbols_file_id ON symbols(file_id);
-CREATE INDEX IF NOT EXISTS idx_symbols_canonical_fqn ON symbols(canonical_fqn);
+-- Per-file access (re-analysis, ON DELETE CASCADE) and the FQN snapshot the
+-- incremental linker takes before a file's symbols are replaced.
+CREATE INDEX IF NOT EXISTS idx_symbols_file_fqn ON symbols(file_id, canonical_fqn);
+-- Covers the linker's `SELECT id ... WHERE canonical_fqn = ?` lookups.
+CREATE INDEX IF NOT EXISTS idx_symbols_fqn_id ON symbols(canonical_fqn, id);
+-- Lets the linker find aliases pointing at a given FQN.
+CREATE INDEX IF NOT EXISTS idx_symbols_alias_fqn
+    ON symbols(alias_target_fqn) WHERE kind = 'alias';
+-- Required by `ON DELETE SET NULL` on alias_target_id; without it every deleted
+-- symbol triggers a full scan of the symbols table.
+CREATE INDEX IF NOT EXISTS idx_symbols_alias_target_id
+    ON symbols(alias_target_id) WHERE alias_target_id IS NOT NULL;
 
 
 -- Symbol References
@@ -87,5 +100,32 @@ CREATE TABLE IF NOT EXISTS 'references' (
     FOREIGN KEY (target_id) REFERENCES symbols(id) ON DELETE SET NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_references_source_file_id ON 'references'(source_file_id);
-CREATE INDEX IF NOT EXISTS idx_references_target_id ON 'references'(target_id);
\ No newline at end of file
+-- Per-file access, including "unresolved references of these files" for the linker.
+CREATE INDEX IF NOT EXISTS idx_references_source_target
+    ON 'references'(source_file_id, target_id);
+CREATE INDEX IF NOT EXISTS idx_references_target_id ON 'references'(target_id);
+-- Lets the linker and find_references look up references by target FQN.
+CREATE INDEX IF NOT EXISTS idx_references_target_fqn ON 'references'(target_fqn);
+-- Covering index for get_all_dependency_edges.
+CREATE INDEX IF NOT EXISTS idx_references_dependency_edges
+    ON 'references'(source_file_id, target_fqn, kind, lineno)
+    WHERE target_fqn IS NOT NULL;
+
+
+-- Indexer bookkeeping, e.g. the git snapshot of the last build.
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+
+-- Mirror of the stitcher.lock files, re-ingested whenever a lock's content
+-- changes. Lookups by SURI, or by the SURI range of one file, use the key.
+CREATE TABLE IF NOT EXISTS lock_entries (
+    lock_file_id INTEGER NOT NULL,
+    suri TEXT NOT NULL,
+    -- The fingerprint as a JSON object.
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (lock_file_id, suri),
+    FOREIGN KEY (lock_file_id) REFERENCES files(id) ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -1,21 +1,290 @@
-from typing import Optional, List, Tuple
+import hashlib
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Iterable, List, Tuple, Generator, Set, Any
 from .db import DatabaseManager
 from .linker import Linker
+from stitcher.spec import Fingerprint
 from stitcher.spec.index import (
     FileRecord,
+    FileState,
     SymbolRecord,
     ReferenceRecord,
     DependencyEdge,
 )
 
 
+# Default number of buffered rows (symbols + references + file operations)
+# before a bulk ingest flushes them to SQLite with executemany.
+DEFAULT_FLUSH_SIZE = 5000
+
+# Statements are kept as module constants so the exact same SQL text is issued
+# on every call, letting sqlite3's per-connection statement cache reuse them.
+_INSERT_SYMBOL_SQL = """
+    INSERT INTO symbols (
+        id, file_id, name, logical_path, kind,
+        canonical_fqn, alias_target_fqn, alias_target_id,
+        lineno, col_offset, end_lineno, end_col_offset, signature_hash,
+        signature_text, docstring_hash, docstring_content
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_REFERENCE_SQL = """
+    INSERT INTO 'references' (
+        source_file_id, target_fqn, target_id, kind,
+        lineno, col_offset, end_lineno, end_col_offset
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_CLEAR_SYMBOLS_SQL = "DELETE FROM symbols WHERE file_id = ?"
+_CLEAR_REFERENCES_SQL = "DELETE FROM 'references' WHERE source_file_id = ?"
+_MARK_INDEXED_SQL = "UPDATE files SET indexing_status = 1 WHERE id = ?"
+_DELETE_FILE_SQL = "DELETE FROM files WHERE id = ?"
+_CLEAR_LOCK_ENTRIES_SQL = "DELETE FROM lock_entries WHERE lock_file_id = ?"
+_INSERT_LOCK_ENTRY_SQL = (
+    "INSERT INTO lock_entries (lock_file_id, suri, fingerprint) VALUES (?, ?, ?)"
+)
+
+# The dependency graph digest is memoized in index_meta; every write that can
+# change the graph drops the memo.
+_GRAPH_DIGEST_META = "dependency_graph_digest"
+_CLEAR_GRAPH_DIGEST_SQL = "DELETE FROM index_meta WHERE key = 'dependency_graph_digest'"
+
+# Keeps `IN (...)` parameter lists below SQLite's host parameter limit.
+_MAX_IN_PARAMS = 500
+
+
+@contextmanager
+def _savepoint(conn: sqlite3.Connection, name: str) -> Generator[None, None, None]:
+    # Undoes a failed write without rolling back the surrounding transaction.
+    conn.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
+
+
+def _symbol_row(file_id: int, s: SymbolRecord) -> Tuple[Any, ...]:
+    return (
+        s.id,
+        file_id,
+        s.name,
+        s.logical_path,
+        s.kind,
+        s.canonical_fqn,
+        s.alias_target_fqn,
+        s.alias_target_id,
+        s.lineno,
+        s.col_offset,
+        s.end_lineno,
+        s.end_col_offset,
+        s.signature_hash,
+        s.signature_text,
+        s.docstring_hash,
+        s.docstring_content,
+    )
+
+
+def _reference_row(file_id: int, r: ReferenceRecord) -> Tuple[Any, ...]:
+    return (
+        file_id,
+        r.target_fqn,
+        r.target_id,
+        r.kind,
+        r.lineno,
+        r.col_offset,
+        r.end_lineno,
+        r.end_col_offset,
+    )
+
+
+@dataclass
+class _BulkBuffer:
+    flush_size: int
+    deleted_files: List[Tuple[int]] = field(default_factory=list)
+    analyzed_files: List[Tuple[int]] = field(default_factory=list)
+    analyzed_ids: Set[int] = field(default_factory=set)
+    symbol_rows: List[Tuple[Any, ...]] = field(default_factory=list)
+    reference_rows: List[Tuple[Any, ...]] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.deleted_files)
+            + len(self.analyzed_files)
+            + len(self.symbol_rows)
+            + len(self.reference_rows)
+        )
+
+    def clear(self) -> None:
+        self.deleted_files.clear()
+        self.analyzed_files.clear()
+        self.analyzed_ids.clear()
+        self.symbol_rows.clear()
+        self.reference_rows.clear()
+
+
 class IndexStore:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
         self._linker = Linker(db_manager)
+        self._bulk: Optional[_BulkBuffer] = None
+        # Canonical FQNs added or removed, and files re-analysed, since the last
+        # link pass. They scope the incremental linker to rows that can change.
+        self._changed_fqns: Set[str] = set()
+        self._changed_file_ids: Set[int] = set()
+        # (path, error) of files whose buffered writes failed at flush time.
+        self._write_errors: List[Tuple[str, str]] = []
+
+    @contextmanager
+    def bulk_ingest(
+        self, flush_size: int = DEFAULT_FLUSH_SIZE
+    ) -> Generator[None, None, None]:
+        # Nested bulk scopes join the outermost one.
+        if self._bulk is not None:
+            yield
+            return
+
+        # A session pins a single connection, so the whole ingest is one
+        # transaction that is committed once on exit.
+        with self.db.session():
+            self._bulk = _BulkBuffer(flush_size=max(1, flush_size))
+            try:
+                yield
+                self._flush_bulk()
+            finally:
+                self._bulk = None
+
+    def _flush_bulk(self) -> None:
+        buffer = self._bulk
+        if buffer is None or buffer.size == 0:
+            return
+
+        with self.db.get_connection() as conn:
+            try:
+                with _savepoint(conn, "bulk_flush"):
+                    self._write_rows(
+                        conn,
+                        buffer.deleted_files,
+                        buffer.analyzed_files,
+                        buffer.symbol_rows,
+                        buffer.reference_rows,
+                    )
+            except sqlite3.Error:
+                # Replayed file by file, so that only the failing files are
+                # left out instead of the whole batch.
+                self._replay_per_file(conn, buffer)
+        buffer.clear()
+
+    def _write_rows(
+        self,
+        conn: sqlite3.Connection,
+        deleted_files: List[Tuple[int]],
+        analyzed_files: List[Tuple[int]],
+        symbol_rows: List[Tuple[Any, ...]],
+        reference_rows: List[Tuple[Any, ...]],
+    ) -> None:
+        self._track_removed_symbols(
+            conn, [fid for (fid,) in deleted_files + analyzed_files]
+        )
+        if deleted_files or analyzed_files:
+            conn.execute(_CLEAR_GRAPH_DIGEST_SQL)
+        if deleted_files:
+            conn.executemany(_DELETE_FILE_SQL, deleted_files)
+        if analyzed_files:
+            # Clear all stale rows first so symbols that moved between files
+            # in the same batch do not collide on their primary key.
+            conn.executemany(_CLEAR_SYMBOLS_SQL, analyzed_files)
+            conn.executemany(_CLEAR_REFERENCES_SQL, analyzed_files)
+        if symbol_rows:
+            conn.executemany(_INSERT_SYMBOL_SQL, symbol_rows)
+        if reference_rows:
+            conn.executemany(_INSERT_REFERENCE_SQL, reference_rows)
+        if analyzed_files:
+            conn.executemany(_MARK_INDEXED_SQL, analyzed_files)
+
+    def _replay_per_file(self, conn: sqlite3.Connection, buffer: _BulkBuffer) -> None:
+        symbols_by_file: Dict[int, List[Tuple[Any, ...]]] = {}
+        for row in buffer.symbol_rows:
+            symbols_by_file.setdefault(row[1], []).append(row)
+        references_by_file: Dict[int, List[Tuple[Any, ...]]] = {}
+        for row in buffer.reference_rows:
+            references_by_file.setdefault(row[0], []).append(row)
+
+        for (file_id,) in buffer.deleted_files:
+            self._replay_file(conn, file_id, [(file_id,)], [], [], [])
+        for (file_id,) in buffer.analyzed_files:
+            self._replay_file(
+                conn,
+                file_id,
+                [],
+                [(file_id,)],
+                symbols_by_file.get(file_id, []),
+                references_by_file.get(file_id, []),
+            )
+
+    def _replay_file(
+        self,
+        conn: sqlite3.Connection,
+        file_id: int,
+        deleted_files: List[Tuple[int]],
+        analyzed_files: List[Tuple[int]],
+        symbol_rows: List[Tuple[Any, ...]],
+        reference_rows: List[Tuple[Any, ...]],
+    ) -> None:
+        try:
+            with _savepoint(conn, "bulk_file"):
+                self._write_rows(
+                    conn, deleted_files, analyzed_files, symbol_rows, reference_rows
+                )
+        except sqlite3.Error as e:
+            # An analyzed file stays unindexed and is retried on the next run.
+            row = conn.execute(
+                "SELECT path FROM files WHERE id = ?", (file_id,)
+            ).fetchone()
+            path = row[0] if row else f"<file {file_id}>"
+            self._write_errors.append((path, str(e)))
+
+    def take_write_errors(self) -> List[Tuple[str, str]]:
+        errors, self._write_errors = self._write_errors, []
+        return errors
+
+    @contextmanager
+    def _read_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        # Reads must observe rows still sitting in the bulk buffer.
+        self._flush_bulk()
+        with self.db.get_connection() as conn:
+            yield conn
+
+    def _track_removed_symbols(
+        self, conn: sqlite3.Connection, file_ids: List[int]
+    ) -> None:
+        for start in range(0, len(file_ids), _MAX_IN_PARAMS):
+            batch = file_ids[start : start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT canonical_fqn FROM symbols
+                WHERE file_id IN ({placeholders}) AND canonical_fqn IS NOT NULL
+                """,
+                batch,
+            )
+            self._changed_fqns.update(row[0] for row in rows)
+
+    def _track_added_symbols(self, file_id: int, symbols: List[SymbolRecord]) -> None:
+        self._changed_file_ids.add(file_id)
+        self._changed_fqns.update(s.canonical_fqn for s in symbols if s.canonical_fqn)
 
     def resolve_missing_links(self) -> None:
-        self._linker.link()
+        self._flush_bulk()
+        self._linker.link_affected(self._changed_fqns, self._changed_file_ids)
+        self._changed_fqns.clear()
+        self._changed_file_ids.clear()
 
     def sync_file(
         self, path: str, content_hash: str, mtime: float, size: int
@@ -53,6 +322,7 @@ class IndexStore:
                     return file_id, False
             else:
                 # New file
+                conn.execute(_CLEAR_GRAPH_DIGEST_SQL)
                 cursor = conn.execute(
                     """
                     INSERT INTO files (path, content_hash, last_mtime, last_size, indexing_status)
@@ -64,7 +334,7 @@ class IndexStore:
                 return cursor.lastrowid or 0, True
 
     def get_file_by_path(self, path: str) -> Optional[FileRecord]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             row = conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
             if row:
                 return FileRecord(**dict(row))
@@ -76,85 +346,96 @@ class IndexStore:
         symbols: List[SymbolRecord],
         references: List[ReferenceRecord],
     ) -> None:
-        with self.db.get_connection() as conn:
+        if self._bulk is not None:
+            self._buffer_analysis(file_id, symbols, references)
+            return
+
+        self._track_added_symbols(file_id, symbols)
+        with self.db.get_connection() as conn, _savepoint(conn, "analysis"):
             # 1. Clear old data for this file
-            conn.execute("DELETE FROM symbols WHERE file_id = ?", (file_id,))
-            conn.execute(
-                "DELETE FROM 'references' WHERE source_file_id = ?", (file_id,)
-            )
+            self._track_removed_symbols(conn, [file_id])
+            conn.execute(_CLEAR_GRAPH_DIGEST_SQL)
+            conn.execute(_CLEAR_SYMBOLS_SQL, (file_id,))
+            conn.execute(_CLEAR_REFERENCES_SQL, (file_id,))
 
             # 2. Insert new symbols
             if symbols:
                 conn.executemany(
-                    """
-                    INSERT INTO symbols (
-                        id, file_id, name, logical_path, kind, 
-                        canonical_fqn, alias_target_fqn, alias_target_id,
-                        lineno, col_offset, end_lineno, end_col_offset, signature_hash,
-                        signature_text, docstring_hash, docstring_content
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            s.id,
-                            file_id,
-                            s.name,
-                            s.logical_path,
-                            s.kind,
-                            s.canonical_fqn,
-                            s.alias_target_fqn,
-                            s.alias_target_id,
-                            s.lineno,
-                            s.col_offset,
-                            s.end_lineno,
-                            s.end_col_offset,
-                            s.signature_hash,
-                            s.signature_text,
-                            s.docstring_hash,
-                            s.docstring_content,
-                        )
-                        for s in symbols
-                    ],
+                    _INSERT_SYMBOL_SQL, [_symbol_row(file_id, s) for s in symbols]
                 )
 
             # 3. Insert new references
             if references:
                 conn.executemany(
-                    """
-                    INSERT INTO 'references' (
-                        source_file_id, target_fqn, target_id, kind, 
-                        lineno, col_offset, end_lineno, end_col_offset
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        (
-                            file_id,
-                            r.target_fqn,
-                            r.target_id,
-                            r.kind,
-                            r.lineno,
-                            r.col_offset,
-                            r.end_lineno,
-                            r.end_col_offset,
-                        )
-                        for r in references
-                    ],
+                    _INSERT_REFERENCE_SQL,
+                    [_reference_row(file_id, r) for r in references],
                 )
 
             # 4. Mark as indexed
-            conn.execute(
-                "UPDATE files SET indexing_status = 1 WHERE id = ?", (file_id,)
-            )
+            conn.execute(_MARK_INDEXED_SQL, (file_id,))
+
+    def _buffer_analysis(
+        self,
+        file_id: int,
+        symbols: List[SymbolRecord],
+        references: List[ReferenceRecord],
+    ) -> None:
+        buffer = self._bulk
+        assert buffer is not None
+        # A second analysis of the same file must not be merged with the first.
+        if file_id in buffer.analyzed_ids:
+            self._flush_bulk()
+
+        self._track_added_symbols(file_id, symbols)
+        buffer.analyzed_ids.add(file_id)
+        buffer.analyzed_files.append((file_id,))
+        buffer.symbol_rows.extend(_symbol_row(file_id, s) for s in symbols)
+        buffer.reference_rows.extend(_reference_row(file_id, r) for r in references)
+        if buffer.size >= buffer.flush_size:
+            self._flush_bulk()
+
+    def update_lock_entries(
+        self, file_id: int, fingerprints: Dict[str, Fingerprint]
+    ) -> None:
+        rows = [
+            (file_id, suri, json.dumps(fp.to_dict(), sort_keys=True))
+            for suri, fp in fingerprints.items()
+        ]
+        with self.db.get_connection() as conn, _savepoint(conn, "lock_entries"):
+            conn.execute(_CLEAR_LOCK_ENTRIES_SQL, (file_id,))
+            conn.executemany(_INSERT_LOCK_ENTRY_SQL, rows)
+            conn.execute(_MARK_INDEXED_SQL, (file_id,))
+
+    def get_lock_fingerprints(
+        self, lock_file_id: int, file_uris: Optional[Iterable[str]] = None
+    ) -> Dict[str, Fingerprint]:
+        query = "SELECT suri, fingerprint FROM lock_entries WHERE lock_file_id = ?"
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if file_uris is None:
+                rows = list(cursor.execute(query, (lock_file_id,)))
+            else:
+                rows = []
+                for file_uri in file_uris:
+                    # The file's own SURI, then the key range of its fragments
+                    # ('$' sorts right after '#').
+                    cursor.execute(
+                        f"{query} AND (suri = ? OR (suri > ? AND suri < ?))",
+                        (lock_file_id, file_uri, file_uri + "#", file_uri + "$"),
+                    )
+                    rows.extend(cursor)
+        return {suri: Fingerprint.from_dict(json.loads(fp)) for suri, fp in rows}
 
     def get_symbols_by_file(self, file_id: int) -> List[SymbolRecord]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM symbols WHERE file_id = ?", (file_id,)
             ).fetchall()
             return [SymbolRecord(**dict(row)) for row in rows]
 
     def get_symbols_by_file_path(self, file_path: str) -> List[SymbolRecord]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT s.*
@@ -166,22 +447,100 @@ class IndexStore:
             ).fetchall()
             return [SymbolRecord(**dict(row)) for row in rows]
 
+    def get_symbols_by_file_paths(
+        self, file_paths: Iterable[str]
+    ) -> Dict[str, List[SymbolRecord]]:
+        symbols: Dict[str, List[SymbolRecord]] = {}
+        wanted = list(file_paths)
+        with self._read_connection() as conn:
+            for start in range(0, len(wanted), _MAX_IN_PARAMS):
+                batch = wanted[start : start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"""
+                    SELECT f.path AS _file_path, s.*
+                    FROM files f
+                    JOIN symbols s ON s.file_id = f.id
+                    WHERE f.path IN ({placeholders})
+                    """,
+                    batch,
+                )
+                for row in rows:
+                    data = dict(row)
+                    path = data.pop("_file_path")
+                    symbols.setdefault(path, []).append(SymbolRecord(**data))
+        return symbols
+
+    def get_content_hashes(self, file_paths: Iterable[str]) -> Dict[str, str]:
+        hashes: Dict[str, str] = {}
+        wanted = list(file_paths)
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            for start in range(0, len(wanted), _MAX_IN_PARAMS):
+                batch = wanted[start : start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"SELECT path, content_hash FROM files WHERE path IN ({placeholders})"
+                    " AND content_hash IS NOT NULL",
+                    batch,
+                )
+                hashes.update(cursor)
+        return hashes
+
     def get_references_by_file(self, file_id: int) -> List[ReferenceRecord]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM 'references' WHERE source_file_id = ?", (file_id,)
             ).fetchall()
             return [ReferenceRecord(**dict(row)) for row in rows]
 
     def get_all_files(self) -> List[FileRecord]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 "SELECT id, path, content_hash, last_mtime, last_size, indexing_status FROM files"
             ).fetchall()
             return [FileRecord(**dict(row)) for row in rows]
 
-    def get_all_dependency_edges(self) -> List[DependencyEdge]:
+    def get_file_states(
+        self, paths: Optional[Iterable[str]] = None
+    ) -> Dict[str, FileState]:
+        query = "SELECT path, id, last_mtime, last_size, indexing_status FROM files"
+        with self._read_connection() as conn:
+            # Plain tuples: this runs over every tracked file on each build.
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            if paths is None:
+                return {row[0]: FileState(*row[1:]) for row in cursor.execute(query)}
+
+            states: Dict[str, FileState] = {}
+            wanted = list(paths)
+            for start in range(0, len(wanted), _MAX_IN_PARAMS):
+                batch = wanted[start : start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"{query} WHERE path IN ({placeholders})", batch)
+                states.update((row[0], FileState(*row[1:])) for row in cursor)
+            return states
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._read_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM index_meta WHERE key = ?", (key,)
+            ).fetchone()
+            return row[0] if row else None
+
+    def set_meta(self, key: str, value: Optional[str]) -> None:
         with self.db.get_connection() as conn:
+            if value is None:
+                conn.execute("DELETE FROM index_meta WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+
+    def get_all_dependency_edges(self) -> List[DependencyEdge]:
+        with self._read_connection() as conn:
             rows = conn.execute(
                 """
                 SELECT
@@ -196,12 +555,65 @@ class IndexStore:
             ).fetchall()
             return [DependencyEdge(**dict(row)) for row in rows]
 
+    def get_dependency_graph_digest(self) -> str:
+        memo = self.get_meta(_GRAPH_DIGEST_META)
+        if memo is not None:
+            return memo
+        digest = self._compute_dependency_graph_digest()
+        self.set_meta(_GRAPH_DIGEST_META, digest)
+        return digest
+
+    def _compute_dependency_graph_digest(self) -> str:
+        # Rows are streamed in a fixed order, so equal graphs hash equally.
+        queries = (
+            "SELECT path FROM files ORDER BY path",
+            """
+            SELECT DISTINCT f.path, r.target_fqn
+            FROM "references" r
+            JOIN files f ON r.source_file_id = f.id
+            WHERE r.target_fqn IS NOT NULL
+              -- Unresolvable (e.g. external) targets never become edges.
+              AND EXISTS (
+                  SELECT 1 FROM symbols s WHERE s.canonical_fqn = r.target_fqn
+              )
+            ORDER BY f.path, r.target_fqn
+            """,
+            """
+            SELECT s.canonical_fqn, f.path, s.kind, s.alias_target_fqn
+            FROM symbols s
+            JOIN files f ON s.file_id = f.id
+            WHERE s.kind = 'alias'
+               OR s.canonical_fqn IN (
+                   SELECT target_fqn FROM "references" WHERE target_fqn IS NOT NULL
+               )
+            ORDER BY s.canonical_fqn, f.path, s.id
+            """,
+        )
+        digest = hashlib.sha256()
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            for query in queries:
+                digest.update(b"\x1d")
+                for row in cursor.execute(query):
+                    digest.update(repr(row).encode("utf-8"))
+                    digest.update(b"\n")
+        return digest.hexdigest()
+
     def delete_file(self, file_id: int) -> None:
+        if self._bulk is not None:
+            self._bulk.deleted_files.append((file_id,))
+            if self._bulk.size >= self._bulk.flush_size:
+                self._flush_bulk()
+            return
+
         with self.db.get_connection() as conn:
-            conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            self._track_removed_symbols(conn, [file_id])
+            conn.execute(_CLEAR_GRAPH_DIGEST_SQL)
+            conn.execute(_DELETE_FILE_SQL, (file_id,))
 
     def find_symbol_by_fqn(self, target_fqn: str) -> Optional[Tuple[SymbolRecord, str]]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             row = conn.execute(
                 """
                 SELECT s.*, f.path as file_path
@@ -223,9 +635,11 @@ class IndexStore:
     def find_references(
         self, target_fqn: str, target_id: Optional[str] = None
     ) -> List[Tuple[ReferenceRecord, str]]:
-        with self.db.get_connection() as conn:
+        with self._read_connection() as conn:
             # Join references with files to get the path
-            # We search for matches by FQN (weak/unlinked refs) OR by ID (strong/linked refs)
+            # We search for matches by FQN (weak/unlinked refs) and by ID (strong/linked refs).
+            # The two lookups are combined with UNION rather than OR so each
+            # branch is answered from its own index.
             query = """
                 SELECT r.*, f.path as file_path
                 FROM "references" r
@@ -235,7 +649,13 @@ class IndexStore:
             params = [target_fqn]
 
             if target_id:
-                query += " OR r.target_id = ?"
+                query += """
+                UNION
+                SELECT r.*, f.path as file_path
+                FROM "references" r
+                JOIN files f ON r.source_file_id = f.id
+                WHERE r.target_id = ?
+                """
                 params.append(target_id)
 
             rows = conn.execute(query, tuple(params)).fetchall()
@@ -0,0 +1,86 @@
+from textwrap import dedent
+
+from stitcher.index.indexer import FileIndexer
+from stitcher.lang.python.adapter import PythonAdapter
+from stitcher.lang.python.uri import PythonURIGenerator
+from stitcher.test_utils.workspace import WorkspaceFactory
+from stitcher.workspace import Workspace
+
+
+def _make_indexer(project_root, store) -> FileIndexer:
+    indexer = FileIndexer(project_root, store)
+    indexer.register_adapter(
+        ".py", PythonAdapter(project_root, [project_root], PythonURIGenerator())
+    )
+    return indexer
+
+
+def _alias_and_ref_targets(store, path: str):
+    rec = store.get_file_by_path(path)
+    aliases = {
+        s.name: s.alias_target_id
+        for s in store.get_symbols_by_file(rec.id)
+        if s.kind == "alias"
+    }
+    refs = {r.target_fqn: r.target_id for r in store.get_references_by_file(rec.id)}
+    return aliases, refs
+
+
+def test_incremental_linker_follows_target_changes(
+    workspace_factory: WorkspaceFactory, store
+):
+    """
+    Only defs.py is re-indexed between runs, yet links held by main.py must
+    be dropped when their target disappears and restored when it comes back.
+    """
+    wf = workspace_factory
+    wf.with_source("pkg/__init__.py", "")
+    wf.with_source("pkg/defs.py", "class MyClass:\n    pass\n")
+    wf.with_source(
+        "pkg/main.py",
+        dedent(
+            """
+            from pkg.defs import MyClass
+
+            instance = MyClass()
+            """
+        ),
+    )
+    project_root = wf.build()
+    workspace = Workspace(project_root)
+    indexer = _make_indexer(project_root, store)
+
+    indexer.index_files(workspace.discover_files())
+    aliases, refs = _alias_and_ref_targets(store, "pkg/main.py")
+    assert aliases["MyClass"] == "py://pkg/defs.py#MyClass"
+    assert refs["pkg.defs.MyClass"] == "py://pkg/defs.py#MyClass"
+
+    # 1. Target disappears -> links are cleared.
+    (project_root / "pkg/defs.py").write_text("class Other:\n    pass\n")
+    stats = indexer.index_files(workspace.discover_files())
+    assert stats["modified_paths"] == {"pkg/defs.py"}
+    aliases, refs = _alias_and_ref_targets(store, "pkg/main.py")
+    assert aliases["MyClass"] is None
+    assert refs["pkg.defs.MyClass"] is None
+
+    # 2. Target comes back -> links are restored without touching main.py.
+    (project_root / "pkg/defs.py").write_text("class MyClass:\n    x = 1\n")
+    stats = indexer.index_files(workspace.discover_files())
+    assert stats["modified_paths"] == {"pkg/defs.py"}
+    aliases, refs = _alias_and_ref_targets(store, "pkg/main.py")
+    assert aliases["MyClass"] == "py://pkg/defs.py#MyClass"
+    assert refs["pkg.defs.MyClass"] == "py://pkg/defs.py#MyClass"
+
+
+def test_noop_reindex_skips_linking(workspace_factory: WorkspaceFactory, store, mocker):
+    wf = workspace_factory
+    wf.with_source("pkg/__init__.py", "")
+    wf.with_source("pkg/defs.py", "def helper():\n    pass\n")
+    project_root = wf.build()
+    workspace = Workspace(project_root)
+    indexer = _make_indexer(project_root, store)
+    indexer.index_files(workspace.discover_files())
+
+    spy = mocker.spy(store._linker, "_load_temp_set")
+    indexer.index_files(workspace.discover_files())
+    spy.assert_not_called()
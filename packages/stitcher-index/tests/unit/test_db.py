@@ -0,0 +1,115 @@
+import sqlite3
+
+from stitcher.index.db import DatabaseManager, SCHEMA_VERSION
+from stitcher.index.store import IndexStore
+
+
+def _user_version(db_path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _index_names(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+
+
+def test_initialize_stamps_schema_version(db_manager, db_path):
+    assert _user_version(db_path) == SCHEMA_VERSION
+
+
+def test_initialize_is_noop_when_version_matches(db_manager, db_path, mocker):
+    spy_create = mocker.spy(db_manager, "_create_schema")
+    spy_migrate = mocker.spy(db_manager, "_migrate")
+
+    DatabaseManager(db_path).initialize()
+    db_manager.initialize()
+
+    spy_create.assert_not_called()
+    spy_migrate.assert_not_called()
+
+
+def test_unversioned_database_is_migrated_in_place(store, db_path):
+    fid, _ = store.sync_file("src/main.py", "h1", 1.0, 1)
+
+    # Recreate the state of a database written before versioning existed.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP INDEX idx_symbols_file_fqn")
+        conn.execute("CREATE INDEX idx_symbols_file_id ON symbols(file_id)")
+        conn.execute("PRAGMA user_version = 0")
+
+    DatabaseManager(db_path).initialize()
+
+    assert _user_version(db_path) == SCHEMA_VERSION
+    indexes = _index_names(db_path)
+    assert "idx_symbols_file_fqn" in indexes
+    assert "idx_symbols_file_id" not in indexes
+    # Existing data survives the migration.
+    assert store.get_file_by_path("src/main.py").id == fid
+
+
+def test_newer_database_is_rebuilt(store, db_path):
+    store.sync_file("src/main.py", "h1", 1.0, 1)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+    DatabaseManager(db_path).initialize()
+
+    assert _user_version(db_path) == SCHEMA_VERSION
+    assert store.get_all_files() == []
+
+
+def test_pragma_profile_is_applied(db_path):
+    manager = DatabaseManager(
+        db_path, pragmas={"cache_size": -1024, "temp_store": "FILE", "bogus": 1}
+    )
+    manager.initialize()
+
+    with manager.get_connection() as conn:
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+        # 1 == FILE
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_invalid_pragma_value_is_ignored(db_path):
+    manager = DatabaseManager(db_path, pragmas={"temp_store": "MEMORY; DROP"})
+    assert manager.pragmas["temp_store"] == "MEMORY"
+
+
+def test_persistent_mode_reuses_one_connection(db_path, mocker):
+    manager = DatabaseManager(db_path, persistent=True)
+    manager.initialize()
+    store = IndexStore(manager)
+
+    spy_connect = mocker.spy(sqlite3, "connect")
+    store.sync_file("src/main.py", "h1", 1.0, 1)
+    with manager.session():
+        store.get_file_by_path("src/main.py")
+    store.get_all_files()
+    spy_connect.assert_not_called()
+
+    with manager.get_connection() as conn:
+        trace = []
+        conn.set_trace_callback(trace.append)
+    manager.close()
+    assert "PRAGMA optimize" in trace
+
+    # A closed manager transparently reconnects.
+    assert store.get_file_by_path("src/main.py") is not None
+
+
+def test_read_only_manager_cannot_write(store, db_path):
+    store.sync_file("src/main.py", "h1", 1.0, 1)
+    reader = IndexStore(DatabaseManager(db_path, read_only=True))
+
+    assert reader.get_file_by_path("src/main.py") is not None
+    try:
+        reader.sync_file("src/other.py", "h2", 1.0, 1)
+    except sqlite3.OperationalError as e:
+        assert "readonly" in str(e)
+    else:
+        raise AssertionError("read-only manager accepted a write")
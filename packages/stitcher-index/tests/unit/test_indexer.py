@@ -1,5 +1,10 @@
+import json
+import os
 import time
 from stitcher.index.indexer import FileIndexer
+from stitcher.index.parse_cache import ParseCache
+from stitcher.lang.sidecar import LockFileManager
+from stitcher.spec import Fingerprint
 from stitcher.spec.index import SymbolRecord
 from stitcher.test_utils.workspace import WorkspaceFactory
 from stitcher.workspace import Workspace
@@ -135,3 +140,220 @@ def test_index_files_deletion(workspace_factory: WorkspaceFactory, store):
     stats = indexer.index_files(workspace.discover_files())
     assert stats["deleted"] == 1
     assert store.get_file_by_path("todelete.py") is None
+
+
+class FailingAdapter:
+    def parse(self, file_path: Path, content: str):
+        if "boom" in content:
+            raise ValueError(f"cannot parse {file_path.name}")
+        return MockAdapter().parse(file_path, content)
+
+
+def test_index_files_parallel_matches_serial(
+    workspace_factory: WorkspaceFactory, tmp_path
+):
+    """A process-pool run must produce the same index and stats as a serial run."""
+    from stitcher.index.db import DatabaseManager
+    from stitcher.index.store import IndexStore
+
+    wf = workspace_factory.init_git()
+    for i in range(20):
+        wf.with_source(f"pkg/mod_{i}.py", f"x = {i}")
+    wf.with_source("pkg/broken_a.py", "boom")
+    wf.with_source("pkg/broken_b.py", "boom")
+    wf.build()
+    files = Workspace(wf.root_path).discover_files()
+
+    def run(db_name: str, workers: int):
+        db = DatabaseManager(tmp_path / db_name)
+        db.initialize()
+        store = IndexStore(db)
+        indexer = FileIndexer(wf.root_path, store, max_workers=workers)
+        indexer.register_adapter(".py", FailingAdapter())
+        return store, indexer.index_files(files)
+
+    serial_store, serial_stats = run("serial.db", 1)
+    parallel_store, parallel_stats = run("parallel.db", 4)
+
+    assert parallel_stats == serial_stats
+    assert parallel_stats["errors"] == 2
+    assert parallel_stats["error_details"] == [
+        (str(wf.root_path / "pkg/broken_a.py"), "cannot parse broken_a.py"),
+        (str(wf.root_path / "pkg/broken_b.py"), "cannot parse broken_b.py"),
+    ]
+
+    for path in ("pkg/mod_0.py", "pkg/mod_19.py"):
+        serial_rec = serial_store.get_file_by_path(path)
+        parallel_rec = parallel_store.get_file_by_path(path)
+        assert parallel_rec.indexing_status == 1
+        assert [s.id for s in parallel_store.get_symbols_by_file(parallel_rec.id)] == [
+            s.id for s in serial_store.get_symbols_by_file(serial_rec.id)
+        ]
+
+    # Files that failed to parse stay dirty so the next run retries them.
+    assert parallel_store.get_file_by_path("pkg/broken_a.py").indexing_status == 0
+
+
+def test_parse_workers_are_not_forked(tmp_path, store):
+    # Workers start while the index connection and I/O threads are live.
+    indexer = FileIndexer(tmp_path, store, max_workers=4)
+
+    assert indexer.mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+class DuplicateIdAdapter:
+    def parse(self, file_path: Path, content: str):
+        symbols, references = MockAdapter().parse(file_path, content)
+        if "dup" in content:
+            # Collides with the symbol of every other "dup" file.
+            symbols[0].id = "py://dup.py#Main"
+        return symbols, references
+
+
+def test_index_files_records_storage_errors_per_file(
+    workspace_factory: WorkspaceFactory, store
+):
+    wf = workspace_factory.init_git()
+    wf.with_source("a.py", "dup").with_source("b.py", "dup").with_source("c.py", "ok")
+    wf.build()
+
+    indexer = FileIndexer(wf.root_path, store)
+    indexer.register_adapter(".py", DuplicateIdAdapter())
+    stats = indexer.index_files(Workspace(wf.root_path).discover_files())
+
+    assert stats["errors"] == 1
+    [(path, error)] = stats["error_details"]
+    assert path == str(wf.root_path / "b.py")
+    assert "UNIQUE" in error
+    # The other files of the batch are stored; the failing one is retried.
+    assert store.get_file_by_path("a.py").indexing_status == 1
+    assert store.get_file_by_path("c.py").indexing_status == 1
+    assert store.get_file_by_path("b.py").indexing_status == 0
+
+
+def test_index_files_adapter_files_only(workspace_factory: WorkspaceFactory, store):
+    wf = workspace_factory.init_git()
+    wf.with_source("app.py", "class Main: pass")
+    wf.with_raw_file("logo.png", "not really a png")
+    wf.build()
+
+    workspace = Workspace(wf.root_path)
+    FileIndexer(wf.root_path, store).index_files(workspace.discover_files())
+    assert store.get_file_by_path("logo.png") is not None
+
+    indexer = FileIndexer(wf.root_path, store, adapter_files_only=True)
+    indexer.register_adapter(".py", MockAdapter())
+    stats = indexer.index_files(workspace.discover_files())
+
+    # Entries tracked before the switch are dropped.
+    assert stats["deleted"] == 1
+    assert store.get_file_by_path("logo.png") is None
+    assert store.get_file_by_path("app.py") is not None
+
+
+def test_index_files_warm_run_reads_nothing(
+    workspace_factory: WorkspaceFactory, store, mocker
+):
+    wf = workspace_factory.init_git()
+    for i in range(5):
+        wf.with_source(f"pkg/mod{i}.py", f"x = {i}")
+    wf.build()
+
+    workspace = Workspace(wf.root_path)
+    indexer = FileIndexer(wf.root_path, store)
+    indexer.register_adapter(".py", MockAdapter())
+    indexer.index_files(workspace.discover_files())
+
+    spy_read = mocker.spy(indexer, "_take_snapshot")
+    stats = indexer.index_files(workspace.discover_files())
+
+    assert stats["skipped"] == 5
+    spy_read.assert_not_called()
+
+
+class CachedMockAdapter(MockAdapter):
+    cache_fingerprint = "mock:1"
+
+
+def test_index_files_replays_parse_cache(
+    workspace_factory: WorkspaceFactory, store, tmp_path, mocker
+):
+    wf = workspace_factory.with_source("main.py", "v1")
+    wf.build()
+    cache = ParseCache(tmp_path / "cache", max_bytes=1024 * 1024)
+    adapter = CachedMockAdapter()
+    indexer = FileIndexer(wf.root_path, store, parse_cache=cache)
+    indexer.register_adapter(".py", adapter)
+    spy_parse = mocker.spy(adapter, "parse")
+
+    main_py = wf.root_path / "main.py"
+    indexer.index_files({"main.py"})
+    main_py.write_text("v2")
+    os.utime(main_py, (1000, 1000))
+    indexer.index_files({"main.py"})
+    assert spy_parse.call_count == 2
+
+    # Restoring earlier content (e.g. a branch switch) replays the stored result.
+    main_py.write_text("v1")
+    os.utime(main_py, (2000, 2000))
+    stats = indexer.index_files({"main.py"})
+    assert stats["updated"] == 1
+    assert spy_parse.call_count == 2
+    symbols = store.get_symbols_by_file_path("main.py")
+    assert [s.id for s in symbols] == ["py://main.py#Main"]
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(tmp_path, max_bytes=1)
+    symbols, _ = MockAdapter().parse(Path("a.py"), "")
+    keys = [ParseCache.make_key(f"h{i}", "a.py", "fp") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, symbols, [])
+        entry = tmp_path / key[:2] / f"{key}.json"
+        os.utime(entry, (i, i))
+
+    assert cache.get(keys[0]) is not None  # touching makes it most recent
+    cache.max_bytes = entry.stat().st_size * 2
+    assert cache.evict() == 2
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is None
+
+
+def test_index_files_mirrors_lock_files(
+    workspace_factory: WorkspaceFactory, store, mocker
+):
+    lock = {
+        "fingerprints": {
+            "py://pkg/a.py#f": {"baseline_code_structure_hash": "1"},
+            "py://pkg/b.py#g": {"baseline_code_structure_hash": "2"},
+        },
+        "version": "1.0",
+    }
+    wf = workspace_factory.with_raw_file("pkg/stitcher.lock", json.dumps(lock))
+    wf.build()
+    indexer = FileIndexer(wf.root_path, store, adapter_files_only=True)
+    indexer.register_adapter(".py", MockAdapter())
+    indexer.index_files({"pkg/stitcher.lock"})
+
+    lock_id = store.get_file_by_path("pkg/stitcher.lock").id
+    assert store.get_lock_fingerprints(lock_id, ["py://pkg/a.py"]) == {
+        "py://pkg/a.py#f": Fingerprint.from_dict(
+            lock["fingerprints"]["py://pkg/a.py#f"]
+        )
+    }
+
+    # Partial loads are answered by the index while it matches the file.
+    pkg_root = wf.root_path / "pkg"
+    lock_manager = LockFileManager(wf.root_path, store)
+    spy_query = mocker.spy(store, "get_lock_fingerprints")
+    assert set(lock_manager.load(pkg_root, ["py://pkg/b.py"])) == {"py://pkg/b.py#g"}
+    assert spy_query.call_count == 1
+
+    # A lock written after the last build is read from disk instead.
+    lock_manager.save(pkg_root, {"py://pkg/b.py#h": Fingerprint()})
+    assert set(lock_manager.load(pkg_root, ["py://pkg/b.py"])) == {"py://pkg/b.py#h"}
+    assert spy_query.call_count == 1
+
+    indexer.index_files({"pkg/stitcher.lock"})
+    assert store.get_lock_fingerprints(lock_id) == {"py://pkg/b.py#h": Fingerprint()}
@@ -0,0 +1,110 @@
+import re
+from typing import List
+
+from stitcher.spec.index import SymbolRecord, ReferenceRecord
+
+# A plan step like "SCAN symbols" (no index at all) means the query touches
+# every row of the table. "SCAN r USING COVERING INDEX ..." is acceptable.
+FULL_SCAN = re.compile(r"^SCAN (\S+)$")
+
+
+def _populate(store, count: int = 20) -> None:
+    for i in range(count):
+        fid, _ = store.sync_file(f"pkg/m{i}.py", f"h{i}", 1.0, 1)
+        store.update_analysis(
+            fid,
+            [
+                SymbolRecord(
+                    id=f"py://pkg/m{i}.py#A",
+                    name="A",
+                    kind="class",
+                    lineno=1,
+                    col_offset=0,
+                    end_lineno=1,
+                    end_col_offset=1,
+                    canonical_fqn=f"pkg.m{i}.A",
+                ),
+                SymbolRecord(
+                    id=f"py://pkg/m{i}.py#B",
+                    name="B",
+                    kind="alias",
+                    lineno=2,
+                    col_offset=0,
+                    end_lineno=2,
+                    end_col_offset=1,
+                    canonical_fqn=f"pkg.m{i}.B",
+                    alias_target_fqn=f"pkg.m{(i + 1) % count}.A",
+                ),
+            ],
+            [
+                ReferenceRecord(
+                    kind="call",
+                    lineno=3,
+                    col_offset=0,
+                    end_lineno=3,
+                    end_col_offset=1,
+                    target_fqn=f"pkg.m{(i + 1) % count}.A",
+                )
+            ],
+        )
+    store.resolve_missing_links()
+
+
+def _full_scans(conn, statements: List[str]) -> List[str]:
+    offenders = []
+    for sql in statements:
+        if sql.lstrip().split()[0].upper() not in ("SELECT", "UPDATE", "DELETE"):
+            continue
+        for row in conn.execute("EXPLAIN QUERY PLAN " + sql):
+            match = FULL_SCAN.match(row[3])
+            # Temp tables only hold the keys of the current run.
+            if match and not match.group(1).startswith("link_"):
+                offenders.append(f"{row[3]}  <-  {' '.join(sql.split())}")
+    return offenders
+
+
+def test_hot_paths_do_not_scan_tables(store, db_manager):
+    _populate(store)
+
+    statements: List[str] = []
+    with db_manager.session(), db_manager.get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            store.get_file_by_path("pkg/m1.py")
+            store.get_symbols_by_file_path("pkg/m1.py")
+            store.find_symbol_by_fqn("pkg.m1.A")
+            store.find_references("pkg.m1.A", "py://pkg/m1.py#A")
+            store.get_all_dependency_edges()
+
+            fid, _ = store.sync_file("pkg/m2.py", "changed", 2.0, 2)
+            store.update_analysis(fid, [], [])
+            store.delete_file(store.get_file_by_path("pkg/m3.py").id)
+            store.resolve_missing_links()
+        finally:
+            conn.set_trace_callback(None)
+
+        assert _full_scans(conn, statements) == []
+
+
+def test_find_references_matches_fqn_or_id(store):
+    _populate(store, count=3)
+    # Simulate a reference that is linked by ID but carries a different FQN.
+    fid, _ = store.sync_file("pkg/other.py", "h", 1.0, 1)
+    store.update_analysis(
+        fid,
+        [],
+        [
+            ReferenceRecord(
+                kind="call",
+                lineno=1,
+                col_offset=0,
+                end_lineno=1,
+                end_col_offset=1,
+                target_fqn="pkg.reexport.A",
+                target_id="py://pkg/m1.py#A",
+            )
+        ],
+    )
+
+    refs = store.find_references("pkg.m1.A", "py://pkg/m1.py#A")
+    assert sorted(path for _, path in refs) == ["pkg/m0.py", "pkg/other.py"]
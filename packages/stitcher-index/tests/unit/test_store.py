@@ -99,3 +99,84 @@ def test_analysis_replacement(store):
     store.update_analysis(fid, [], [])
 
     assert len(store.get_symbols_by_file(fid)) == 0
+
+
+def _symbol(suri: str, name: str) -> SymbolRecord:
+    return SymbolRecord(
+        id=suri,
+        name=name,
+        kind="function",
+        lineno=1,
+        col_offset=0,
+        end_lineno=1,
+        end_col_offset=1,
+    )
+
+
+def test_bulk_ingest_batches_writes(store):
+    fid_a, _ = store.sync_file("src/a.py", "ha", 100, 10)
+    fid_b, _ = store.sync_file("src/b.py", "hb", 100, 10)
+    fid_gone, _ = store.sync_file("src/gone.py", "hg", 100, 10)
+
+    with store.bulk_ingest(flush_size=2):
+        store.update_analysis(fid_a, [_symbol("py://src/a.py#f", "f")], [])
+        store.update_analysis(
+            fid_b,
+            [_symbol("py://src/b.py#g", "g"), _symbol("py://src/b.py#h", "h")],
+            [],
+        )
+        store.delete_file(fid_gone)
+
+        # Reads inside the bulk scope observe buffered rows.
+        assert store.get_file_by_path("src/gone.py") is None
+        assert len(store.get_symbols_by_file(fid_b)) == 2
+
+        # Re-analysing a file in the same scope replaces its rows.
+        store.update_analysis(fid_a, [_symbol("py://src/a.py#f2", "f2")], [])
+
+    assert [s.name for s in store.get_symbols_by_file(fid_a)] == ["f2"]
+    assert store.get_file_by_path("src/a.py").indexing_status == 1
+    assert store.get_file_by_path("src/b.py").indexing_status == 1
+
+
+def test_bulk_ingest_rolls_back_on_error(store):
+    fid, _ = store.sync_file("src/a.py", "ha", 100, 10)
+
+    try:
+        with store.bulk_ingest():
+            store.update_analysis(fid, [_symbol("py://src/a.py#f", "f")], [])
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    assert store.get_symbols_by_file(fid) == []
+    assert store.get_file_by_path("src/a.py").indexing_status == 0
+
+
+def test_get_file_states(store):
+    fid, _ = store.sync_file("src/a.py", "h1", 10.5, 42)
+    store.update_analysis(fid, [], [])
+    store.sync_file("src/b.py", "h2", 11.0, 7)
+
+    states = store.get_file_states()
+
+    assert states["src/a.py"] == (fid, 10.5, 42, 1)
+    assert states["src/b.py"].indexing_status == 0
+
+
+def test_get_symbols_by_file_paths(store):
+    fid_a, _ = store.sync_file("src/a.py", "ha", 100, 10)
+    fid_b, _ = store.sync_file("src/b.py", "hb", 100, 10)
+    store.update_analysis(fid_a, [_symbol("py://src/a.py#f", "f")], [])
+    store.update_analysis(
+        fid_b,
+        [_symbol("py://src/b.py#g", "g"), _symbol("py://src/b.py#h", "h")],
+        [],
+    )
+
+    symbols = store.get_symbols_by_file_paths(["src/a.py", "src/b.py", "missing.py"])
+
+    assert set(symbols) == {"src/a.py", "src/b.py"}
+    assert [s.name for s in symbols["src/a.py"]] == ["f"]
+    assert sorted(s.name for s in symbols["src/b.py"]) == ["g", "h"]
+    assert symbols["src/b.py"][0].file_id == fid_b
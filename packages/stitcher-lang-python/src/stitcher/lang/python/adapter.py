@@ -15,6 +15,11 @@ from .fingerprint import PythonFingerprintStrategy
 from .parser.griffe import GriffePythonParser
 
 
+# Bump whenever parse() output changes for the same input, so that entries of
+# the index parse cache written by older versions are no longer used.
+PARSE_CACHE_VERSION = "1"
+
+
 class PythonAdapter(LanguageAdapter):
     def __init__(
         self,
@@ -27,6 +32,17 @@ class PythonAdapter(LanguageAdapter):
         self.parser = GriffePythonParser()
         self.hasher = PythonFingerprintStrategy()
         self.uri_generator = uri_generator
+        # FQNs depend on the search paths, so they are part of the cache key.
+        search_key = ",".join(
+            sorted(self._relative_search_path(p) for p in search_paths)
+        )
+        self.cache_fingerprint = f"python:{PARSE_CACHE_VERSION}:{search_key}"
+
+    def _relative_search_path(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.root_path).as_posix()
+        except ValueError:
+            return path.as_posix()
 
     def _get_source_root_for_file(self, file_path: Path) -> Path:
         longest_match: Optional[Path] = None
@@ -1,6 +1,7 @@
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 from .adapter import SidecarAdapter
+from .cache import SidecarCache
 from .indexer import SidecarIndexerAdapter
 from .uri import SidecarURIGenerator
 from .lock_manager import LockFileManager
@@ -11,6 +12,7 @@ from .merger import DocstringMerger
 
 __all__ = [
     "SidecarAdapter",
+    "SidecarCache",
     "SidecarIndexerAdapter",
     "SidecarURIGenerator",
     "LockFileManager",
@@ -1,6 +1,6 @@
 import io
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
 
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import LiteralScalarString
@@ -10,7 +10,9 @@ from stitcher.spec.protocols import DocstringSerializerProtocol
 from stitcher.spec.registry import LanguageAdapter
 from stitcher.spec.index import SymbolRecord, ReferenceRecord
 
+from .cache import SidecarCache
 from .parser import (
+    load_doc_fragments,
     parse_doc_references,
     parse_signature_references,
 )
@@ -23,9 +25,11 @@ class SidecarAdapter(LanguageAdapter):
         self,
         root_path: Path,
         uri_generator: URIGeneratorProtocol,
+        sidecar_cache: Optional[SidecarCache] = None,
     ):
         self.root_path = root_path
         self.uri_generator = uri_generator
+        self.sidecar_cache = sidecar_cache
         self.resolver = AssetPathResolver(root_path)
         self._yaml = YAML()
         self._yaml.indent(mapping=2, sequence=4, offset=2)
@@ -103,14 +107,12 @@ class SidecarAdapter(LanguageAdapter):
             return {}
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                raw_data = self._yaml.load(f)
-            if not isinstance(raw_data, dict):
-                return {}
-
-            return {
-                fqn: serializer.from_view_data(val) for fqn, val in raw_data.items()
-            }
+            # Read-only: no need for ruamel's round-trip loader.
+            if self.sidecar_cache:
+                fragments = self.sidecar_cache.load_fragments(path)
+            else:
+                fragments = load_doc_fragments(path.read_text(encoding="utf-8"))
+            return {fqn: serializer.from_view_data(val) for fqn, val, _, _ in fragments}
         except Exception:
             return {}
 
@@ -119,34 +121,27 @@ class SidecarAdapter(LanguageAdapter):
         path: Path,
         irs: Dict[str, DocstringIR],
         serializer: DocstringSerializerProtocol,
+        reformat: bool = False,
     ) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if path.exists():
             # --- UPDATE PATH ---
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = self._yaml.load(f)
                 original_content = path.read_text("utf-8")
-            except Exception:
-                data = {}
+            except (OSError, UnicodeDecodeError):
                 original_content = ""
 
-            if not isinstance(data, dict):
-                data = {}
-
-            for fqn, ir in irs.items():
-                view_obj = serializer.to_view_data(ir)
-                if isinstance(view_obj, str):
-                    data[fqn] = LiteralScalarString(view_obj)
-                elif isinstance(view_obj, dict):
-                    data[fqn] = self._to_literal_strings(view_obj)
-                else:
-                    data[fqn] = view_obj
-
-            string_stream = io.StringIO()
-            self._yaml.dump(data, string_stream)
-            new_content = string_stream.getvalue()
+            view_data = {fqn: serializer.to_view_data(ir) for fqn, ir in irs.items()}
+            # Only the blocks of changed keys are rewritten; `reformat` (or a
+            # document the patcher cannot handle) re-dumps the whole file.
+            new_content = (
+                None
+                if reformat
+                else self._patch_doc_content(original_content, view_data)
+            )
+            if new_content is None:
+                new_content = self._redump_doc_content(original_content, view_data)
 
             if original_content != new_content:
                 with path.open("w", encoding="utf-8") as f:
@@ -163,6 +158,78 @@ class SidecarAdapter(LanguageAdapter):
             with path.open("w", encoding="utf-8") as f:
                 f.write(string_stream.getvalue())
 
+    def _redump_doc_content(self, content: str, view_data: Dict[str, Any]) -> str:
+        try:
+            data = self._yaml.load(content)
+        except Exception:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        for fqn, view_obj in view_data.items():
+            if isinstance(view_obj, str):
+                data[fqn] = LiteralScalarString(view_obj)
+            elif isinstance(view_obj, dict):
+                data[fqn] = self._to_literal_strings(view_obj)
+            else:
+                data[fqn] = view_obj
+
+        string_stream = io.StringIO()
+        self._yaml.dump(data, string_stream)
+        return string_stream.getvalue()
+
+    def _patch_doc_content(
+        self, content: str, view_data: Dict[str, Any]
+    ) -> Optional[str]:
+        # Returns None when the document is not a block mapping of string keys,
+        # one per line at column 0 (e.g. empty, invalid or flow style).
+        fragments = load_doc_fragments(content)
+        if not fragments:
+            return None
+        starts: List[int] = []
+        for fragment, _, lineno, col_offset in fragments:
+            if not isinstance(fragment, str) or col_offset != 0 or lineno < 1:
+                return None
+            if starts and lineno - 1 <= starts[-1]:
+                return None
+            starts.append(lineno - 1)
+
+        stored = {fragment: value for fragment, value, _, _ in fragments}
+        changed = {
+            fqn: view_obj
+            for fqn, view_obj in view_data.items()
+            if fqn not in stored or stored[fqn] != view_obj
+        }
+        if not changed:
+            return content
+
+        lines = content.splitlines(keepends=True)
+        out: List[str] = []
+        pos = 0
+        for i, (fragment, _, _, _) in enumerate(fragments):
+            if fragment not in changed:
+                continue
+            # A block runs from its key to its last indented line; blank lines
+            # and column-0 comments before the next key are left in place.
+            start = starts[i]
+            limit = starts[i + 1] if i + 1 < len(starts) else len(lines)
+            end = start + 1
+            for j in range(start + 1, limit):
+                if lines[j][:1] in (" ", "\t") and lines[j].strip():
+                    end = j + 1
+            out.extend(lines[pos:start])
+            out.append(self.dump_to_string({fragment: changed[fragment]}))
+            pos = end
+        out.extend(lines[pos:])
+
+        new_content = "".join(out)
+        added = {fqn: v for fqn, v in changed.items() if fqn not in stored}
+        if added:
+            if new_content and not new_content.endswith("\n"):
+                new_content += "\n"
+            new_content += self.dump_to_string(added)
+        return new_content
+
     def dump_to_string(self, data: Dict[str, Any]) -> str:
         string_stream = io.StringIO()
         self._yaml.dump(self._to_literal_strings(data), string_stream)
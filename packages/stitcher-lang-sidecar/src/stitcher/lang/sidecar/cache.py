@@ -0,0 +1,75 @@
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .parser import DocFragment, load_doc_fragments
+
+log = logging.getLogger(__name__)
+
+# Bump when the entry layout or the fragment format changes.
+SIDECAR_CACHE_FORMAT = 1
+
+# (format, mtime_ns, size, content hash, fragments)
+_Entry = Tuple[int, int, int, str, List[DocFragment]]
+
+
+class SidecarCache:
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def _read(self, entry_path: Path) -> Optional[_Entry]:
+        try:
+            entry = marshal.loads(entry_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, TypeError) as e:
+            log.debug(f"Discarding unreadable sidecar cache entry {entry_path}: {e}")
+            return None
+        if not isinstance(entry, tuple) or len(entry) != 5:
+            return None
+        if entry[0] != SIDECAR_CACHE_FORMAT:
+            return None
+        return entry
+
+    def _write(self, entry_path: Path, entry: _Entry) -> None:
+        try:
+            payload = marshal.dumps(entry)
+        except ValueError:
+            # Values of a type marshal does not support (e.g. YAML timestamps).
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, entry_path)
+        except OSError as e:
+            log.debug(f"Could not write sidecar cache entry {entry_path}: {e}")
+
+    def load_fragments(self, path: Path) -> List[DocFragment]:
+        st = path.stat()
+        entry_path = self._entry_path(path)
+        entry = self._read(entry_path)
+        if entry and (entry[1], entry[2]) == (st.st_mtime_ns, st.st_size):
+            return entry[4]
+
+        content = path.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if entry and entry[3] == content_hash:
+            # Touched but unchanged: keep the fragments, refresh the stat.
+            fragments = entry[4]
+        else:
+            fragments = load_doc_fragments(content.decode("utf-8"))
+        self._write(
+            entry_path,
+            (SIDECAR_CACHE_FORMAT, st.st_mtime_ns, st.st_size, content_hash, fragments),
+        )
+        return fragments
@@ -1,15 +1,18 @@
 import json
 import hashlib
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from ruamel.yaml import YAML
-
-from stitcher.spec import URIGeneratorProtocol
+from stitcher.spec import DocstringSerializerProtocol, URIGeneratorProtocol
 from stitcher.spec.registry import LanguageAdapter
 from stitcher.spec.index import SymbolRecord, ReferenceRecord
-from .parser import parse_doc_references
+from .manager import hash_transfer_data, stored_hash_prefix
+from .parser import load_doc_fragments
 from stitcher.lang.python.analysis.utils import path_to_logical_fqn
+from stitcher.lang.python.docstring import get_docstring_serializer
+
+# Maps the workspace-relative path of a source file to its docstring style.
+StyleResolver = Callable[[Path], Optional[str]]
 
 
 class SidecarIndexerAdapter(LanguageAdapter):
@@ -17,11 +20,26 @@ class SidecarIndexerAdapter(LanguageAdapter):
         self,
         root_path: Path,
         uri_generator: URIGeneratorProtocol,
+        style_resolver: Optional[StyleResolver] = None,
     ):
         self.root_path = root_path
         self.uri_generator = uri_generator
-        self._yaml = YAML()
-        self._yaml.preserve_quotes = True
+        self.style_resolver = style_resolver
+        self._serializers: Dict[str, DocstringSerializerProtocol] = {}
+
+    def _style_hash(self, style: str, content_json: str) -> Optional[str]:
+        # Same computation as DocumentManager.compute_ir_hash over the IR that
+        # check hydrates from the stored JSON, done once at index time.
+        serializer = self._serializers.get(style)
+        if serializer is None:
+            serializer = get_docstring_serializer(style)
+            self._serializers[style] = serializer
+        try:
+            ir = serializer.from_view_data(json.loads(content_json))
+            content_hash = hash_transfer_data(serializer.to_transfer_data(ir))
+        except Exception:
+            return None
+        return stored_hash_prefix(style) + content_hash
 
     def parse(
         self, file_path: Path, content: str
@@ -33,13 +51,9 @@ class SidecarIndexerAdapter(LanguageAdapter):
         if not file_path.name.endswith(".stitcher.yaml"):
             return symbols, references
 
-        # 1. Parse YAML to get data structure
-        try:
-            data = self._yaml.load(content)
-        except Exception:
-            return symbols, references
-
-        if not isinstance(data, dict):
+        # 1. Parse YAML once: keys, values and their positions
+        fragments = load_doc_fragments(content)
+        if not fragments:
             return symbols, references
 
         # 2. Determine paths
@@ -58,25 +72,21 @@ class SidecarIndexerAdapter(LanguageAdapter):
 
         # Pre-calculate logical module FQN for linking
         logical_module_fqn = path_to_logical_fqn(py_path_rel.as_posix())
+        style = self.style_resolver(py_path_rel) if self.style_resolver else None
 
-        # 3. Parse references with location info using the helper
-        loc_map = {
-            frag: (line, col) for frag, line, col in parse_doc_references(content)
-        }
-
-        for fragment, value in data.items():
+        for fragment, value, lineno, col_offset in fragments:
             # Skip if it's not a valid key
             if not isinstance(fragment, str):
                 continue
 
             # --- Build Symbol ---
             suri = self.uri_generator.generate_symbol_uri(str(rel_path), fragment)
-            lineno, col_offset = loc_map.get(fragment, (0, 0))
 
             # STORE STRATEGY: Store raw View Data as JSON.
-            # We don't convert to IR here because we don't know the docstring style yet.
+            # The IR depends on the docstring style, so only its hash is stored,
+            # and only when the style of the owning target is known.
             try:
-                # Value is the ruamel object (str or dict/map), json dump it to store
+                # Value is plain data (str or dict/list), json dump it to store
                 docstring_content_json = json.dumps(value, default=str, sort_keys=True)
                 docstring_hash = hashlib.sha256(
                     docstring_content_json.encode("utf-8")
@@ -84,6 +94,10 @@ class SidecarIndexerAdapter(LanguageAdapter):
             except Exception:
                 docstring_content_json = "{}"
                 docstring_hash = "0" * 64
+            if style:
+                docstring_hash = (
+                    self._style_hash(style, docstring_content_json) or docstring_hash
+                )
 
             symbol = SymbolRecord(
                 id=suri,
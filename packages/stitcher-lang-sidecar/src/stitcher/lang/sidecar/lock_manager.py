@@ -1,8 +1,100 @@
 import json
+import os
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional
 
-from stitcher.spec import LockManagerProtocol, Fingerprint
+from stitcher.spec import IndexStoreProtocol, LockManagerProtocol, Fingerprint
+
+LOCK_FORMAT_VERSION = "2.0"
+
+# The lock stays one JSON document, but every fingerprint sits on its own
+# line, sorted by SURI. Diffs show one line per changed symbol, and readers
+# can find entries by bisecting the lines instead of parsing the whole file;
+# for a few files, they bisect byte offsets and read only the lines they need.
+_ENTRY_INDENT = "    "
+_HEADER = '{\n  "fingerprints": {\n'
+_FOOTER = f'\n  }},\n  "version": "{LOCK_FORMAT_VERSION}"\n}}\n'
+_EMPTY = f'{{\n  "fingerprints": {{}},\n  "version": "{LOCK_FORMAT_VERSION}"\n}}\n'
+
+# Read buffer of partial loads that seek through the file. Each bisection
+# step reads about one buffer.
+_SEEK_BUFFER = 1024
+
+
+def _entry_key(suri: str) -> str:
+    # The line prefix identifying an entry. Encoded keys never prefix each
+    # other, so lines sort in the same order as their keys.
+    return _ENTRY_INDENT + json.dumps(suri) + ": "
+
+
+def _fragment_prefix(file_uri: str) -> str:
+    # The common line prefix of the entries of a file's symbols.
+    return _ENTRY_INDENT + json.dumps(file_uri + "#")[:-1]
+
+
+def _render_entry(suri: str, fp: Fingerprint) -> str:
+    return _entry_key(suri) + json.dumps(fp.to_dict(), sort_keys=True)
+
+
+def _render(entries: List[str]) -> str:
+    if not entries:
+        return _EMPTY
+    return _HEADER + ",\n".join(entries) + _FOOTER
+
+
+def _split_entries(text: str) -> Optional[List[str]]:
+    # Returns the sorted entry lines of a lock in the line layout, or None for
+    # any other layout (e.g. a 1.0 lock or a hand-formatted file).
+    if text == _EMPTY:
+        return []
+    if not (text.startswith(_HEADER) and text.endswith(_FOOTER)):
+        return None
+    body = text[len(_HEADER) : -len(_FOOTER)]
+    entries = body.split(",\n")
+    if len(entries) != body.count("\n") + 1 or entries != sorted(entries):
+        return None
+    return entries
+
+
+def _bisect_file(f: BinaryIO, start: int, end: int, key: bytes) -> int:
+    # Offset of the first entry line in [start, end) that sorts at or after
+    # `key`, or `end`. Only the lines probed by the bisection are read.
+    def line_start(pos: int) -> int:
+        if pos <= start:
+            return start
+        f.seek(pos - 1)
+        f.readline()
+        return min(f.tell(), end)
+
+    lo, hi = start, end
+    while lo < hi:
+        mid = (lo + hi) // 2
+        offset = line_start(mid)
+        if offset < end:
+            f.seek(offset)
+            if f.readline() < key:
+                lo = mid + 1
+                continue
+        hi = mid
+    return line_start(lo)
+
+
+def _read_run(f: BinaryIO, offset: int, end: int, prefix: bytes) -> Iterator[str]:
+    # The consecutive entry lines from `offset` on that start with `prefix`.
+    f.seek(offset)
+    while f.tell() < end:
+        line = f.readline()
+        if not line.startswith(prefix):
+            break
+        yield line.rstrip(b"\n").removesuffix(b",").decode("utf-8")
+
+
+def _decode_entry(line: str) -> Dict[str, Fingerprint]:
+    return {
+        suri: Fingerprint.from_dict(fp_data)
+        for suri, fp_data in json.loads("{" + line + "}").items()
+    }
 
 
 class LockFileManager(LockManagerProtocol):
@@ -14,52 +106,184 @@ class LockFileManager(LockManagerProtocol):
 
     LOCK_FILE_NAME = "stitcher.lock"
 
-    def load(self, package_root: Path) -> Dict[str, Fingerprint]:
+    def __init__(
+        self,
+        root_path: Optional[Path] = None,
+        index_store: Optional[IndexStoreProtocol] = None,
+    ):
+        # With an index, partial loads are answered from its mirror of the
+        # lock files whenever that mirror is current.
+        self.root_path = root_path
+        self.index_store = index_store
+
+    def _load_from_index(
+        self, package_root: Path, file_uris: Iterable[str]
+    ) -> Optional[Dict[str, Fingerprint]]:
+        if self.index_store is None or self.root_path is None:
+            return None
         lock_path = package_root / self.LOCK_FILE_NAME
-        if not lock_path.exists():
-            return {}
+        try:
+            rel_path = lock_path.relative_to(self.root_path).as_posix()
+            st = lock_path.stat()
+        except (ValueError, OSError):
+            return None
+        state = self.index_store.get_file_states([rel_path]).get(rel_path)
+        if (
+            state is None
+            or state.indexing_status != 1
+            or state.last_mtime != st.st_mtime
+            or state.last_size != st.st_size
+        ):
+            # Changed since the last index build (e.g. written by this run).
+            return None
+        return self.index_store.get_lock_fingerprints(state.id, file_uris)
+
+    def _read_text(self, package_root: Path) -> Optional[str]:
+        try:
+            return (package_root / self.LOCK_FILE_NAME).read_text(encoding="utf-8")
+        except OSError:
+            return None
 
+    def _parse(self, text: str) -> Dict[str, Fingerprint]:
         try:
-            with lock_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            raw_fingerprints = data.get("fingerprints", {})
-            if not isinstance(raw_fingerprints, dict):
-                return {}  # Invalid format
-
-            return {
-                suri: Fingerprint.from_dict(fp_data)
-                for suri, fp_data in raw_fingerprints.items()
-            }
-        except (json.JSONDecodeError, OSError):
+            data = json.loads(text)
+        except json.JSONDecodeError:
             # Log a warning in a real scenario
             return {}
 
-    def save(self, package_root: Path, data: Dict[str, Fingerprint]) -> None:
-        lock_path = package_root / self.LOCK_FILE_NAME
-        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        raw_fingerprints = data.get("fingerprints", {})
+        if not isinstance(raw_fingerprints, dict):
+            return {}  # Invalid format
+
+        return {
+            suri: Fingerprint.from_dict(fp_data)
+            for suri, fp_data in raw_fingerprints.items()
+        }
+
+    def load(
+        self, package_root: Path, file_uris: Optional[Iterable[str]] = None
+    ) -> Dict[str, Fingerprint]:
+        if file_uris is not None:
+            file_uris = set(file_uris)
+            indexed = self._load_from_index(package_root, file_uris)
+            if indexed is not None:
+                return indexed
+            sought = self._seek_file_entries(package_root, file_uris)
+            if sought is not None:
+                return sought
+
+        text = self._read_text(package_root)
+        if text is None:
+            return {}
+        if file_uris is None:
+            return self._parse(text)
 
-        serializable_data = {suri: fp.to_dict() for suri, fp in data.items()}
+        entries = _split_entries(text)
+        if entries is not None:
+            try:
+                return self._load_file_entries(entries, file_uris)
+            except (ValueError, AttributeError):
+                pass
 
-        lock_content = {
-            "version": "1.0",
-            "fingerprints": serializable_data,
+        return {
+            suri: fp
+            for suri, fp in self._parse(text).items()
+            if suri.split("#", 1)[0] in file_uris
         }
 
-        with lock_path.open("w", encoding="utf-8") as f:
-            json.dump(lock_content, f, indent=2, sort_keys=True)
-            f.write("\n")  # Ensure trailing newline
+    def _load_file_entries(
+        self, entries: List[str], file_uris: Iterable[str]
+    ) -> Dict[str, Fingerprint]:
+        result: Dict[str, Fingerprint] = {}
+        for file_uri in file_uris:
+            # The file's own entry, then the contiguous run of its symbols.
+            key = _entry_key(file_uri)
+            i = bisect_left(entries, key)
+            if i < len(entries) and entries[i].startswith(key):
+                result.update(_decode_entry(entries[i]))
+            prefix = _fragment_prefix(file_uri)
+            i = bisect_left(entries, prefix)
+            while i < len(entries) and entries[i].startswith(prefix):
+                result.update(_decode_entry(entries[i]))
+                i += 1
+        return result
+
+    def _seek_file_entries(
+        self, package_root: Path, file_uris: Iterable[str]
+    ) -> Optional[Dict[str, Fingerprint]]:
+        # Partial load that reads only the lines it needs: entries are sorted
+        # lines, so each file's run of entries is found by bisecting byte
+        # offsets. None when the file is not in the line layout, or when so
+        # many files are wanted that one sequential read is cheaper.
+        file_uris = sorted(file_uris)
+        header, footer = _HEADER.encode("utf-8"), _FOOTER.encode("utf-8")
+        try:
+            with open(
+                package_root / self.LOCK_FILE_NAME, "rb", buffering=_SEEK_BUFFER
+            ) as f:
+                size = os.fstat(f.fileno()).st_size
+                # Two bisections per file, each about log2(size) buffer reads.
+                if len(file_uris) * 2 * size.bit_length() * _SEEK_BUFFER >= size:
+                    return None
+                start, end = len(header), size - len(footer)
+                if start >= end or f.read(start) != header:
+                    return None
+                f.seek(end)
+                if f.read() != footer:
+                    return None
+
+                result: Dict[str, Fingerprint] = {}
+                for file_uri in file_uris:
+                    for prefix in (_entry_key(file_uri), _fragment_prefix(file_uri)):
+                        key = prefix.encode("utf-8")
+                        offset = _bisect_file(f, start, end, key)
+                        for line in _read_run(f, offset, end, key):
+                            result.update(_decode_entry(line))
+                return result
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def save(self, package_root: Path, data: Dict[str, Fingerprint]) -> None:
+        lock_path = package_root / self.LOCK_FILE_NAME
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path.write_text(self.serialize(data), encoding="utf-8")
 
     def serialize(self, data: Dict[str, Fingerprint]) -> str:
         """
         Serializes the fingerprint data to a formatted JSON string representing
         the stitcher.lock content.
         """
-        serializable_data = {suri: fp.to_dict() for suri, fp in data.items()}
+        return _render(sorted(_render_entry(suri, fp) for suri, fp in data.items()))
 
-        lock_content = {
-            "version": "1.0",
-            "fingerprints": serializable_data,
-        }
+    def serialize_changes(
+        self, package_root: Path, changes: Mapping[str, Optional[Fingerprint]]
+    ) -> str:
+        """
+        Returns the package's stitcher.lock content with the given changes
+        applied, where None removes an entry. The file is still read and
+        rewritten as a whole: the changes are merged into its sorted entry
+        lines by bisection. Only the changed entries are re-encoded; all
+        other lines are carried over from disk as they are, so the result
+        differs from the file exactly in the changed lines.
+        """
+        text = self._read_text(package_root)
+        entries: Optional[List[str]] = []
+        if text is not None:
+            entries = _split_entries(text)
+            if entries is None:
+                # Any other layout is converted once, on its first change.
+                data = self._parse(text)
+                entries = sorted(_render_entry(s, fp) for s, fp in data.items())
 
-        return json.dumps(lock_content, indent=2, sort_keys=True) + "\n"
+        for suri, fp in changes.items():
+            key = _entry_key(suri)
+            i = bisect_left(entries, key)
+            found = i < len(entries) and entries[i].startswith(key)
+            if fp is None:
+                if found:
+                    del entries[i]
+            elif found:
+                entries[i] = _render_entry(suri, fp)
+            else:
+                entries.insert(i, _render_entry(suri, fp))
+        return _render(entries)
@@ -1,7 +1,7 @@
 import hashlib
 import json
 from pathlib import Path
-from typing import Dict, Optional, Any, Union, List, TYPE_CHECKING
+from typing import Dict, Optional, Any, Union, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from stitcher.spec.index import SymbolRecord
@@ -19,6 +19,25 @@ from stitcher.spec import (
 from stitcher.lang.python.docstring import RawDocstringParser, RawSerializer
 from stitcher.common.services import AssetPathResolver
 from .adapter import SidecarAdapter
+from .cache import SidecarCache
+
+
+def hash_transfer_data(content: Union[str, Dict[str, Any]]) -> str:
+    if isinstance(content, str):
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    if isinstance(content, dict):
+        # Canonicalize dict by sorting keys and ensuring JSON serialization
+        canonical_json = json.dumps(content, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+    return hashlib.sha256(b"").hexdigest()
+
+
+def stored_hash_prefix(style: str) -> str:
+    # Doc fragment hashes in the index are stored as "<style>:<hash>", since
+    # the same view data hashes differently under each docstring style.
+    return f"{style}:"
 
 
 class DocumentManager:
@@ -27,22 +46,28 @@ class DocumentManager:
         root_path: Path,
         uri_generator: URIGeneratorProtocol,
         index_store: Optional[IndexStoreProtocol] = None,
+        sidecar_cache: Optional[SidecarCache] = None,
     ):
         self.root_path = root_path
         self.resolver = AssetPathResolver(root_path)
-        self._sidecar_adapter = SidecarAdapter(root_path, uri_generator)
+        self._sidecar_adapter = SidecarAdapter(root_path, uri_generator, sidecar_cache)
         self.index_store = index_store
         # Defaults to Raw mode for backward compatibility
         self.parser: DocstringParserProtocol = RawDocstringParser()
         self.serializer: DocstringSerializerProtocol = RawSerializer()
+        # Name of the active style. Hashes precomputed at index time are only
+        # reused when they were computed for this style.
+        self.style: Optional[str] = "raw"
 
     def set_strategy(
         self,
         parser: DocstringParserProtocol,
         serializer: DocstringSerializerProtocol,
+        style: Optional[str] = None,
     ):
         self.parser = parser
         self.serializer = serializer
+        self.style = style
 
     def _serialize_ir_for_transfer(self, ir: DocstringIR) -> Dict[str, Any]:
         # This is now the single point of truth for creating a serializable dict.
@@ -150,6 +175,89 @@ class DocumentManager:
         # 2. Fallback to File IO (for peripherals or non-indexed scenarios)
         return self._sidecar_adapter.load_doc_irs(doc_path, self.serializer)
 
+    def _split_doc_paths(
+        self, file_paths: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, Path]]:
+        # Returns (file -> indexed sidecar path, file -> sidecar read from disk).
+        indexed: Dict[str, str] = {}
+        direct: Dict[str, Path] = {}
+        for file_path in file_paths:
+            if not file_path:
+                continue
+            doc_path = self.resolver.get_doc_path(self.root_path / file_path)
+            if self.index_store:
+                try:
+                    rel_doc_path = doc_path.relative_to(self.root_path)
+                    indexed[file_path] = rel_doc_path.as_posix()
+                    continue
+                except ValueError:
+                    # Outside the project root (e.g. a peripheral): direct I/O.
+                    pass
+            direct[file_path] = doc_path
+        return indexed, direct
+
+    def _load_fragments(
+        self, indexed: Dict[str, str]
+    ) -> Dict[str, List["SymbolRecord"]]:
+        if not indexed or not self.index_store:
+            return {}
+        symbols = self.index_store.get_symbols_by_file_paths(indexed.values())
+        return {
+            file_path: symbols.get(rel_doc_path, [])
+            for file_path, rel_doc_path in indexed.items()
+        }
+
+    def load_docs_for_paths(
+        self, file_paths: List[str]
+    ) -> Dict[str, Dict[str, DocstringIR]]:
+        # Batched form of load_docs_for_path: one index query for all sidecars.
+        indexed, direct = self._split_doc_paths(file_paths)
+        docs: Dict[str, Dict[str, DocstringIR]] = {p: {} for p in file_paths}
+        for file_path, doc_path in direct.items():
+            docs[file_path] = self._sidecar_adapter.load_doc_irs(
+                doc_path, self.serializer
+            )
+        for file_path, symbols in self._load_fragments(indexed).items():
+            docs[file_path] = self._hydrate_from_symbols(symbols)
+        return docs
+
+    def load_docs_with_hashes_for_paths(
+        self, file_paths: List[str]
+    ) -> Tuple[Dict[str, Dict[str, DocstringIR]], Dict[str, Dict[str, str]]]:
+        # load_docs_for_paths plus compute_ir_hash of every doc, reusing the
+        # hashes stored by the sidecar indexer when they match the active style.
+        indexed, direct = self._split_doc_paths(file_paths)
+        docs: Dict[str, Dict[str, DocstringIR]] = {p: {} for p in file_paths}
+        hashes: Dict[str, Dict[str, str]] = {p: {} for p in file_paths}
+        for file_path, doc_path in direct.items():
+            irs = self._sidecar_adapter.load_doc_irs(doc_path, self.serializer)
+            docs[file_path] = irs
+            hashes[file_path] = {
+                fqn: self.compute_ir_hash(ir) for fqn, ir in irs.items()
+            }
+
+        prefix = stored_hash_prefix(self.style) if self.style else None
+        for file_path, symbols in self._load_fragments(indexed).items():
+            irs = self._hydrate_from_symbols(symbols)
+            stored = {
+                sym.name: sym.docstring_hash[len(prefix) :]
+                for sym in symbols
+                if prefix
+                and sym.docstring_hash
+                and sym.docstring_hash.startswith(prefix)
+            }
+            docs[file_path] = irs
+            hashes[file_path] = {
+                fqn: stored.get(fqn) or self.compute_ir_hash(ir)
+                for fqn, ir in irs.items()
+            }
+        return docs, hashes
+
+    def load_doc_hashes_for_paths(
+        self, file_paths: List[str]
+    ) -> Dict[str, Dict[str, str]]:
+        return self.load_docs_with_hashes_for_paths(file_paths)[1]
+
     def _hydrate_from_symbols(
         self, symbols: List["SymbolRecord"]
     ) -> Dict[str, DocstringIR]:
@@ -415,23 +523,12 @@ class DocumentManager:
         return keys
 
     def compute_yaml_content_hash(self, content: Union[str, Dict[str, Any]]) -> str:
-        if isinstance(content, str):
-            return hashlib.sha256(content.encode("utf-8")).hexdigest()
-
-        if isinstance(content, dict):
-            # Canonicalize dict by sorting keys and ensuring JSON serialization
-            canonical_json = json.dumps(content, sort_keys=True, ensure_ascii=False)
-            return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
-
-        return hashlib.sha256(b"").hexdigest()
+        return hash_transfer_data(content)
 
     def compute_yaml_hashes_for_path(self, file_path: str) -> Dict[str, str]:
         if not file_path:
             return {}
-
-        irs = self.load_docs_for_path(file_path)
-
-        return {fqn: self.compute_ir_hash(ir) for fqn, ir in irs.items()}
+        return self.load_doc_hashes_for_paths([file_path])[file_path]
 
     def compute_yaml_content_hashes(self, module: ModuleDef) -> Dict[str, str]:
         return self.compute_yaml_hashes_for_path(module.file_path)
@@ -448,5 +545,7 @@ class DocumentManager:
         if not irs:
             return False
 
-        self._sidecar_adapter.save_doc_irs(doc_path, irs, self.serializer)
+        self._sidecar_adapter.save_doc_irs(
+            doc_path, irs, self.serializer, reformat=True
+        )
         return True
@@ -1,41 +1,116 @@
 import re
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.error import YAMLError
+from ruamel.yaml.nodes import ScalarNode as RuamelScalarNode
+from ruamel.yaml.resolver import VersionedResolver
 
+# (fragment, value, lineno, col_offset) of a top-level sidecar key.
+DocFragment = Tuple[Any, Any, int, int]
 
-def parse_doc_references(content: str) -> List[Tuple[str, int, int]]:
-    """
-    Parses a Stitcher YAML Doc file and returns a list of (fragment, lineno, col_offset)
-    for all top-level keys, which are expected to be short symbol names (fragments).
-    """
-    yaml = YAML()
+# libyaml when available; the pure-Python loader parses the same way.
+_FastLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+_MAP_TAG = "tag:yaml.org,2002:map"
+
+# PyYAML implements YAML 1.1, ruamel (which writes the sidecars) YAML 1.2.
+# Plain scalars are therefore resolved with ruamel's 1.2 rules.
+_resolver = VersionedResolver(version=(1, 2))
+
+
+class _NotPlainData(Exception):
+    # Raised for anything beyond strings, mappings and sequences.
+    pass
+
+
+def _construct(node: yaml.Node) -> Any:
+    if isinstance(node, yaml.ScalarNode):
+        if node.tag != _STR_TAG:
+            raise _NotPlainData(node.tag)
+        if node.style is None:
+            tag = _resolver.resolve(RuamelScalarNode, node.value, (True, False))
+            if str(tag) != _STR_TAG:
+                raise _NotPlainData(tag)
+        return node.value
+    if isinstance(node, yaml.SequenceNode) and node.tag == _SEQ_TAG:
+        return [_construct(item) for item in node.value]
+    if isinstance(node, yaml.MappingNode) and node.tag == _MAP_TAG:
+        data: Dict[str, Any] = {}
+        for key_node, value_node in node.value:
+            key = _construct(key_node)
+            if key in data:
+                raise _NotPlainData(f"duplicate key {key!r}")
+            data[key] = _construct(value_node)
+        return data
+    raise _NotPlainData(node.tag)
+
+
+def _fast_load_doc_fragments(content: str) -> Optional[List[DocFragment]]:
+    # None if the content needs the full ruamel loader.
     try:
-        data = yaml.load(content)
-    except YAMLError:
-        return []
+        root = yaml.compose(content, Loader=_FastLoader)
+        if not isinstance(root, yaml.MappingNode):
+            # Empty documents are not mappings either way; the rest is
+            # left to ruamel.
+            return [] if root is None else None
+        data = _construct(root)
+    except (yaml.YAMLError, _NotPlainData, RecursionError, TypeError):
+        # TypeError: unhashable complex keys such as `? [a, b]`.
+        return None
+
+    fragments: List[DocFragment] = []
+    for key_node, _ in root.value:
+        mark = key_node.start_mark
+        fragments.append(
+            (key_node.value, data[key_node.value], mark.line + 1, mark.column)
+        )
+    return fragments
 
-    references = []
 
+def _ruamel_load_doc_fragments(content: str) -> List[DocFragment]:
+    try:
+        data = YAML().load(content)
+    except YAMLError:
+        return []
     if not isinstance(data, dict):
-        return references
-
-    for key in data.keys():
-        lc = getattr(data, "lc", None)
-        if lc and hasattr(lc, "item"):
-            # lc.item(key) returns [line, col, pre_key_comment_line, key_comment_line]
-            # line is 0-based.
-            pos = lc.item(key)
-            if pos:
-                lineno = pos[0] + 1  # Convert to 1-based
-                col_offset = pos[1]
-                references.append((str(key), lineno, col_offset))
+        return []
+
+    fragments: List[DocFragment] = []
+    lc = getattr(data, "lc", None)
+    for key, value in data.items():
+        # lc.item(key) returns [line, col, ...], 0-based.
+        pos = lc.item(key) if lc and hasattr(lc, "item") else None
+        if pos:
+            fragments.append((key, value, pos[0] + 1, pos[1]))
         else:
-            # Fallback if no line info
-            # For robustness, we could search the string, but ruamel usually works.
-            references.append((str(key), 0, 0))
+            fragments.append((key, value, 0, 0))
+    return fragments
 
-    return references
+
+def load_doc_fragments(content: str) -> List[DocFragment]:
+    # Top-level keys of a sidecar with their values and positions, from a
+    # single parse. Plain data (the common case) is read with the fast safe
+    # loader; anything else falls back to ruamel, which keeps the exact YAML
+    # 1.2 semantics the sidecars are written with. Invalid YAML yields [].
+    fragments = _fast_load_doc_fragments(content)
+    if fragments is None:
+        fragments = _ruamel_load_doc_fragments(content)
+    return fragments
+
+
+def parse_doc_references(content: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses a Stitcher YAML Doc file and returns a list of (fragment, lineno, col_offset)
+    for all top-level keys, which are expected to be short symbol names (fragments).
+    """
+    return [
+        (str(fragment), lineno, col_offset)
+        for fragment, _, lineno, col_offset in load_doc_fragments(content)
+    ]
 
 
 def parse_signature_references(content: str) -> List[Tuple[str, int, int]]:
@@ -0,0 +1,112 @@
+import json
+
+from stitcher.lang.sidecar import LockFileManager
+from stitcher.spec import Fingerprint
+
+
+def _fp(value: str) -> Fingerprint:
+    return Fingerprint.from_dict({"baseline_code_structure_hash": value})
+
+
+def test_lock_writes_one_sorted_entry_per_line(tmp_path):
+    manager = LockFileManager()
+    data = {
+        "py://src/b.py#func": _fp("2"),
+        "py://src/a.py#Cls": _fp("1"),
+        "py://src/a.py#Cls.method": _fp("3"),
+    }
+    manager.save(tmp_path, data)
+
+    lines = (tmp_path / "stitcher.lock").read_text().splitlines()
+    assert lines[2:5] == [
+        '    "py://src/a.py#Cls": {"baseline_code_structure_hash": "1"},',
+        '    "py://src/a.py#Cls.method": {"baseline_code_structure_hash": "3"},',
+        '    "py://src/b.py#func": {"baseline_code_structure_hash": "2"}',
+    ]
+    # Still a plain JSON document.
+    raw = json.loads((tmp_path / "stitcher.lock").read_text())
+    assert raw["version"] == "2.0"
+    assert manager.load(tmp_path) == data
+
+
+def test_lock_partial_load_returns_only_requested_files(tmp_path):
+    manager = LockFileManager()
+    manager.save(
+        tmp_path,
+        {
+            "py://src/a.py#f": _fp("1"),
+            "py://src/a.py.bak#f": _fp("2"),
+            "py://src/ab.py#f": _fp("3"),
+            "py://src/b.py#g": _fp("4"),
+        },
+    )
+
+    assert manager.load(tmp_path, ["py://src/a.py"]) == {"py://src/a.py#f": _fp("1")}
+    assert set(manager.load(tmp_path, ["py://src/ab.py", "py://src/b.py"])) == {
+        "py://src/ab.py#f",
+        "py://src/b.py#g",
+    }
+    assert manager.load(tmp_path, ["py://src/missing.py"]) == {}
+
+
+def test_lock_serialize_changes_touches_only_changed_lines(tmp_path):
+    manager = LockFileManager()
+    manager.save(
+        tmp_path,
+        {"py://a.py#f": _fp("1"), "py://a.py#g": _fp("2"), "py://b.py#h": _fp("3")},
+    )
+    before = (tmp_path / "stitcher.lock").read_text().splitlines()
+
+    content = manager.serialize_changes(
+        tmp_path,
+        {"py://a.py#g": _fp("new"), "py://b.py#h": None, "py://a.py#e": _fp("4")},
+    )
+    (tmp_path / "stitcher.lock").write_text(content)
+
+    assert manager.load(tmp_path) == {
+        "py://a.py#e": _fp("4"),
+        "py://a.py#f": _fp("1"),
+        "py://a.py#g": _fp("new"),
+    }
+    after = content.splitlines()
+    assert before[2] in after  # The untouched entry is carried over as is.
+    assert content == manager.serialize(manager.load(tmp_path))
+
+
+def test_lock_reads_and_converts_legacy_layout(tmp_path):
+    legacy = {
+        "version": "1.0",
+        "fingerprints": {"py://a.py#f": {"baseline_code_structure_hash": "1"}},
+    }
+    (tmp_path / "stitcher.lock").write_text(json.dumps(legacy, indent=2))
+    manager = LockFileManager()
+
+    assert manager.load(tmp_path, ["py://a.py"]) == {"py://a.py#f": _fp("1")}
+
+    content = manager.serialize_changes(tmp_path, {"py://b.py#g": _fp("2")})
+    assert content == manager.serialize(
+        {"py://a.py#f": _fp("1"), "py://b.py#g": _fp("2")}
+    )
+
+
+def test_lock_partial_load_seeks_instead_of_reading_the_file(tmp_path, mocker):
+    manager = LockFileManager()
+    data = {
+        f"py://src/m{i:04}.py#{name}": _fp(f"{i}{name}")
+        for i in range(2000)
+        for name in ("f", "g")
+    }
+    data["py://src/m0042.py"] = _fp("module")
+    manager.save(tmp_path, data)
+    spy_read = mocker.spy(LockFileManager, "_read_text")
+
+    for file_uri in ("py://src/m0000.py", "py://src/m0042.py", "py://src/m1999.py"):
+        expected = {s: fp for s, fp in data.items() if s.split("#")[0] == file_uri}
+        assert manager.load(tmp_path, [file_uri]) == expected
+    assert manager.load(tmp_path, ["py://src/m0042.pyc", "py://src/zz.py"]) == {}
+    spy_read.assert_not_called()
+
+    # Many files at once are cheaper to read sequentially.
+    many = [f"py://src/m{i:04}.py" for i in range(0, 2000, 2)]
+    assert len(manager.load(tmp_path, many)) == 2001
+    spy_read.assert_called_once()
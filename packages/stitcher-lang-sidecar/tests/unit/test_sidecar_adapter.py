@@ -197,3 +197,31 @@ def test_save_doc_irs_forces_literal_block_style_repro(tmp_path: Path):
     # 如果此处断言失败，则证明 LiteralScalarString 没有被正确应用或被 dump 过程忽略了。
     assert "my_func: |-" in content
     assert "  This is a docstring." in content
+
+
+def test_save_doc_irs_patches_only_changed_blocks(tmp_path: Path, monkeypatch):
+    adapter = SidecarAdapter(root_path=tmp_path, uri_generator=PythonURIGenerator())
+    serializer = RawSerializer()
+    doc_path = tmp_path / "module.stitcher.yaml"
+    untouched = '# Header\nz_function: "Kept as written"\n\n# About A\n'
+    doc_path.write_text(untouched + "a_function: |-\n  Old\n")
+
+    adapter.save_doc_irs(
+        doc_path,
+        {
+            "a_function": DocstringIR(summary="New"),
+            "z_function": DocstringIR(summary="Kept as written"),
+        },
+        serializer,
+    )
+
+    # Unchanged keys keep their exact text; only the changed block is rewritten.
+    assert doc_path.read_text() == untouched + "a_function: |-\n  New\n"
+
+    # Identical data is detected before anything is serialized or written.
+    mtime = doc_path.stat().st_mtime_ns
+    monkeypatch.setattr(adapter, "_yaml", None)
+    adapter.save_doc_irs(
+        doc_path, {"a_function": DocstringIR(summary="New")}, serializer
+    )
+    assert doc_path.stat().st_mtime_ns == mtime
@@ -0,0 +1,26 @@
+import os
+from pathlib import Path
+
+from stitcher.lang.sidecar import cache as cache_module
+from stitcher.lang.sidecar.cache import SidecarCache
+
+
+def test_sidecar_cache_reuses_fragments_until_content_changes(tmp_path: Path, mocker):
+    doc_path = tmp_path / "mod.stitcher.yaml"
+    doc_path.write_text("func: |-\n  Doc.\n")
+    cache = SidecarCache(tmp_path / "cache")
+    spy_parse = mocker.spy(cache_module, "load_doc_fragments")
+
+    assert cache.load_fragments(doc_path) == [("func", "Doc.", 1, 0)]
+    assert cache.load_fragments(doc_path) == [("func", "Doc.", 1, 0)]
+    assert spy_parse.call_count == 1
+
+    # A touched but unchanged file is validated by its hash, not re-parsed.
+    st = doc_path.stat()
+    os.utime(doc_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.load_fragments(doc_path) == [("func", "Doc.", 1, 0)]
+    assert spy_parse.call_count == 1
+
+    doc_path.write_text("func: |-\n  New doc.\n")
+    assert cache.load_fragments(doc_path) == [("func", "New doc.", 1, 0)]
+    assert spy_parse.call_count == 2
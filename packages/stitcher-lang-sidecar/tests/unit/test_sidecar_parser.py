@@ -79,3 +79,54 @@ def test_parse_doc_references(yaml_content, expected):
     sorted_expected = sorted(expected)
 
     assert sorted_references == sorted_expected
+
+
+@pytest.mark.parametrize(
+    "yaml_content",
+    [
+        'func: |-\n  Summary.\n\n  Details.\n"Cls.meth":\n  Summary: |-\n    Doc.\n',
+        "flag: yes\nnum: 1_000\nday: 2024-01-01\nempty:\n",
+        "a: &doc Shared.\nb: *doc\n",
+        "dup: one\ndup: two\n",
+        "- not\n- a mapping\n",
+    ],
+    ids=["plain", "yaml12_scalars", "anchors", "duplicate_keys", "sequence"],
+)
+def test_load_doc_fragments_matches_ruamel(yaml_content):
+    # The fast loader must read exactly what ruamel (which writes sidecars) reads.
+    import json
+    from ruamel.yaml import YAML
+
+    from stitcher.lang.sidecar.parser import load_doc_fragments
+
+    try:
+        expected = YAML().load(yaml_content)
+    except Exception:
+        expected = None
+    if not isinstance(expected, dict):
+        expected = {}
+
+    fragments = load_doc_fragments(yaml_content)
+
+    assert [f[0] for f in fragments] == list(expected)
+    assert json.dumps({f[0]: f[1] for f in fragments}, default=str) == json.dumps(
+        expected, default=str
+    )
+
+
+@pytest.mark.parametrize(
+    "yaml_content",
+    ["? [a, b]\n: x\nfunc: Doc.\n", "func:\n  ? {k: v}\n  : x\n"],
+    ids=["top_level", "nested"],
+)
+def test_load_doc_fragments_falls_back_on_complex_keys(yaml_content):
+    from ruamel.yaml import YAML
+
+    from stitcher.lang.sidecar.parser import load_doc_fragments
+
+    expected = YAML().load(yaml_content)
+
+    fragments = load_doc_fragments(yaml_content)
+
+    assert [f[0] for f in fragments] == list(expected)
+    assert [f[1] for f in fragments] == list(expected.values())
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from stitcher.refactor.migration.spec import MigrationSpec
@@ -100,12 +100,26 @@ class Planner:
             all_ops.append(WriteFileOp(path.relative_to(ctx.graph.root_path), content))
 
         # --- Process Lock Update Intents ---
-        lock_states: Dict[Path, Dict[str, Fingerprint]] = {}
-
-        def get_lock_data(pkg_root: Path) -> Dict[str, Fingerprint]:
-            if pkg_root not in lock_states:
-                lock_states[pkg_root] = ctx.lock_manager.load(pkg_root)
-            return lock_states[pkg_root]
+        # Only the affected entries are read and rewritten: per-file lookups
+        # are served by the index, and the locks are patched entry by entry.
+        lock_changes: Dict[Path, Dict[str, Optional[Fingerprint]]] = defaultdict(dict)
+
+        def get_lock_entries(
+            pkg_root: Path, file_uri: Optional[str] = None
+        ) -> Dict[str, Fingerprint]:
+            # Current entries of one file (or the whole lock), pending changes applied.
+            if file_uri is None:
+                entries = dict(ctx.lock_manager.load(pkg_root))
+            else:
+                entries = dict(ctx.lock_manager.load(pkg_root, [file_uri]))
+            for suri, fp in lock_changes[pkg_root].items():
+                if file_uri is not None and suri.partition("#")[0] != file_uri:
+                    continue
+                if fp is None:
+                    entries.pop(suri, None)
+                else:
+                    entries[suri] = fp
+            return entries
 
         lock_intents = [
             i
@@ -120,15 +134,15 @@ class Planner:
                 src_pkg_root = ctx.workspace.find_owning_package(old_abs_path)
                 dest_pkg_root = ctx.workspace.find_owning_package(new_abs_path)
 
-                src_data = get_lock_data(src_pkg_root)
-                dest_data = (
-                    get_lock_data(dest_pkg_root)
-                    if src_pkg_root != dest_pkg_root
-                    else src_data
+                # A single file's entries are found without loading the lock.
+                file_uri = (
+                    ctx.uri_generator.generate_file_uri(intent.old_path_prefix)
+                    if old_abs_path.is_file()
+                    else None
                 )
 
                 uris_to_move = {}
-                for suri, fp in src_data.items():
+                for suri, fp in get_lock_entries(src_pkg_root, file_uri).items():
                     # We still use the static parse method for now as it's a utility
                     path, fragment = PythonURIGenerator.parse(suri)
                     if path == intent.old_path_prefix or path.startswith(
@@ -145,16 +159,20 @@ class Planner:
                         uris_to_move[suri] = (new_suri, fp)
 
                 for old_suri, (new_suri, fp) in uris_to_move.items():
-                    del src_data[old_suri]
-                    dest_data[new_suri] = fp
+                    lock_changes[src_pkg_root][old_suri] = None
+                    lock_changes[dest_pkg_root][new_suri] = fp
 
             elif isinstance(intent, LockSymbolUpdateIntent):
-                data = get_lock_data(intent.package_root)
-                if intent.old_suri in data:
-                    data[intent.new_suri] = data.pop(intent.old_suri)
+                file_uri = intent.old_suri.partition("#")[0]
+                fp = get_lock_entries(intent.package_root, file_uri).get(
+                    intent.old_suri
+                )
+                if fp is not None:
+                    lock_changes[intent.package_root][intent.old_suri] = None
+                    lock_changes[intent.package_root][intent.new_suri] = fp
 
-        for pkg_root, data in lock_states.items():
-            content = ctx.lock_manager.serialize(data)
+        for pkg_root, changes in lock_changes.items():
+            content = ctx.lock_manager.serialize_changes(pkg_root, changes)
             rel_lock_path = (pkg_root / "stitcher.lock").relative_to(
                 ctx.graph.root_path
             )
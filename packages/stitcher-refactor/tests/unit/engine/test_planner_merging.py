@@ -48,6 +48,11 @@ def mock_context(tmp_path: Path) -> Mock:
     from stitcher.lang.python.uri import PythonURIGenerator
 
     ctx.uri_generator = Mock(spec=PythonURIGenerator())
+    # The planner looks up lock entries by the file part of a SURI.
+    ctx.uri_generator.generate_file_uri.side_effect = lambda path: f"py://{path}"
+    ctx.uri_generator.generate_symbol_uri.side_effect = lambda path, fragment: (
+        f"py://{path}#{fragment}"
+    )
 
     # Mock find_symbol to prevent startswith TypeError
     from stitcher.analysis.semantic import SymbolNode
@@ -1,12 +1,16 @@
 import re
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 
 # Axiom: [State]_[Source]_[Object]_[Type]
 # Example: baseline_code_structure_hash, baseline_code_signature_text
 # We enforce 4 segments, starting with state, ending with type (hash or text).
 FINGERPRINT_KEY_PATTERN = re.compile(r"^(baseline|current)_[a-z]+_[a-z]+_(hash|text)$")
 
+# Keys that already passed the pattern. Lock files repeat a handful of keys
+# many times, so each distinct key is matched only once.
+_VALID_KEYS: Set[str] = set()
+
 
 class InvalidFingerprintKeyError(KeyError):
     def __init__(self, key: str):
@@ -22,8 +26,11 @@ class Fingerprint:
 
     @staticmethod
     def _validate_key(key: str) -> None:
+        if key in _VALID_KEYS:
+            return
         if not FINGERPRINT_KEY_PATTERN.match(key):
             raise InvalidFingerprintKeyError(key)
+        _VALID_KEYS.add(key)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Fingerprint":
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 @dataclass
@@ -12,6 +12,14 @@ class FileRecord:
     indexing_status: int
 
 
+class FileState(NamedTuple):
+    # The subset of FileRecord needed to decide whether a file is unchanged.
+    id: int
+    last_mtime: float
+    last_size: int
+    indexing_status: int
+
+
 @dataclass
 class SymbolRecord:
     id: str
@@ -1,4 +1,4 @@
-from typing import Protocol, Dict, Union, Optional, Any
+from typing import Protocol, Dict, List, Tuple, Union, Optional, Any
 from pathlib import Path
 
 from .docstring import DocstringIR
@@ -6,10 +6,20 @@ from .models import ModuleDef
 
 
 class DocumentManagerProtocol(Protocol):
+    style: Optional[str]
+
     def load_docs_for_module(self, module: ModuleDef) -> Dict[str, DocstringIR]: ...
 
     def load_docs_for_path(self, file_path: str) -> Dict[str, DocstringIR]: ...
 
+    def load_docs_for_paths(
+        self, file_paths: List[str]
+    ) -> Dict[str, Dict[str, DocstringIR]]: ...
+
+    def load_docs_with_hashes_for_paths(
+        self, file_paths: List[str]
+    ) -> Tuple[Dict[str, Dict[str, DocstringIR]], Dict[str, Dict[str, str]]]: ...
+
     def save_docs_for_module(self, module: ModuleDef) -> Path: ...
 
     def flatten_module_docs(self, module: ModuleDef) -> Dict[str, DocstringIR]: ...
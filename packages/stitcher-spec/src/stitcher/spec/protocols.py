@@ -1,4 +1,4 @@
-from typing import Protocol, Dict, Union, Optional, List, Any
+from typing import Protocol, Dict, Union, Optional, List, Any, Iterable, Mapping
 from pathlib import Path
 from .models import ModuleDef, FunctionDef, ClassDef
 from .fingerprint import Fingerprint
@@ -73,8 +73,14 @@ class URIGeneratorProtocol(Protocol):
 
 
 class LockManagerProtocol(Protocol):
-    def load(self, package_root: Path) -> Dict[str, Fingerprint]: ...
+    def load(
+        self, package_root: Path, file_uris: Optional[Iterable[str]] = None
+    ) -> Dict[str, Fingerprint]: ...
 
     def save(self, package_root: Path, data: Dict[str, Fingerprint]) -> None: ...
 
     def serialize(self, data: Dict[str, Fingerprint]) -> str: ...
+
+    def serialize_changes(
+        self, package_root: Path, changes: Mapping[str, Optional[Fingerprint]]
+    ) -> str: ...
@@ -1,12 +1,25 @@
-from typing import Protocol, List, Optional, Tuple
+from typing import Protocol, Dict, Iterable, List, Optional, Tuple, ContextManager
 
-from .index import FileRecord, SymbolRecord, ReferenceRecord, DependencyEdge
+from .fingerprint import Fingerprint
+from .index import (
+    FileRecord,
+    FileState,
+    SymbolRecord,
+    ReferenceRecord,
+    DependencyEdge,
+)
 
 
 class IndexStoreProtocol(Protocol):
     # --- Read Operations ---
     def get_symbols_by_file_path(self, file_path: str) -> List[SymbolRecord]: ...
 
+    def get_symbols_by_file_paths(
+        self, file_paths: Iterable[str]
+    ) -> Dict[str, List[SymbolRecord]]: ...
+
+    def get_content_hashes(self, file_paths: Iterable[str]) -> Dict[str, str]: ...
+
     def find_symbol_by_fqn(
         self, target_fqn: str
     ) -> Optional[Tuple[SymbolRecord, str]]: ...
@@ -17,8 +30,20 @@ class IndexStoreProtocol(Protocol):
 
     def get_all_files(self) -> List[FileRecord]: ...
 
+    def get_file_states(
+        self, paths: Optional[Iterable[str]] = None
+    ) -> Dict[str, FileState]: ...
+
     def get_all_dependency_edges(self) -> List[DependencyEdge]: ...
 
+    def get_dependency_graph_digest(self) -> str: ...
+
+    def get_meta(self, key: str) -> Optional[str]: ...
+
+    def get_lock_fingerprints(
+        self, lock_file_id: int, file_uris: Optional[Iterable[str]] = None
+    ) -> Dict[str, Fingerprint]: ...
+
     # --- Write/Sync Operations ---
     def sync_file(
         self, path: str, content_hash: str, mtime: float, size: int
@@ -31,6 +56,16 @@ class IndexStoreProtocol(Protocol):
         references: List[ReferenceRecord],
     ) -> None: ...
 
+    def update_lock_entries(
+        self, file_id: int, fingerprints: Dict[str, Fingerprint]
+    ) -> None: ...
+
     def delete_file(self, file_id: int) -> None: ...
 
+    def set_meta(self, key: str, value: Optional[str]) -> None: ...
+
+    def bulk_ingest(self, flush_size: int = ...) -> ContextManager[None]: ...
+
+    def take_write_errors(self) -> List[Tuple[str, str]]: ...
+
     def resolve_missing_links(self) -> None: ...
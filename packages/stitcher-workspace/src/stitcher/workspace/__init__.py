@@ -2,7 +2,12 @@ __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 from typing import Optional, List
 from .core import Workspace
-from .config import StitcherConfig, load_config_from_path
+from .config import (
+    StitcherConfig,
+    IndexConfig,
+    load_config_from_path,
+    load_index_config,
+)
 from .exceptions import WorkspaceError, WorkspaceNotFoundError
 from .utils import find_workspace_root
 
@@ -12,6 +17,8 @@ __all__ = [
     "WorkspaceNotFoundError",
     "StitcherConfig",
     "load_config_from_path",
+    "IndexConfig",
+    "load_index_config",
     "find_workspace_root",
     "Optional",
     "List",
@@ -1,5 +1,6 @@
+import logging
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import List, Any, Dict, Optional, Tuple
 from .utils import find_workspace_root
@@ -10,6 +11,8 @@ if sys.version_info < (3, 11):
 else:
     import tomllib
 
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class StitcherConfig:
@@ -22,6 +25,26 @@ class StitcherConfig:
     peripheral_paths: List[str] = field(default_factory=list)
 
 
+@dataclass
+class IndexConfig:
+    # Keep one index connection open for the whole process.
+    persistent_connection: bool = True
+    # How ensure_index_fresh finds changed files: "scan" stats every file,
+    # "git" asks git for the delta since the last build.
+    change_detection: str = "scan"
+    # Size limit of the content-addressed parse cache in .stitcher/cache;
+    # 0 disables it.
+    parse_cache_mb: int = 256
+    # Replay check results of files whose inputs did not change since the
+    # last run (stored in .stitcher/cache/check.json).
+    check_cache: bool = True
+    # Keep a binary copy of sidecars that are read from disk rather than from
+    # the index (e.g. peripherals) in .stitcher/cache/sidecars.
+    sidecar_cache: bool = False
+    # SQLite PRAGMA overrides, e.g. {"mmap_size": 0, "cache_size": -16384}.
+    pragmas: Dict[str, Any] = field(default_factory=dict)
+
+
 def _find_plugins(workspace_root: Path) -> Dict[str, str]:
     plugins: Dict[str, str] = {}
     for toml_file in workspace_root.rglob("**/pyproject.toml"):
@@ -95,3 +118,32 @@ def load_config_from_path(
         )
 
     return configs, project_name
+
+
+def load_index_config(search_path: Path) -> IndexConfig:
+    try:
+        config_path = find_workspace_root(search_path) / "pyproject.toml"
+    except WorkspaceNotFoundError:
+        return IndexConfig()
+    if not config_path.exists():
+        return IndexConfig()
+
+    with open(config_path, "rb") as f:
+        data = tomllib.load(f)
+    index_data = dict(data.get("tool", {}).get("stitcher", {}).get("index", {}))
+
+    defaults = {f.name: f.default for f in fields(IndexConfig) if f.name != "pragmas"}
+    options: Dict[str, Any] = {}
+    for name, default in defaults.items():
+        if name not in index_data:
+            continue
+        value = index_data.pop(name)
+        # bool is an int subclass, so it is only accepted where a bool is
+        # expected; negative cache sizes are rejected as well.
+        if type(value) is not type(default) or (
+            isinstance(value, int) and not isinstance(value, bool) and value < 0
+        ):
+            log.warning(f"Ignoring invalid value {value!r} for index option '{name}'")
+            continue
+        options[name] = value
+    return IndexConfig(**options, pragmas=index_data)
@@ -3,7 +3,7 @@ import os
 import subprocess
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional
 
 try:
     import tomllib
@@ -14,6 +14,9 @@ from .config import StitcherConfig
 
 log = logging.getLogger(__name__)
 
+# Max number of paths passed to a single `git ls-files` invocation.
+_GIT_PATHSPEC_BATCH = 1000
+
 
 class Workspace:
     def __init__(self, root_path: Path, config: Optional[StitcherConfig] = None):
@@ -22,6 +25,8 @@ class Workspace:
         # 'cascade' -> {'/path/to/cascade-application/src', '/path/to/cascade-engine/src'}
         self.import_to_source_dirs: Dict[str, Set[Path]] = defaultdict(set)
         self.peripheral_source_dirs: Set[Path] = set()
+        # File or directory -> owning package root, see find_owning_package.
+        self._owning_packages: Dict[Path, Path] = {}
 
         if self.config:
             self._build_from_config()
@@ -29,17 +34,37 @@ class Workspace:
             self._discover_packages()
 
     def find_owning_package(self, file_path: Path) -> Path:
+        cached = self._owning_packages.get(file_path)
+        if cached is not None:
+            return cached
+
         current = file_path.resolve()
         if current.is_file():
             current = current.parent
 
+        # Every directory walked through shares the answer, so sibling files
+        # resolve without touching the filesystem again.
+        visited: List[Path] = []
+        owner = self.root_path
         # Stop if we hit the workspace root to avoid escaping the project
         while current != self.root_path and current != current.parent:
+            cached = self._owning_packages.get(current)
+            if cached is not None:
+                owner = cached
+                break
+            visited.append(current)
             if (current / "pyproject.toml").exists():
-                return current
+                owner = current
+                break
             current = current.parent
 
-        return self.root_path
+        for directory in visited:
+            self._owning_packages[directory] = owner
+        self._owning_packages[file_path] = owner
+        return owner
+
+    def clear_caches(self) -> None:
+        self._owning_packages.clear()
 
     def to_workspace_relative(self, path: Path) -> str:
         return path.resolve().relative_to(self.root_path).as_posix()
@@ -172,7 +197,60 @@ class Workspace:
                     paths.add(rel_path)
 
         # Global Filter: Exclude .stitcher directory
-        final_paths = {
-            p for p in paths if not p.startswith(".stitcher/") and p != ".stitcher"
+        return self._exclude_internal(paths)
+
+    def _run_git(self, *args: str) -> Optional[List[str]]:
+        # NUL-separated output of a git command, or None if git cannot answer.
+        if not (self.root_path / ".git").exists():
+            return None
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.root_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return [p for p in result.stdout.split("\0") if p]
+
+    def _exclude_internal(self, paths: Iterable[str]) -> Set[str]:
+        return {p for p in paths if not p.startswith(".stitcher/") and p != ".stitcher"}
+
+    def get_git_head(self) -> Optional[str]:
+        output = self._run_git("rev-parse", "--verify", "-q", "-z", "HEAD")
+        return output[0].strip() if output else None
+
+    def discover_changed_files(self, since: str) -> Optional[Set[str]]:
+        # Tracked paths whose working-tree content differs from commit `since`
+        # (committed, staged, unstaged, deleted), plus untracked files.
+        changed = self._run_git("diff", "--name-only", "--no-renames", "-z", since)
+        untracked = self._run_git("ls-files", "-z", "--others", "--exclude-standard")
+        if changed is None or untracked is None:
+            return None
+        return self._exclude_internal(changed + untracked)
+
+    def filter_discoverable(self, paths: Iterable[str]) -> Optional[Set[str]]:
+        # The subset of `paths` that discover_files() would currently return.
+        candidates = sorted(paths)
+        found: List[str] = []
+        for start in range(0, len(candidates), _GIT_PATHSPEC_BATCH):
+            batch = candidates[start : start + _GIT_PATHSPEC_BATCH]
+            output = self._run_git(
+                "--literal-pathspecs",
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+                "--",
+                *batch,
+            )
+            if output is None:
+                return None
+            found.extend(output)
+        # Deleted-but-still-staged files are listed by --cached too.
+        return {
+            p for p in self._exclude_internal(found) if (self.root_path / p).is_file()
         }
-        return final_paths
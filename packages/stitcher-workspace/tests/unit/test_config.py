@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 from textwrap import dedent
 
-from stitcher.workspace.config import load_config_from_path
+from stitcher.workspace.config import load_config_from_path, load_index_config
 
 
 @pytest.fixture
@@ -85,3 +85,68 @@ def test_load_config_multi_target_mode(tmp_path: Path):
     assert "plugin" in config_map
     assert config_map["plugin"].scan_paths == ["src/plugin"]
     assert config_map["plugin"].stub_package == "packages/plugin-stubs"
+
+
+def test_load_index_config(tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text(
+        dedent("""
+        [tool.stitcher]
+        scan_paths = ["src"]
+
+        [tool.stitcher.index]
+        persistent_connection = false
+        change_detection = "git"
+        parse_cache_mb = 0
+        check_cache = false
+        sidecar_cache = true
+        mmap_size = 0
+        temp_store = "FILE"
+    """)
+    )
+
+    config = load_index_config(tmp_path)
+
+    assert config.persistent_connection is False
+    assert config.change_detection == "git"
+    assert config.parse_cache_mb == 0
+    assert config.check_cache is False
+    assert config.sidecar_cache is True
+    assert config.pragmas == {"mmap_size": 0, "temp_store": "FILE"}
+
+
+def test_load_index_config_defaults(workspace: Path):
+    config = load_index_config(workspace)
+
+    assert config.persistent_connection is True
+    assert config.change_detection == "scan"
+    assert config.parse_cache_mb == 256
+    assert config.check_cache is True
+    assert config.sidecar_cache is False
+    assert config.pragmas == {}
+
+
+def test_load_index_config_ignores_invalid_values(tmp_path: Path, caplog):
+    (tmp_path / "pyproject.toml").write_text(
+        dedent("""
+        [tool.stitcher]
+        scan_paths = ["src"]
+
+        [tool.stitcher.index]
+        persistent_connection = "false"
+        change_detection = 1
+        parse_cache_mb = "lots"
+        check_cache = 0
+        sidecar_cache = true
+    """)
+    )
+
+    with caplog.at_level("WARNING"):
+        config = load_index_config(tmp_path)
+
+    assert config.persistent_connection is True
+    assert config.change_detection == "scan"
+    assert config.parse_cache_mb == 256
+    assert config.check_cache is True
+    assert config.sidecar_cache is True
+    assert "'lots'" in caplog.text
+    assert "persistent_connection" in caplog.text
@@ -1,3 +1,5 @@
+import subprocess
+
 import pytest
 from stitcher.workspace import Workspace, WorkspaceNotFoundError
 from stitcher.workspace.utils import find_workspace_root
@@ -117,3 +119,38 @@ def test_workspace_namespace_package(tmp_path):
     assert sorted(workspace.get_search_paths()) == sorted(
         [project_root, engine_src, app_src]
     )
+
+
+def test_discover_changed_files_git(tmp_path):
+    factory = WorkspaceFactory(tmp_path).init_git()
+    factory.with_source("src/pkg/a.py", "a = 1")
+    factory.with_source("src/pkg/b.py", "b = 1")
+    factory.with_raw_file(".gitignore", "*.log\n")
+    project_root = factory.build()
+    subprocess.run(["git", "add", "."], cwd=project_root, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=project_root, check=True)
+
+    workspace = Workspace(project_root)
+    head = workspace.get_git_head()
+    assert head is not None
+    assert workspace.discover_changed_files(head) == set()
+
+    (project_root / "src/pkg/a.py").write_text("a = 2")
+    (project_root / "src/pkg/b.py").unlink()
+    (project_root / "src/pkg/c.py").write_text("c = 1")
+    (project_root / "debug.log").write_text("ignored")
+
+    changed = workspace.discover_changed_files(head)
+    assert changed == {"src/pkg/a.py", "src/pkg/b.py", "src/pkg/c.py"}
+    assert workspace.filter_discoverable(changed | {"debug.log"}) == {
+        "src/pkg/a.py",
+        "src/pkg/c.py",
+    }
+
+
+def test_git_helpers_without_repository(tmp_path):
+    WorkspaceFactory(tmp_path).with_source("main.py", "pass").build()
+    workspace = Workspace(tmp_path)
+
+    assert workspace.get_git_head() is None
+    assert workspace.discover_changed_files("HEAD") is None